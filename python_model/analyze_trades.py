@@ -1,12 +1,42 @@
 import pandas as pd
 
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pv
+except ImportError:
+    pv = None
+
+
+def load_log(path):
+    """Load the forward test log, using pyarrow's multithreaded parser if available"""
+    if pv is not None:
+        table = pv.read_csv(
+            path,
+            parse_options=pv.ParseOptions(invalid_row_handler=lambda row: 'skip'),
+            convert_options=pv.ConvertOptions(column_types={'timestamp': pa.timestamp('ns')})
+        )
+        return table.to_pandas()
+    return pd.read_csv(path, parse_dates=['timestamp'], on_bad_lines='skip')
+
+
 # Load forward test log
-df = pd.read_csv('forward_test_log.csv')
+df = load_log('forward_test_log.csv')
+# Low-cardinality string columns -> categoricals (comparisons and counts
+# run on integer codes instead of Python strings)
+df = df.astype({
+    'decision': pd.CategoricalDtype(['TRADE', 'NO_TRADE']),
+    'reason': 'category'
+})
+
+# Filter each decision subset once and reuse below
+dec = df['decision']
+trade_df = df.loc[dec.eq('TRADE')]
+no_trade_df = df.loc[dec.eq('NO_TRADE')]
 
 # Basic stats
 total_signals = len(df)
-trades = len(df[df['decision'] == 'TRADE'])
-no_trades = len(df[df['decision'] == 'NO_TRADE'])
+trades = len(trade_df)
+no_trades = len(no_trade_df)
 trade_pct = (trades / total_signals * 100) if total_signals > 0 else 0
 
 print("=" * 50)
@@ -19,19 +49,22 @@ print()
 
 # Rejection reasons breakdown
 print("TOP REJECTION REASONS:")
-rejection_reasons = df[df['decision'] == 'NO_TRADE']['reason'].value_counts()
+rejection_reasons = no_trade_df['reason'].value_counts()
+rejection_reasons = rejection_reasons[rejection_reasons > 0]  # Drop unused categories
 for reason, count in rejection_reasons.head(10).items():
     pct = (count / no_trades * 100)
     print(f"  {reason}: {count} ({pct:.1f}%)")
 print()
 
-# Time analysis
-df['timestamp'] = pd.to_datetime(df['timestamp'])
-date_groups = df[df['decision'] == 'TRADE'].groupby(df['timestamp'].dt.date).size()
+# Time analysis (group only the TRADE subset by calendar day; floor('D')
+# stays int64 instead of allocating Python date objects, and sorting the
+# small per-day result is cheaper than sorting the group keys)
+trade_days = trade_df['timestamp'].dt.floor('D')
+date_groups = trade_days.groupby(trade_days, sort=False).size().sort_index()
 
 print("ACTUAL TRADES BY DATE:")
 for date, count in date_groups.items():
-    print(f"  {date}: {count} trades")
+    print(f"  {date:%Y-%m-%d}: {count} trades")
 print()
 
 # Weekly estimate
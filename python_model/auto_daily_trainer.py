@@ -17,25 +17,141 @@ Features:
 import pandas as pd
 import numpy as np
 import yfinance as yf
-import pickle
 import json
+import logging
 import os
+import sys
 import shutil
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
 from pathlib import Path
 import warnings
-from sklearn.model_selection import TimeSeriesSplit, cross_val_predict
+from sklearn.model_selection import TimeSeriesSplit
 from sklearn.metrics import f1_score, precision_score, recall_score, accuracy_score, confusion_matrix
+import xgboost as xgb
 from xgboost import XGBClassifier
 
 from features import compute_indicators, get_feature_columns
-from calibration import ModelCalibrator
+from calibration import ModelCalibrator, fit_all
+from model_io import migrate_pickled_model, save_model
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pq = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
 
 warnings.filterwarnings('ignore')
 
 RANDOM_SEED = 42
 np.random.seed(RANDOM_SEED)
 
+# Incremental feature cache (cache/features_{tf}.parquet)
+FEATURE_CACHE_VERSION = '1'
+FEATURE_WARMUP_BARS = 1000  # History needed for recursive indicators (EMA/ADX/TSI) to converge
+FEATURE_REFRESH_BARS = 5    # Trailing cached bars to recompute (last candle may have been partial)
+
+# Boosting-round selection: CV early stopping waits long enough for the
+# ensemble to move the logit by EARLY_STOPPING_LOGIT (small learning rates
+# barely change logloss per round), and never keeps fewer than
+# MIN_BOOST_ROUNDS rounds
+EARLY_STOPPING_LOGIT = 0.5
+MIN_BOOST_ROUNDS = 20
+
+# Models whose test probabilities vary less than this are constant
+# predictors and are never deployed
+MIN_PROBA_STD = 1e-4
+
+# Logging: one long-lived file handler instead of an open()/close() per message
+LOG_FILE = Path(__file__).parent / 'daily_training.log'
+logger = logging.getLogger('autotrainer')
+if not logger.handlers:
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    for handler in (logging.FileHandler(LOG_FILE, encoding='utf-8'),
+                    logging.StreamHandler(sys.stdout)):
+        handler.setFormatter(logging.Formatter('[%(asctime)s] %(message)s', datefmt='%Y-%m-%d %H:%M:%S'))
+        logger.addHandler(handler)
+
+
+def _read_json(path):
+    """Read a JSON file (orjson's C parser when available)"""
+    if orjson is not None:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+def _write_json(obj, path):
+    """Write a JSON file with 2-space indent (orjson when available)"""
+    if orjson is not None:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2))
+    else:
+        with open(path, 'w') as f:
+            json.dump(obj, f, indent=2)
+
+
+if njit is not None:
+    @njit(cache=True)
+    def _sorted_quantile(sorted_col, q):
+        """Linear-interpolated quantile of a sorted column (matches np.quantile)"""
+        pos = q * (sorted_col.shape[0] - 1)
+        k = int(np.floor(pos))
+        k_next = min(k + 1, sorted_col.shape[0] - 1)
+        return sorted_col[k] + (sorted_col[k_next] - sorted_col[k]) * (pos - k)
+
+    @njit(parallel=True, cache=True)
+    def _clip_outliers_numba(arr, q_lo, q_hi):
+        """Per-column quantile + clip in one fused pass, parallel over columns"""
+        n_rows, n_cols = arr.shape
+        out = np.empty_like(arr)
+        for j in prange(n_cols):
+            sorted_col = np.sort(arr[:, j])
+            lo = _sorted_quantile(sorted_col, q_lo)
+            hi = _sorted_quantile(sorted_col, q_hi)
+            for i in range(n_rows):
+                v = arr[i, j]
+                out[i, j] = lo if v < lo else (hi if v > hi else v)
+        return out
+
+
+def _clip_outliers(arr, q_lo=0.001, q_hi=0.999):
+    """Clip each column of a finite 2-D array to its [q_lo, q_hi] quantiles"""
+    if arr.shape[0] == 0:
+        return arr
+    if njit is not None:
+        return _clip_outliers_numba(arr, q_lo, q_hi)
+    q01, q99 = np.nanquantile(arr, [q_lo, q_hi], axis=0)
+    np.clip(arr, q01, q99, out=arr)
+    return arr
+
+
+def _has_cuda():
+    """True if XGBoost (>= 2.0) is built with CUDA and a GPU is actually usable"""
+    try:
+        if int(xgb.__version__.split('.')[0]) < 2:
+            return False
+        if not xgb.build_info().get('USE_CUDA'):
+            return False
+        # CUDA-enabled wheels are common on CPU-only hosts: probe with a tiny fit
+        probe = xgb.DMatrix(np.zeros((2, 1), dtype=np.float32), label=[0, 1])
+        xgb.train({'device': 'cuda', 'tree_method': 'hist'}, probe, num_boost_round=1)
+        return True
+    except Exception:
+        return False
+
 
 class AutoTrainer:
     """Continuous learning system for daily model updates"""
@@ -44,37 +160,46 @@ class AutoTrainer:
         '15m': {'period': '59d', 'interval': '15m'},
         '30m': {'period': '59d', 'interval': '30m'},
         '1h':  {'period': '729d', 'interval': '1h'},
-        '4h':  {'period': '729d', 'interval': '1h'},
+        '4h':  {'period': '729d', 'interval': '1h', 'resample': '4h'},
         '1d':  {'period': 'max',  'interval': '1d'}
     }
     
-    def __init__(self, config_path='config.json'):
-        """Initialize auto-trainer"""
+    def __init__(self, config_path='config.json', config=None, device=None):
+        """
+        Initialize auto-trainer.
+        
+        config and device, when given, are used as-is instead of reading
+        config_path and probing for a GPU (training workers get the
+        parent's).
+        """
         self.base_dir = Path(__file__).parent
-        self.config = self._load_config(config_path)
+        self.config_path = config_path
+        self.config = config if config is not None else self._load_config(config_path)
         self.backup_dir = self.base_dir / 'model_backups'
-        self.log_file = self.base_dir / 'daily_training.log'
+        self.cache_dir = self.base_dir / 'cache'
+        self.log_file = LOG_FILE
         self.backup_dir.mkdir(exist_ok=True)
+        self.cache_dir.mkdir(exist_ok=True)
         
         # Performance thresholds for deployment
         self.min_f1_improvement = 0.01  # At least 1% F1 improvement
         self.max_f1_regression = -0.02  # Don't allow 2%+ drop
         
+        # XGBoost threads per fit (capped when timeframes train in parallel)
+        self.n_jobs = -1
+        
+        # Train on GPU when one is available (same hist algorithm)
+        if device is None:
+            device = 'cuda' if _has_cuda() else 'cpu'
+        self.device = device
+        
     def _load_config(self, path):
         """Load configuration"""
-        with open(self.base_dir / path, 'r') as f:
-            return json.load(f)
+        return _read_json(self.base_dir / path)
     
     def _log(self, message):
         """Log message to file and print"""
-        timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        log_msg = f"[{timestamp}] {message}"
-        print(log_msg)
-        try:
-            with open(self.log_file, 'a', encoding='utf-8') as f:
-                f.write(log_msg + '\n')
-        except Exception as e:
-            print(f"Log write error: {e}")
+        logger.info(message)
     
     def backup_current_models(self):
         """Create backup of current models"""
@@ -82,21 +207,48 @@ class AutoTrainer:
         backup_subdir = self.backup_dir / f"backup_{timestamp}"
         backup_subdir.mkdir(exist_ok=True)
         
+        artifacts = set()
         for tf in self.TIMEFRAMES.keys():
-            model_file = self.base_dir / f'xgb_{tf}.pkl'
-            calib_file = self.base_dir / f'calibrator_{tf}.pkl'
-            meta_file = self.base_dir / f'metadata_{tf}.json'
-            
-            if model_file.exists():
-                shutil.copy(model_file, backup_subdir / f'xgb_{tf}.pkl')
-            if calib_file.exists():
-                shutil.copy(calib_file, backup_subdir / f'calibrator_{tf}.pkl')
-            if meta_file.exists():
-                shutil.copy(meta_file, backup_subdir / f'metadata_{tf}.json')
+            artifacts.update({
+                f'xgb_{tf}.ubj', f'xgb_{tf}.pkl',
+                f'calibrator_{tf}.npz', f'calibrator_{tf}.pkl',
+                f'metadata_{tf}.json'
+            })
+        
+        # One directory read instead of an exists() stat per artifact
+        with os.scandir(self.base_dir) as entries:
+            for entry in entries:
+                if entry.name in artifacts and entry.is_file():
+                    self._backup_file(entry.path, backup_subdir / entry.name)
         
         self._log(f"✅ Backed up models to {backup_subdir}")
         return backup_subdir
     
+    def migrate_legacy_models(self):
+        """Convert pickled models still in use to native UBJSON (after backup)"""
+        for tf in self.TIMEFRAMES.keys():
+            try:
+                path = migrate_pickled_model(self.base_dir, tf)
+            except Exception as e:
+                self._log(f"  ⚠️ Failed to migrate xgb_{tf}.pkl to UBJSON: {e}")
+                continue
+            if path is not None:
+                self._log(f"  ✓ Migrated xgb_{tf}.pkl to {path.name}")
+    
+    def _backup_file(self, src, dst):
+        """
+        Hardlink src into the backup (no bytes copied). Safe because artifacts
+        are replaced atomically (new inode), never rewritten in place.
+        Falls back to a copy on Windows or when linking fails (cross-device).
+        """
+        if os.name != 'nt':
+            try:
+                os.link(src, dst)
+                return
+            except OSError:
+                pass
+        shutil.copy(src, dst)
+    
     def fetch_data(self, timeframe):
         """Fetch latest data from Yahoo Finance"""
         try:
@@ -112,61 +264,235 @@ class AutoTrainer:
             if isinstance(df.columns, pd.MultiIndex):
                 df.columns = df.columns.get_level_values(0)
             
-            return df.sort_index()
+            df = self._resample(df.sort_index(), timeframe)
+            if len(df) < 50:
+                return None
+            
+            return df
         except Exception as e:
             self._log(f"❌ Error fetching {timeframe} data: {e}")
             return None
     
-    def prepare_data(self, df):
-        """Prepare features and target"""
+    def _resample(self, df, timeframe):
+        """Resample OHLCV data for derived timeframes (e.g., 1h → 4h)"""
+        resample = self.TIMEFRAMES[timeframe].get('resample')
+        if not resample:
+            return df
+        logic = {'Open': 'first', 'High': 'max', 'Low': 'min', 'Close': 'last', 'Volume': 'sum'}
+        logic = {k: v for k, v in logic.items() if k in df.columns}
+        return df.resample(resample).agg(logic).dropna()
+    
+    def _prefetch_all(self):
+        """
+        Fetch data for every timeframe with one download per unique
+        (period, interval) pair. Derived timeframes (4h) are resampled
+        from their base series instead of being downloaded again.
+        
+        Returns:
+            dict of {timeframe: DataFrame or None}
+        """
+        groups = {}
+        for tf, cfg in self.TIMEFRAMES.items():
+            groups.setdefault((cfg['period'], cfg['interval']), []).append(tf)
+        
+        def download(period, interval):
+            try:
+                df = yf.download('GC=F', period=period, interval=interval,
+                                 progress=False, threads=True)
+                if df is None or df.empty:
+                    return None
+                if isinstance(df.columns, pd.MultiIndex):
+                    df.columns = df.columns.get_level_values(0)
+                return df.sort_index()
+            except Exception as e:
+                self._log(f"❌ Error fetching {interval} data: {e}")
+                return None
+        
+        # Downloads are network-bound, so overlap them on threads
+        with ThreadPoolExecutor(max_workers=len(groups)) as pool:
+            downloads = {key: pool.submit(download, *key) for key in groups}
+            raw = {key: future.result() for key, future in downloads.items()}
+        
+        data = {}
+        for key, tfs in groups.items():
+            for tf in tfs:
+                df = raw[key]
+                if df is not None:
+                    df = self._resample(df, tf)
+                data[tf] = df if df is not None and len(df) >= 50 else None
+        
+        return data
+    
+    def _feature_cache_columns(self):
+        """Columns persisted in the feature cache"""
+        return get_feature_columns() + ['Close']
+    
+    def _load_feature_cache(self, timeframe):
+        """Load cached indicator frame, or None if missing/stale/unsupported"""
+        cache_file = self.cache_dir / f'features_{timeframe}.parquet'
+        if pq is None or not cache_file.exists():
+            return None
+        try:
+            table = pq.read_table(cache_file)
+            meta = table.schema.metadata or {}
+            if meta.get(b'feature_cache_version', b'').decode() != FEATURE_CACHE_VERSION:
+                return None
+            if meta.get(b'feature_columns', b'').decode() != ','.join(self._feature_cache_columns()):
+                return None
+            return table.to_pandas()
+        except Exception as e:
+            self._log(f"  ⚠️ Ignoring unreadable feature cache for {timeframe}: {e}")
+            return None
+    
+    def _save_feature_cache(self, frame, timeframe):
+        """Persist indicator frame with a schema version in the Parquet metadata"""
+        if pq is None:
+            return
+        cache_file = self.cache_dir / f'features_{timeframe}.parquet'
+        try:
+            table = pa.Table.from_pandas(frame)
+            table = table.replace_schema_metadata({
+                **(table.schema.metadata or {}),
+                b'feature_cache_version': FEATURE_CACHE_VERSION.encode(),
+                b'feature_columns': ','.join(self._feature_cache_columns()).encode()
+            })
+            tmp_file = cache_file.with_name(cache_file.name + '.tmp')
+            pq.write_table(table, tmp_file, compression='zstd')
+            os.replace(tmp_file, cache_file)
+        except Exception as e:
+            self._log(f"  ⚠️ Failed to write feature cache for {timeframe}: {e}")
+    
+    def compute_features(self, df, timeframe=None):
+        """
+        compute_indicators() with an incremental Parquet cache.
+        
+        Cached rows inside the current data window are reused; indicators are
+        only recomputed for the bars after the cache (plus a few trailing
+        cached bars), using FEATURE_WARMUP_BARS of extra history.
+        
+        The result is not identical to a full recompute of `df`. Reused rows
+        keep the values computed from the earlier fetch window, so near the
+        start of `df` they (and rows the full recompute would drop as
+        warm-up) differ by how far the recursive indicators (EMAs, ADX,
+        TSI) had converged. From FEATURE_WARMUP_BARS bars into `df` onwards
+        both agree to within that convergence error. If the cached closes
+        no longer match `df` (revised history), the cache is discarded.
+        """
+        columns = self._feature_cache_columns()
+        cached = self._load_feature_cache(timeframe) if timeframe else None
+        
+        result = None
+        if cached is not None and len(cached) > FEATURE_REFRESH_BARS:
+            cutoff = cached.index[-FEATURE_REFRESH_BARS]
+            cutoff_pos = df.index.get_indexer([cutoff])[0]
+            # Only usable if the cache joins the new data with enough warm-up history
+            if cutoff_pos >= FEATURE_WARMUP_BARS:
+                body = cached[(cached.index >= df.index[0]) & (cached.index < cutoff)]
+                source_close = df['Close'].reindex(body.index).to_numpy(dtype=np.float64)
+                if np.allclose(body['Close'].to_numpy(dtype=np.float64), source_close, rtol=1e-9, atol=0):
+                    tail = compute_indicators(df.iloc[cutoff_pos - FEATURE_WARMUP_BARS:])
+                    tail = tail.loc[tail.index >= cutoff, [c for c in columns if c in tail.columns]]
+                    result = pd.concat([body, tail])
+                else:
+                    self._log(f"  ⚠️ Source data changed under the {timeframe} feature cache, recomputing")
+        
+        if result is None:
+            full = compute_indicators(df)
+            result = full[[c for c in columns if c in full.columns]]
+        
+        if timeframe:
+            self._save_feature_cache(result, timeframe)
+        return result
+    
+    def prepare_data(self, df, timeframe=None):
+        """Prepare features and target (timeframe enables the feature cache)"""
         try:
-            df = compute_indicators(df)
+            df = self.compute_features(df, timeframe)
             df['Direction'] = (df['Close'].shift(-1) > df['Close']).astype(int)
             
             features = get_feature_columns()
             features = [c for c in features if c in df.columns]
             
-            data = df[features + ['Direction']].dropna()
-            
-            # Clean outliers
-            for col in features:
-                if col in data.columns:
-                    data[col] = data[col].replace([np.inf, -np.inf], np.nan)
-                    data = data.dropna()
-                    if data[col].std() > 0:
-                        q99 = data[col].quantile(0.999)
-                        q01 = data[col].quantile(0.001)
-                        data[col] = data[col].clip(q01, q99)
+            # Clean outliers on one contiguous float32 block: drop rows with
+            # NaN/inf, then clip every column to its [0.1%, 99.9%] quantiles
+            arr = np.ascontiguousarray(df[features].to_numpy(dtype=np.float32))
+            mask = np.isfinite(arr).all(axis=1)
+            arr = _clip_outliers(arr[mask])
             
+            data = pd.DataFrame(arr, columns=features, index=df.index[mask])
+            data['Direction'] = df['Direction'].to_numpy()[mask]
+
             return data, features
         except Exception as e:
             self._log(f"❌ Error preparing data: {e}")
             return None, None
     
+    def select_n_estimators(self, X_train, y_train, best_params, n_splits=5):
+        """
+        Pick the number of boosting rounds with time-series CV and early
+        stopping, capped at best_params['n_estimators'] and floored at
+        MIN_BOOST_ROUNDS. Patience scales with 1 / learning_rate.
+        """
+        max_rounds = int(best_params.get('n_estimators', 100))
+        learning_rate = float(best_params.get('learning_rate', 0.3))
+        patience = max(20, int(np.ceil(EARLY_STOPPING_LOGIT / learning_rate)))
+        params = {k: v for k, v in best_params.items() if k != 'n_estimators'}
+        params.update({
+            'objective': 'binary:logistic',
+            'eval_metric': 'logloss',
+            'tree_method': 'hist',
+            'seed': RANDOM_SEED,
+            'nthread': self.n_jobs
+        })
+        if self.device != 'cpu':
+            params['device'] = self.device
+        
+        cv_results = xgb.cv(
+            params,
+            xgb.DMatrix(X_train, label=y_train),
+            num_boost_round=max_rounds,
+            folds=list(TimeSeriesSplit(n_splits=n_splits).split(X_train)),
+            early_stopping_rounds=patience,
+            as_pandas=False,
+            seed=RANDOM_SEED
+        )
+        return max(len(cv_results['test-logloss-mean']), min(MIN_BOOST_ROUNDS, max_rounds))
+    
     def train_model(self, X_train, y_train, best_params):
-        """Train new model with best parameters"""
+        """Train new model with best parameters (boosting rounds chosen by CV)"""
+        n_estimators = self.select_n_estimators(X_train, y_train, best_params)
+        self._log(f"  ✓ CV selected {n_estimators}/{best_params.get('n_estimators', 100)} boosting rounds")
+        
         model = XGBClassifier(
-            **best_params,
+            **{**best_params, 'n_estimators': n_estimators},
             eval_metric='logloss',
             use_label_encoder=False,
             random_state=RANDOM_SEED,
-            n_jobs=-1,
-            tree_method='hist'
+            n_jobs=self.n_jobs,
+            tree_method='hist',
+            **({'device': self.device} if self.device != 'cpu' else {})
         )
         
         model.fit(X_train, y_train, verbose=False)
+        if self.device != 'cpu':
+            # Deployed models are served on CPU
+            model.get_booster().set_param({'device': 'cpu'})
         return model
     
     def evaluate_model(self, model, X_test, y_test):
         """Evaluate model and return comprehensive metrics"""
-        y_pred = model.predict(X_test)
-        y_proba = model.predict_proba(X_test)[:, 1]
+        # Single pass over the ensemble: predict on the booster directly
+        # (skips sklearn's input checks) and threshold for class labels
+        booster = model.get_booster()
+        y_proba = booster.predict(xgb.DMatrix(X_test, feature_names=booster.feature_names))
+        y_pred = (y_proba >= 0.5).astype(np.int8)
         
         metrics = {
             'accuracy': float(accuracy_score(y_test, y_pred)),
             'f1': float(f1_score(y_test, y_pred, zero_division=0)),
             'precision': float(precision_score(y_test, y_pred, zero_division=0)),
-            'recall': float(recall_score(y_test, y_pred, zero_division=0))
+            'recall': float(recall_score(y_test, y_pred, zero_division=0)),
+            'proba_std': float(np.std(y_proba))
         }
         
         return metrics, y_proba
@@ -179,19 +505,22 @@ class AutoTrainer:
             return None
         
         try:
-            with open(meta_file, 'r') as f:
-                data = json.load(f)
-                return {
-                    'f1': float(data.get('f1', 0)),
-                    'accuracy': float(data.get('accuracy', 0)),
-                    'precision': float(data.get('precision', 0)),
-                    'recall': float(data.get('recall', 0))
-                }
+            data = _read_json(meta_file)
+            return {
+                'f1': float(data.get('f1', 0)),
+                'accuracy': float(data.get('accuracy', 0)),
+                'precision': float(data.get('precision', 0)),
+                'recall': float(data.get('recall', 0))
+            }
         except:
             return None
     
     def should_deploy_model(self, old_metrics, new_metrics, timeframe):
         """Determine if new model should be deployed"""
+        if new_metrics.get('proba_std', 0.0) < MIN_PROBA_STD:
+            self._log(f"  ❌ {timeframe}: New model predicts a constant probability, not deploying")
+            return False
+        
         if old_metrics is None:
             self._log(f"  ✅ {timeframe}: No old model, deploying new one")
             return True
@@ -210,33 +539,42 @@ class AutoTrainer:
             self._log(f"  ⚠️  {timeframe}: Change {improvement:.4f} F1 (≤{self.min_f1_improvement}), keeping old")
             return False
     
-    def train_and_evaluate(self, timeframe, best_params):
-        """Full train and evaluate pipeline"""
+    def train_and_evaluate(self, timeframe, best_params, df=None, fit_calibrator=True):
+        """
+        Full train and evaluate pipeline (df: optional pre-fetched OHLCV data).
+        
+        With fit_calibrator=False the returned calibrator is left unfitted and
+        its (probs, labels) are returned as 'calibration_data', so several
+        timeframes can be calibrated together via calibration.fit_all().
+        """
         self._log(f"\n📊 Training {timeframe}...")
         
-        # 1. Fetch data
-        df = self.fetch_data(timeframe)
+        # 1. Fetch data (unless pre-fetched by run_daily_training)
+        if df is None:
+            df = self.fetch_data(timeframe)
         if df is None:
             self._log(f"  ❌ Failed to fetch data")
             return None
         
         # 2. Prepare data
-        data, features = self.prepare_data(df)
+        data, features = self.prepare_data(df, timeframe)
         if data is None or len(data) < 100:
             self._log(f"  ❌ Insufficient data")
             return None
         
         self._log(f"  ✓ Prepared {len(data)} samples")
         
-        # 3. Split (85/15)
+        # 3. Split (85/15) on a contiguous float32 matrix, which is what
+        #    XGBoost's hist builder consumes (avoids an internal copy)
         split_idx = int(len(data) * 0.85)
-        X_train = data[features].iloc[:split_idx]
-        y_train = data['Direction'].iloc[:split_idx]
-        X_test = data[features].iloc[split_idx:]
-        y_test = data['Direction'].iloc[split_idx:]
+        X = np.ascontiguousarray(data[features].to_numpy(dtype=np.float32))
+        y = data['Direction'].to_numpy(dtype=np.int8)
+        X_train, X_test = X[:split_idx], X[split_idx:]
+        y_train, y_test = y[:split_idx], y[split_idx:]
         
-        # 4. Train model
+        # 4. Train model (keep feature names for inference-time validation)
         new_model = self.train_model(X_train, y_train, best_params)
+        new_model.get_booster().feature_names = features
         self._log(f"  ✓ Model trained")
         
         # 5. Evaluate
@@ -253,30 +591,30 @@ class AutoTrainer:
         
         # 8. Train calibrator
         calibrator = ModelCalibrator(timeframe)
-        calibrator.fit(probs, y_test.values)
-        
-        return {
+        results = {
             'model': new_model,
             'calibrator': calibrator,
             'metrics': new_metrics,
             'should_deploy': should_deploy,
             'samples': len(data)
         }
+        if fit_calibrator:
+            calibrator.fit(probs, y_test)
+        else:
+            results['calibration_data'] = (probs, y_test)
+        return results
     
     def save_models(self, results, timeframe):
         """Save model, calibrator, and metadata"""
         if not results['should_deploy']:
             return
         
-        model_file = self.base_dir / f'xgb_{timeframe}.pkl'
-        calib_file = self.base_dir / f'calibrator_{timeframe}.pkl'
         meta_file = self.base_dir / f'metadata_{timeframe}.json'
         
-        with open(model_file, 'wb') as f:
-            pickle.dump(results['model'], f)
-        
-        with open(calib_file, 'wb') as f:
-            pickle.dump(results['calibrator'], f)
+        # Native XGBoost format; the calibrator writes its own knots file
+        # (temp file + swap, so hardlinked backups keep the previous version)
+        save_model(results['model'], self.base_dir, timeframe)
+        results['calibrator'].save(str(self.base_dir))
         
         metadata = {
             **results['metrics'],
@@ -285,8 +623,9 @@ class AutoTrainer:
             'version': '3.0'
         }
         
-        with open(meta_file, 'w') as f:
-            json.dump(metadata, f, indent=2)
+        tmp_file = meta_file.with_name(meta_file.name + '.tmp')
+        _write_json(metadata, tmp_file)
+        os.replace(tmp_file, meta_file)
         
         self._log(f"  💾 Saved new {timeframe} model")
     
@@ -296,24 +635,68 @@ class AutoTrainer:
         self._log("🤖 AUTO-TRAINER: Daily Model Update Starting")
         self._log("="*70)
         
-        # Backup current models
+        # Backup current models, then convert any legacy pickles
         self.backup_current_models()
+        self.migrate_legacy_models()
         
         # Load best params from previous training
-        with open(self.base_dir / 'best_params.json', 'r') as f:
-            all_params = json.load(f)
+        all_params = _read_json(self.base_dir / 'best_params.json')
         
         deployed_count = 0
         results_summary = {}
         
+        jobs = {}
         for timeframe in self.TIMEFRAMES.keys():
+            best_params = all_params.get(timeframe, {})
+            if not best_params:
+                self._log(f"❌ No params found for {timeframe}")
+                continue
+            jobs[timeframe] = best_params
+        
+        # Fetch all timeframes up front (one download per interval)
+        prefetched = self._prefetch_all() if jobs else {}
+        
+        # Timeframes are independent: train them in parallel worker processes,
+        # splitting the available cores so XGBoost fits don't oversubscribe.
+        trained = {}
+        if jobs:
+            n_jobs = max(1, (os.cpu_count() or 1) // len(jobs))
+            with ProcessPoolExecutor(max_workers=len(jobs)) as pool:
+                futures = {
+                    pool.submit(
+                        _train_timeframe, self.config_path, timeframe, best_params,
+                        n_jobs, prefetched.get(timeframe), self.config, self.device
+                    ): timeframe
+                    for timeframe, best_params in jobs.items()
+                }
+                for future in as_completed(futures):
+                    timeframe = futures[future]
+                    try:
+                        trained[timeframe] = future.result()
+                    except Exception as e:
+                        self._log(f"❌ Error training {timeframe}: {e}")
+                        results_summary[timeframe] = 'ERROR ❌'
+        
+        # Calibrators are independent too: fit them together on threads
+        # (a failure only drops its own timeframe)
+        calibrating = {tf: results for tf, results in trained.items() if results}
+        fitted = fit_all(
+            ((results['calibrator'], *results.pop('calibration_data'))
+             for results in calibrating.values()),
+            return_exceptions=True
+        )
+        for timeframe, outcome in zip(calibrating, fitted):
+            if isinstance(outcome, Exception):
+                self._log(f"❌ Error fitting {timeframe} calibrator: {outcome}")
+                del trained[timeframe]
+                results_summary[timeframe] = 'ERROR ❌'
+        
+        # Deploy from the parent process, in timeframe order
+        for timeframe in self.TIMEFRAMES.keys():
+            if timeframe not in trained:
+                continue
             try:
-                best_params = all_params.get(timeframe, {})
-                if not best_params:
-                    self._log(f"❌ No params found for {timeframe}")
-                    continue
-                
-                results = self.train_and_evaluate(timeframe, best_params)
+                results = trained[timeframe]
                 
                 if results and results['should_deploy']:
                     self.save_models(results, timeframe)
@@ -325,7 +708,7 @@ class AutoTrainer:
                     results_summary[timeframe] = 'FAILED ❌'
                     
             except Exception as e:
-                self._log(f"❌ Error training {timeframe}: {e}")
+                self._log(f"❌ Error saving {timeframe}: {e}")
                 results_summary[timeframe] = 'ERROR ❌'
         
         # Summary
@@ -341,6 +724,20 @@ class AutoTrainer:
         return deployed_count > 0
 
 
+def _train_timeframe(config_path, timeframe, best_params, n_jobs, df=None,
+                     config=None, device=None):
+    """
+    Process-pool worker: train and evaluate a single timeframe.
+    
+    config and device come from the parent, so workers neither re-read the
+    config file nor repeat the CUDA probe.
+    """
+    trainer = AutoTrainer(config_path, config=config, device=device)
+    trainer.n_jobs = n_jobs
+    # Calibrators are fitted in the parent with calibration.fit_all()
+    return trainer.train_and_evaluate(timeframe, best_params, df, fit_calibrator=False)
+
+
 def main():
     """Run daily auto-trainer"""
     trainer = AutoTrainer()
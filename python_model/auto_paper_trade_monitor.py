@@ -10,9 +10,11 @@ Features:
 4. Runs all steps concurrently and logs output
 """
 
+import asyncio
 import subprocess
 import time
 import threading
+import logging
 import sys
 import os
 from datetime import datetime
@@ -36,22 +38,21 @@ PAPER_TRADE_CMD = [
 DRIFT_MONITOR_CMD = [sys.executable, str(BASE_DIR / "monitor_calibration_drift.py")]
 INTEGRITY_CHECK_CMD = [sys.executable, str(BASE_DIR / "verify_system_integrity.py")]
 
-# Logging
+# Logging (stdlib handlers are thread-safe and keep the log file open)
 LOG_FILE = BASE_DIR / "auto_monitor.log"
-log_lock = threading.Lock()
+logging.addLevelName(25, "OUTPUT")  # Captured subprocess output
+logger = logging.getLogger("auto_monitor")
+logger.setLevel(logging.INFO)
+logger.propagate = False
+for _handler in (logging.FileHandler(LOG_FILE, encoding='utf-8'),
+                 logging.StreamHandler(sys.stdout)):
+    _handler.setFormatter(logging.Formatter('[%(asctime)s] [%(levelname)s] %(message)s',
+                                            datefmt='%Y-%m-%d %H:%M:%S'))
+    logger.addHandler(_handler)
 
 def log(message, level="INFO"):
     """Thread-safe logging to both console and file"""
-    timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-    log_message = f"[{timestamp}] [{level}] {message}"
-    
-    with log_lock:
-        print(log_message)
-        try:
-            with open(LOG_FILE, 'a', encoding='utf-8') as f:
-                f.write(log_message + '\n')
-        except Exception as e:
-            print(f"[ERROR] Failed to write to log: {e}")
+    logger.log(logging.getLevelName(level), message)
 
 def run_command(cmd, description, capture_output=False):
     """
@@ -91,7 +92,7 @@ def run_command(cmd, description, capture_output=False):
         log(f"Failed to start {description}: {e}", "ERROR")
         return None
 
-def run_command_and_log_output(cmd, description):
+async def run_command_and_log_output(cmd, description):
     """
     Run a command, capture output, and log it.
     Used for drift monitoring and integrity checks.
@@ -99,15 +100,16 @@ def run_command_and_log_output(cmd, description):
     try:
         log(f"Running: {description}")
         
-        process = subprocess.Popen(
-            cmd,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
+        process = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
             cwd=str(BASE_DIR)
         )
         
-        stdout, stderr = process.communicate()
+        stdout, stderr = await process.communicate()
+        stdout = stdout.decode('utf-8', errors='replace')
+        stderr = stderr.decode('utf-8', errors='replace')
         
         if process.returncode == 0:
             log(f"Completed: {description}")
@@ -127,9 +129,9 @@ def run_command_and_log_output(cmd, description):
         log(f"Exception running {description}: {e}", "ERROR")
         return False
 
-def periodic_task(cmd, description, interval, initial_delay=0):
+async def periodic_task(cmd, description, interval, initial_delay=0):
     """
-    Run a command periodically in a separate thread.
+    Run a command periodically on the shared event loop.
     
     Args:
         cmd: Command to run
@@ -139,15 +141,91 @@ def periodic_task(cmd, description, interval, initial_delay=0):
     """
     if initial_delay > 0:
         log(f"{description} will start in {initial_delay} seconds...")
-        time.sleep(initial_delay)
+        await asyncio.sleep(initial_delay)
     
     cycle = 0
     while True:
         cycle += 1
         log(f"{description} - Cycle {cycle}")
-        run_command_and_log_output(cmd, description)
+        await run_command_and_log_output(cmd, description)
         log(f"Next {description} check in {interval} seconds...")
-        time.sleep(interval)
+        await asyncio.sleep(interval)
+
+def report_task_exit(task):
+    """Done-callback for monitoring tasks: they only stop when cancelled"""
+    if task.cancelled():
+        return
+    error = task.exception()
+    log(f"{task.get_name()} task died unexpectedly: {error!r}", "WARNING")
+
+async def paper_trade_watchdog(paper_trade_process):
+    """
+    Wait for the paper trading process to finish without polling.
+    
+    A daemon thread blocks in Popen.wait() (the kernel wakes it when the
+    child exits) and hands the return code back to the event loop. Being a
+    daemon, it never holds up shutdown on Ctrl+C.
+    
+    Returns:
+        Paper trading process return code
+    """
+    loop = asyncio.get_running_loop()
+    exited = loop.create_future()
+    
+    def resolve(return_code):
+        if not exited.done():
+            exited.set_result(return_code)
+    
+    def wait_for_exit():
+        return_code = paper_trade_process.wait()
+        try:
+            loop.call_soon_threadsafe(resolve, return_code)
+        except RuntimeError:
+            pass  # Event loop already closed
+    
+    threading.Thread(target=wait_for_exit, daemon=True, name="PaperTradeWaiter").start()
+    return await exited
+
+async def run_monitoring(paper_trade_process):
+    """Run drift and integrity monitors on one event loop until paper trading ends"""
+    log("Starting calibration drift monitoring task...")
+    drift_task = asyncio.create_task(
+        periodic_task(DRIFT_MONITOR_CMD, "Calibration drift monitor", DRIFT_CHECK_INTERVAL, 60),
+        name="DriftMonitor"
+    )
+    log("Drift monitoring task started")
+    
+    log("Starting system integrity verification task...")
+    integrity_task = asyncio.create_task(
+        periodic_task(INTEGRITY_CHECK_CMD, "System integrity check", INTEGRITY_CHECK_INTERVAL, 120),
+        name="IntegrityChecker"
+    )
+    log("Integrity check task started")
+    
+    print()
+    print("=" * 70)
+    print("MONITORING ACTIVE")
+    print("=" * 70)
+    print("Paper trading: Running in background")
+    print("Drift monitoring: Every 30 minutes")
+    print("Integrity checks: Every 60 minutes")
+    print("Log file: auto_monitor.log")
+    print()
+    print("Press Ctrl+C to stop all processes")
+    print("=" * 70)
+    print()
+    
+    log("All monitoring tasks started. Waiting for paper trading to complete...")
+    
+    tasks = [drift_task, integrity_task]
+    for task in tasks:
+        task.add_done_callback(report_task_exit)
+    try:
+        return await paper_trade_watchdog(paper_trade_process)
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
 
 def main():
     """Main function to orchestrate paper trading and monitoring"""
@@ -210,63 +288,13 @@ def main():
     
     log("Paper trading started successfully")
     
-    # 2. Start calibration drift monitoring thread
-    log("Starting calibration drift monitoring thread...")
-    drift_thread = threading.Thread(
-        target=periodic_task,
-        args=(DRIFT_MONITOR_CMD, "Calibration drift monitor", DRIFT_CHECK_INTERVAL, 60),
-        daemon=True,
-        name="DriftMonitor"
-    )
-    drift_thread.start()
-    log("Drift monitoring thread started")
-    
-    # 3. Start system integrity verification thread
-    log("Starting system integrity verification thread...")
-    integrity_thread = threading.Thread(
-        target=periodic_task,
-        args=(INTEGRITY_CHECK_CMD, "System integrity check", INTEGRITY_CHECK_INTERVAL, 120),
-        daemon=True,
-        name="IntegrityChecker"
-    )
-    integrity_thread.start()
-    log("Integrity check thread started")
-    
-    print()
-    print("=" * 70)
-    print("MONITORING ACTIVE")
-    print("=" * 70)
-    print("Paper trading: Running in background")
-    print("Drift monitoring: Every 30 minutes")
-    print("Integrity checks: Every 60 minutes")
-    print("Log file: auto_monitor.log")
-    print()
-    print("Press Ctrl+C to stop all processes")
-    print("=" * 70)
-    print()
-    
-    log("All monitoring threads started. Waiting for paper trading to complete...")
-    
-    # Wait for paper trading process to finish
+    # 2-3. Run drift monitoring and integrity checks until paper trading exits
     try:
-        while True:
-            # Check if paper trading is still running
-            if paper_trade_process.poll() is not None:
-                return_code = paper_trade_process.returncode
-                if return_code == 0:
-                    log("Paper trading session completed successfully")
-                else:
-                    log(f"Paper trading session ended with code {return_code}", "WARNING")
-                break
-            
-            # Check if monitoring threads are still alive
-            if not drift_thread.is_alive():
-                log("Drift monitoring thread died unexpectedly", "WARNING")
-            
-            if not integrity_thread.is_alive():
-                log("Integrity check thread died unexpectedly", "WARNING")
-            
-            time.sleep(10)  # Check every 10 seconds
+        return_code = asyncio.run(run_monitoring(paper_trade_process))
+        if return_code == 0:
+            log("Paper trading session completed successfully")
+        else:
+            log(f"Paper trading session ended with code {return_code}", "WARNING")
         
         log("=" * 70)
         log("Automated Paper Trading Monitor Completed")
@@ -13,21 +13,214 @@ Usage:
 
 """
 
+import hashlib
+import heapq
 import pandas as pd
 import numpy as np
 import argparse
 from datetime import datetime
-from pathlib import Path
 
 from live_predictor import LivePredictor
-from forward_test import ForwardTester
-from data_manager import DataManager
+from data_manager import DataManager, load_price_csv
+from backtest_kernels import simulate_exit
+from disk_cache import load_or_compute
+from joblib import Parallel, delayed
+
+try:
+    import pyarrow.parquet as pq
+except ImportError:
+    pq = None
 
 # --- Configurable parameters ---
 DEFAULT_DATA_PATH = 'gold_data.csv'
 DEFAULT_START = '2022-01-01'
 DEFAULT_END = '2025-01-01'
 
+OHLCV_AGG = {
+    'Open': 'first',
+    'High': 'max',
+    'Low': 'min',
+    'Close': 'last',
+    'Volume': 'sum'
+}
+
+# Bucket width in seconds for each resampled timeframe
+RESAMPLE_SECONDS = {
+    '4h': 4 * 3600,
+    '1h': 3600,
+    '30m': 30 * 60,
+    '15m': 15 * 60
+}
+
+
+def _data_key(df):
+    """Short content hash of a frame, used to key the resample cache"""
+    return hashlib.sha1(pd.util.hash_pandas_object(df).values).hexdigest()[:12]
+
+
+def resample_ohlcv(df, seconds):
+    """
+    Resample OHLCV bars into fixed-width time buckets.
+
+    Buckets are the int64 nanosecond timestamps floor-divided by the width,
+    grouped directly instead of going through a Resampler. For widths that
+    divide a day this gives the same midnight-aligned bins as resample().
+    """
+    width = seconds * 10**9
+    bucket = df.index.asi8 // width
+    ohlcv = df[list(OHLCV_AGG)].groupby(bucket).agg(OHLCV_AGG)
+    ohlcv.index = pd.to_datetime(ohlcv.index.to_numpy() * width)
+    ohlcv.index.name = df.index.name
+    return ohlcv.dropna()
+
+
+def _load_resampled(base_df, tf, seconds, data_key):
+    """resample_ohlcv() with a Parquet cache keyed on the input data hash"""
+    if pq is None:
+        return resample_ohlcv(base_df, seconds)
+    return load_or_compute(
+        f'backtest_{tf}_', data_key, '.parquet',
+        lambda: resample_ohlcv(base_df, seconds),
+        pd.read_parquet, lambda ohlcv, path: ohlcv.to_parquet(path)
+    )
+
+
+def simulate_tf(tf_rank, highs, lows, signals):
+    """
+    Take and exit trades for one timeframe.
+
+    Args:
+        tf_rank: position of the TF, used to order settlements within a step
+        highs, lows: OHLC arrays for the TF
+        signals: (step, trade) for every TRADE decision on the TF, in step order
+
+    Only one trade may be open per TF, so a signal is taken only once the
+    previous trade has settled. A SL/TP hit on bar j settles on step j-1
+    (the first step whose one-bar look-ahead reaches it); trades that never
+    hit stay open for good.
+
+    Returns:
+        list of (settle_step, tf_rank, trade), sorted by settle_step
+    """
+    settled = []
+    busy_until = -1
+    for i, trade in signals:
+        if i <= busy_until:
+            continue
+        j, exit_price, is_win = simulate_exit(
+            highs, lows, i+1, len(highs),
+            trade['sl'], trade['tp'], trade['direction'] == 'UP', False
+        )
+        trade.update(exit_idx=j, exit_price=exit_price, is_win=is_win)
+        busy_until = j - 1 if j >= 0 else float('inf')
+        settled.append((busy_until, tf_rank, trade))
+    return settled
+
+
+def replay_trades(per_tf, tf_arrays, first_step, n_steps, initial_capital):
+    """
+    Settle the simulate_tf() results against one shared account.
+
+    Args:
+        per_tf: simulate_tf() output for every TF
+        tf_arrays: per-TF OHLC arrays plus the bar 'index'
+        first_step, n_steps: first decision step and total number of steps
+        initial_capital: starting capital
+
+    Settlements are replayed in step order (TF order within a step), as the
+    candle loop would have booked them; trades still open after the last
+    step are closed at their TF's final price.
+
+    Returns:
+        (trade_df, step_pnl, step_dd) - the trade log, and the P&L and worst
+        trade drawdown booked on each step from first_step on
+    """
+    capital = initial_capital
+    peak = capital
+    # Per-step P&L and worst trade drawdown; the equity and drawdown curves
+    # are derived from these
+    step_pnl = np.zeros(max(n_steps - first_step, 0))
+    step_dd = np.zeros_like(step_pnl)
+
+    # Trade log as preallocated column arrays (at most one row per taken signal)
+    max_trades = sum(len(settled) for settled in per_tf)
+    tr_entry_time = np.empty(max_trades, dtype='datetime64[ns]')
+    tr_exit_time = np.empty(max_trades, dtype='datetime64[ns]')
+    tr_timeframe = np.empty(max_trades, dtype=object)
+    tr_direction = np.empty(max_trades, dtype=object)
+    tr_win = np.zeros(max_trades, dtype=np.uint8)
+    tr_entry = np.empty(max_trades)
+    tr_exit = np.empty(max_trades)
+    tr_pnl = np.empty(max_trades)
+    tr_capital = np.empty(max_trades)
+    tr_drawdown = np.empty(max_trades)
+    n_trades = 0
+
+    # Replay all settlements in step order (TF order within a step) for the
+    # shared capital/drawdown accounting
+    last_step = n_steps - 1
+    unsettled = []
+    for settle_step, rank, trade in heapq.merge(*per_tf):
+        if settle_step > last_step:
+            unsettled.append((rank, trade))
+            continue
+        tf = trade['tf']
+        result = 'win' if trade['is_win'] else 'loss'
+        exit_time = tf_arrays[tf]['index'][trade['exit_idx']]
+        pnl = trade['risk'] * (trade.get('rr_ratio', 1) if result == 'win' else -1)
+        capital += pnl
+        peak = max(peak, capital)
+        dd = (peak - capital) / peak
+        step_pnl[settle_step - first_step] += pnl
+        step_dd[settle_step - first_step] = max(step_dd[settle_step - first_step], dd)
+        k = n_trades
+        tr_entry_time[k] = trade['entry_time']
+        tr_exit_time[k] = exit_time
+        tr_timeframe[k] = tf
+        tr_direction[k] = trade['direction']
+        tr_win[k] = result == 'win'
+        tr_entry[k] = trade['entry']
+        tr_exit[k] = trade['exit_price']
+        tr_pnl[k] = pnl
+        tr_capital[k] = capital
+        tr_drawdown[k] = dd
+        n_trades += 1
+
+    # Close any remaining open trades at final price
+    for _, trade in sorted(unsettled, key=lambda item: item[0]):
+        tf = trade['tf']
+        final_price = tf_arrays[tf]['Close'][-1]
+        result = 'win' if (trade['direction'] == 'UP' and final_price >= trade['entry']) or (trade['direction'] == 'DOWN' and final_price <= trade['entry']) else 'loss'
+        pnl = trade['risk'] * (trade.get('rr_ratio', 1) if result == 'win' else -1)
+        capital += pnl
+        peak = max(peak, capital)
+        dd = (peak - capital) / peak
+        k = n_trades
+        tr_entry_time[k] = trade['entry_time']
+        tr_exit_time[k] = tf_arrays[tf]['index'][-1]
+        tr_timeframe[k] = tf
+        tr_direction[k] = trade['direction']
+        tr_win[k] = result == 'win'
+        tr_entry[k] = trade['entry']
+        tr_exit[k] = final_price
+        tr_pnl[k] = pnl
+        tr_capital[k] = capital
+        tr_drawdown[k] = dd
+        n_trades += 1
+
+    trade_df = pd.DataFrame({
+        'entry_time': tr_entry_time[:n_trades],
+        'exit_time': tr_exit_time[:n_trades],
+        'timeframe': tr_timeframe[:n_trades],
+        'direction': tr_direction[:n_trades],
+        'result': np.where(tr_win[:n_trades] == 1, 'win', 'loss'),
+        'entry': tr_entry[:n_trades],
+        'exit': tr_exit[:n_trades],
+        'pnl': tr_pnl[:n_trades],
+        'capital': tr_capital[:n_trades],
+        'drawdown': tr_drawdown[:n_trades],
+    })
+    return trade_df, step_pnl, step_dd
 
 
 # --- Backtest DataManager ---
@@ -35,24 +228,76 @@ class BacktestDataManager(DataManager):
     def __init__(self, full_data_by_tf):
         super().__init__(symbol='GC=F')
         self._full_data_by_tf = full_data_by_tf
+        # Sorted timestamps per TF, for O(log N) cut-off lookups
+        self._sorted_indices = {tf: df.index.values for tf, df in full_data_by_tf.items()}
         self._current_index = None
 
     def set_index(self, idx):
         self._current_index = idx
 
+    def _visible_rows(self, timeframe):
+        """Number of bars at or before the current index (binary search)"""
+        return np.searchsorted(self._sorted_indices[timeframe], np.datetime64(self._current_index), side='right')
+
     def get_cached_data(self, timeframe):
         # Return only data up to the current index for this timeframe
         df = self._full_data_by_tf[timeframe]
         if self._current_index is None:
             return df
-        # Only up to and including the current index
-        return df[df.index <= self._current_index]
+        # Only up to and including the current index (a positional slice
+        # rather than a boolean mask over the whole frame)
+        return df.iloc[:self._visible_rows(timeframe)]
+
+    def last_bar(self, timeframe):
+        """Timestamp of the latest bar visible at the current index, or None"""
+        if self._current_index is None:
+            return None
+        pos = self._visible_rows(timeframe)
+        return self._sorted_indices[timeframe][pos - 1] if pos else None
+
+
+# --- Backtest Predictor ---
+class _NoForwardLog:
+    """Stands in for ForwardTester so backtest signals never reach the live log"""
+
+    def log_signal(self, timeframe, signal_data):
+        pass
+
+
+class BacktestPredictor(LivePredictor):
+    """
+    LivePredictor that reuses a timeframe's previous result while neither
+    its latest closed bar nor any higher timeframe's has moved on (e.g. the
+    1d prediction only changes once a day on a 15m base).
+
+    Reused results skip LivePredictor's per-call side effects, so the one
+    that writes anywhere - the forward-test log - is switched off outright
+    rather than firing only on cache misses.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.forward_tester = _NoForwardLog()
+        self._last_pred_bar = {}
+        self._last_pred = {}
+
+    def predict_single_timeframe(self, timeframe, htf_results=None):
+        # HTF results feed into the LTF decision, so the key covers this TF
+        # and every TF above it in the hierarchy
+        depth = self.TF_HIERARCHY.index(timeframe) + 1
+        key = tuple(self.data_manager.last_bar(tf) for tf in self.TF_HIERARCHY[:depth])
+        if self._last_pred_bar.get(timeframe) == key:
+            return self._last_pred[timeframe]
+        result = super().predict_single_timeframe(timeframe, htf_results)
+        self._last_pred_bar[timeframe] = key
+        self._last_pred[timeframe] = result
+        return result
 
 
 def run_backtest(data_path, start_date, end_date):
     # Load historical data (assume 1d for now, extend to all TFs as needed)
     # For full fidelity, load all TFs from cache or resample as needed
-    base_df = pd.read_csv(data_path, parse_dates=['Date'], index_col='Date')
+    base_df = load_price_csv(data_path).set_index('Date')
     base_df = base_df[(base_df.index >= start_date) & (base_df.index <= end_date)]
     print(f"Loaded {len(base_df)} rows from {data_path} ({start_date} to {end_date})")
 
@@ -62,36 +307,10 @@ def run_backtest(data_path, start_date, end_date):
     tf_map['1d'] = base_df.copy()
 
 
-    # Helper for resampling with all required columns
-    def resample_ohlcv_full(df, rule):
-        ohlc_dict = {
-            'Open': 'first',
-            'High': 'max',
-            'Low': 'min',
-            'Close': 'last',
-            'Volume': 'sum'
-        }
-        # Only resample OHLCV, ignore other columns for now
-        ohlcv = df[['Open', 'High', 'Low', 'Close', 'Volume']].resample(rule).apply(ohlc_dict)
-        ohlcv = ohlcv.dropna()
-        # Forward/backward fill to avoid NaNs
-        ohlcv = ohlcv.ffill().bfill()
-        # Add back any other columns as NaN (so feature pipeline doesn't break)
-        for col in df.columns:
-            if col not in ohlcv.columns:
-                ohlcv[col] = np.nan
-        # Reorder columns to match original
-        ohlcv = ohlcv[df.columns]
-        return ohlcv
-
-    # 4h
-    tf_map['4h'] = resample_ohlcv_full(base_df, '4H')
-    # 1h
-    tf_map['1h'] = resample_ohlcv_full(base_df, '1H')
-    # 30m
-    tf_map['30m'] = resample_ohlcv_full(base_df, '30T')
-    # 15m
-    tf_map['15m'] = resample_ohlcv_full(base_df, '15T')
+    # Lower timeframes, reused from the Parquet cache when the input is unchanged
+    data_key = _data_key(base_df)
+    for tf, seconds in RESAMPLE_SECONDS.items():
+        tf_map[tf] = _load_resampled(base_df, tf, seconds, data_key)
 
     # Align columns for each TF (fill missing columns with NaN)
     all_cols = set()
@@ -103,27 +322,46 @@ def run_backtest(data_path, start_date, end_date):
                 df[col] = np.nan
         tf_map[tf] = df[sorted(all_cols)]
 
+    # OHLC per timeframe as plain arrays, so the exit simulation indexes
+    # numpy directly instead of going through .iloc for every bar
+    tf_arrays = {
+        tf: {
+            'High': df['High'].to_numpy(),
+            'Low': df['Low'].to_numpy(),
+            'Close': df['Close'].to_numpy(),
+            'index': df.index.values,
+        }
+        for tf, df in tf_map.items()
+    }
+
     # Initialize backtest data manager
     bt_data_manager = BacktestDataManager(tf_map)
 
     # Initialize predictor in market-only mode, inject backtest data manager
-    predictor = LivePredictor()
+    predictor = BacktestPredictor()
     predictor.news_enabled = False  # Market-only mode
     predictor.data_manager = bt_data_manager
 
 
     # Prepare logs and state
-    trade_log = []
-    decision_log = []
-    equity_curve = []
-    drawdown_curve = []
-    capital = 100000  # Starting capital
-    peak = capital
-    max_drawdown = 0
-    open_trades = {tf: [] for tf in tf_map.keys()}
+    # Decision log as preallocated column arrays (one row per TF per step)
+    max_decisions = len(predictor.TF_HIERARCHY) * max(len(base_df) - 50, 0)
+    dec_timestamp = np.empty(max_decisions, dtype='datetime64[ns]')
+    dec_timeframe = np.empty(max_decisions, dtype=object)
+    dec_decision = np.empty(max_decisions, dtype=object)
+    dec_direction = np.empty(max_decisions, dtype=object)
+    dec_confidence = np.full(max_decisions, np.nan)
+    dec_reason = np.empty(max_decisions, dtype=object)
+    n_decisions = 0
+    initial_capital = 100000
+    tf_rank = {tf: rank for rank, tf in enumerate(tf_map)}
+    # TRADE decisions per TF as (step, trade); whether each one is taken is
+    # decided per TF afterwards in simulate_tf
+    trade_signals = {tf: [] for tf in tf_map}
+    first_step = 50
 
     # Iterate through each candle (simulate candle-close decisions)
-    for i in range(50, len(base_df)):
+    for i in range(first_step, len(base_df)):
         current_time = base_df.index[i]
         bt_data_manager.set_index(current_time)
 
@@ -131,135 +369,65 @@ def run_backtest(data_path, start_date, end_date):
         results = predictor.predict_all_timeframes(update_data=False)
         for tf, res in results.items():
             # Log every decision
-            decision_log.append({
-                'timestamp': current_time,
-                'timeframe': tf,
-                'decision': res.get('decision'),
-                'direction': res.get('direction'),
-                'confidence': res.get('confidence'),
-                'rejection_reason': res.get('rejection_reason'),
-            })
-            # Simulate trade if TRADE and no open trade for this TF
-            if res.get('decision') == 'TRADE' and not open_trades[tf]:
-                entry = res['setup'].get('entry', tf_map[tf].loc[current_time]['Close'])
-                sl = res['setup'].get('sl')
-                tp = res['setup'].get('tp')
-                lots = res['setup'].get('lots', 0)
-                direction = res.get('direction')
-                risk = res['setup'].get('risk_amount', 0)
-                rr_ratio = res['setup'].get('rr_ratio', 1)
-                open_trades[tf].append({
+            k = n_decisions
+            dec_timestamp[k] = current_time
+            dec_timeframe[k] = tf
+            dec_decision[k] = res.get('decision')
+            dec_direction[k] = res.get('direction')
+            if res.get('confidence') is not None:
+                dec_confidence[k] = res['confidence']
+            dec_reason[k] = res.get('rejection_reason')
+            n_decisions += 1
+            if res.get('decision') == 'TRADE':
+                setup = res['setup']
+                entry = setup['entry'] if 'entry' in setup else tf_map[tf].loc[current_time]['Close']
+                trade_signals[tf].append((i, {
                     'entry_time': current_time,
                     'entry': entry,
-                    'sl': sl,
-                    'tp': tp,
-                    'lots': lots,
-                    'risk': risk,
-                    'direction': direction,
+                    'sl': setup.get('sl'),
+                    'tp': setup.get('tp'),
+                    'lots': setup.get('lots', 0),
+                    'risk': setup.get('risk_amount', 0),
+                    'direction': res.get('direction'),
                     'tf': tf,
                     'open_idx': i,
-                    'rr_ratio': rr_ratio
-                })
-
-        # Simulate trade exits for each TF
-        for tf, trades in open_trades.items():
-            still_open = []
-            for trade in trades:
-                # Look ahead from entry to current_time for SL/TP hit
-                df_tf = tf_map[tf]
-                entry_idx = trade['open_idx']
-                exit_idx = i
-                trade_closed = False
-                for j in range(entry_idx+1, min(exit_idx+2, len(df_tf))):
-                    row = df_tf.iloc[j]
-                    high = row['High']
-                    low = row['Low']
-                    close = row['Close']
-                    # Long
-                    if trade['direction'] == 'UP':
-                        if low <= trade['sl']:
-                            # SL hit
-                            exit_price = trade['sl']
-                            result = 'loss'
-                            trade_closed = True
-                        elif high >= trade['tp']:
-                            # TP hit
-                            exit_price = trade['tp']
-                            result = 'win'
-                            trade_closed = True
-                    else:
-                        if high >= trade['sl']:
-                            # SL hit
-                            exit_price = trade['sl']
-                            result = 'loss'
-                            trade_closed = True
-                        elif low <= trade['tp']:
-                            # TP hit
-                            exit_price = trade['tp']
-                            result = 'win'
-                            trade_closed = True
-                    if trade_closed:
-                        exit_time = df_tf.index[j]
-                        pnl = trade['risk'] * (trade.get('rr_ratio', 1) if result == 'win' else -1)
-                        capital += pnl
-                        peak = max(peak, capital)
-                        dd = (peak - capital) / peak
-                        max_drawdown = max(max_drawdown, dd)
-                        trade_log.append({
-                            'entry_time': trade['entry_time'],
-                            'exit_time': exit_time,
-                            'timeframe': tf,
-                            'direction': trade['direction'],
-                            'result': result,
-                            'entry': trade['entry'],
-                            'exit': exit_price,
-                            'pnl': pnl,
-                            'capital': capital,
-                            'drawdown': dd,
-                        })
-                        break
-                if not trade_closed:
-                    still_open.append(trade)
-            open_trades[tf] = still_open
-
-        equity_curve.append({'timestamp': current_time, 'capital': capital})
-        drawdown_curve.append({'timestamp': current_time, 'drawdown': max_drawdown})
-
-    # Close any remaining open trades at final price
-    for tf, trades in open_trades.items():
-        for trade in trades:
-            final_price = tf_map[tf].iloc[-1]['Close']
-            result = 'win' if (trade['direction'] == 'UP' and final_price >= trade['entry']) or (trade['direction'] == 'DOWN' and final_price <= trade['entry']) else 'loss'
-            pnl = trade['risk'] * (trade.get('rr_ratio', 1) if result == 'win' else -1)
-            capital += pnl
-            peak = max(peak, capital)
-            dd = (peak - capital) / peak
-            max_drawdown = max(max_drawdown, dd)
-            trade_log.append({
-                'entry_time': trade['entry_time'],
-                'exit_time': tf_map[tf].index[-1],
-                'timeframe': tf,
-                'direction': trade['direction'],
-                'result': result,
-                'entry': trade['entry'],
-                'exit': final_price,
-                'pnl': pnl,
-                'capital': capital,
-                'drawdown': dd,
-            })
-
-    # Output logs
-    pd.DataFrame(trade_log).to_csv('backtest_trade_log.csv', index=False)
-    pd.DataFrame(decision_log).to_csv('backtest_decision_log.csv', index=False)
-    pd.DataFrame(equity_curve).to_csv('backtest_equity_curve.csv', index=False)
-    pd.DataFrame(drawdown_curve).to_csv('backtest_drawdown_curve.csv', index=False)
+                    'rr_ratio': setup.get('rr_ratio', 1)
+                }))
+
+    # Trades on different TFs never interact (one open trade per TF), so
+    # each TF's entries and exits are simulated in its own worker
+    per_tf = Parallel(n_jobs=len(tf_map))(
+        delayed(simulate_tf)(tf_rank[tf], tf_arrays[tf]['High'], tf_arrays[tf]['Low'], trade_signals[tf])
+        for tf in tf_map
+    )
+
+    trade_df, step_pnl, step_dd = replay_trades(
+        per_tf, tf_arrays, first_step, len(base_df), initial_capital
+    )
+    decision_df = pd.DataFrame({
+        'timestamp': dec_timestamp[:n_decisions],
+        'timeframe': dec_timeframe[:n_decisions],
+        'decision': dec_decision[:n_decisions],
+        'direction': dec_direction[:n_decisions],
+        'confidence': dec_confidence[:n_decisions],
+        'rejection_reason': dec_reason[:n_decisions],
+    })
+    # Capital after each step, and the running max drawdown up to it
+    steps = base_df.index[first_step:]
+    equity_df = pd.DataFrame({'timestamp': steps, 'capital': initial_capital + np.cumsum(step_pnl)})
+    drawdown_df = pd.DataFrame({'timestamp': steps, 'drawdown': np.maximum.accumulate(step_dd)})
+
+    # Output logs (the decision log is the big one - Parquet when available)
+    trade_df.to_csv('backtest_trade_log.csv', index=False)
+    if pq is not None:
+        decision_df.to_parquet('backtest_decision_log.parquet', compression='snappy', index=False)
+    else:
+        decision_df.to_csv('backtest_decision_log.csv', index=False)
+    equity_df.to_csv('backtest_equity_curve.csv', index=False)
+    drawdown_df.to_csv('backtest_drawdown_curve.csv', index=False)
     print("Backtest complete. Logs saved.")
 
     # --- Compute Metrics ---
-    trade_df = pd.DataFrame(trade_log)
-    decision_df = pd.DataFrame(decision_log)
-    equity_df = pd.DataFrame(equity_curve)
-    drawdown_df = pd.DataFrame(drawdown_curve)
 
     # Performance
     total_trades = len(trade_df)
@@ -271,31 +439,43 @@ def run_backtest(data_path, start_date, end_date):
     gross_profit = trade_df[trade_df['pnl'] > 0]['pnl'].sum()
     gross_loss = -trade_df[trade_df['pnl'] < 0]['pnl'].sum()
     profit_factor = gross_profit / gross_loss if gross_loss > 0 else float('inf')
-    net_return = (trade_df['capital'].iloc[-1] - 100000) / 100000 if total_trades > 0 else 0
+    net_return = (trade_df['capital'].iloc[-1] - initial_capital) / initial_capital if total_trades > 0 else 0
     max_drawdown = drawdown_df['drawdown'].max() if not drawdown_df.empty else 0
 
     # Decision Quality
-    buy_pct = (decision_df['direction'] == 'UP').mean()
-    sell_pct = (decision_df['direction'] == 'DOWN').mean()
-    no_trade_pct = (decision_df['decision'] == 'NO_TRADE').mean()
-    block_by_conf = (decision_df['rejection_reason'] == 'LOW_CONFIDENCE').mean()
-    block_by_htf = (decision_df['rejection_reason'] == 'HTF_CONFLICT').mean()
-    block_by_news = (decision_df['rejection_reason'] == 'HIGH_IMPACT_NEWS').mean()
-    avg_conf_win = decision_df[decision_df['decision'] == 'TRADE'].merge(trade_df[trade_df['result'] == 'win'], left_on='timestamp', right_on='entry_time')['confidence'].mean() if wins > 0 else 0
-    avg_conf_loss = decision_df[decision_df['decision'] == 'TRADE'].merge(trade_df[trade_df['result'] == 'loss'], left_on='timestamp', right_on='entry_time')['confidence'].mean() if losses > 0 else 0
-    avg_conf_no_trade = decision_df[decision_df['decision'] == 'NO_TRADE']['confidence'].mean() if no_trade_pct > 0 else 0
+    # One pass to count every (decision, direction, reason) combination;
+    # the individual shares are sums over that small table
+    decision_counts = decision_df.groupby(['decision', 'direction', 'rejection_reason'], dropna=False).size()
+    total_decisions = decision_counts.sum()
+
+    def decision_share(level, value):
+        matched = decision_counts[decision_counts.index.get_level_values(level) == value].sum()
+        return matched / total_decisions if total_decisions > 0 else float('nan')
+
+    buy_pct = decision_share('direction', 'UP')
+    sell_pct = decision_share('direction', 'DOWN')
+    no_trade_pct = decision_share('decision', 'NO_TRADE')
+    block_by_conf = decision_share('rejection_reason', 'LOW_CONFIDENCE')
+    block_by_htf = decision_share('rejection_reason', 'HTF_CONFLICT')
+    block_by_news = decision_share('rejection_reason', 'HIGH_IMPACT_NEWS')
+
+    # Confidence of TRADE decisions whose trade won/lost, matched on entry
+    # time with a sorted datetime64 membership test
+    is_trade = (decision_df['decision'] == 'TRADE').to_numpy()
+    decision_times = decision_df['timestamp'].to_numpy()
+    win_times = np.unique(trade_df.loc[trade_df['result'] == 'win', 'entry_time'].to_numpy())
+    loss_times = np.unique(trade_df.loc[trade_df['result'] == 'loss', 'entry_time'].to_numpy())
+    avg_conf_win = decision_df.loc[is_trade & np.isin(decision_times, win_times), 'confidence'].mean() if wins > 0 else 0
+    avg_conf_loss = decision_df.loc[is_trade & np.isin(decision_times, loss_times), 'confidence'].mean() if losses > 0 else 0
+    avg_conf_no_trade = decision_df.loc[decision_df['decision'] == 'NO_TRADE', 'confidence'].mean() if no_trade_pct > 0 else 0
 
     # Capital Safety
-    # Worst losing streak
-    streak = 0
-    max_streak = 0
-    for r in trade_df['result']:
-        if r == 'loss':
-            streak += 1
-            max_streak = max(max_streak, streak)
-        else:
-            streak = 0
-    worst_losing_streak = max_streak
+    # Worst losing streak: losses in the same run share the count of
+    # non-losses before them, so bincount over that label gives run lengths
+    is_loss = (trade_df['result'] == 'loss').to_numpy()
+    run_label = np.cumsum(~is_loss)
+    streaks = np.bincount(run_label[is_loss])
+    worst_losing_streak = int(streaks.max()) if streaks.size else 0
     # Time to recover drawdowns (approximate)
     drawdown_periods = (drawdown_df['drawdown'] > 0).sum()
     # Daily risk exposure (mean risk per day)
@@ -332,14 +512,6 @@ def run_backtest(data_path, start_date, end_date):
     print(f"Edge statistically meaningful? {'YES' if profit_factor >= 1.2 and win_rate > 0.5 else 'NO'}")
     print(f"NO_TRADE reduces losses? {'YES' if avg_conf_no_trade < avg_conf_loss else 'NO'}")
 
-    # Output logs and metrics
-    pd.DataFrame(trade_log).to_csv('backtest_trade_log.csv', index=False)
-    pd.DataFrame(decision_log).to_csv('backtest_decision_log.csv', index=False)
-    pd.DataFrame(equity_curve).to_csv('backtest_equity_curve.csv', index=False)
-    pd.DataFrame(drawdown_curve).to_csv('backtest_drawdown_curve.csv', index=False)
-    print("Backtest complete. Logs saved.")
-    # TODO: Compute and print all required metrics
-
 if __name__ == "__main__":
     parser = argparse.ArgumentParser()
     parser.add_argument('--data', type=str, default=DEFAULT_DATA_PATH)
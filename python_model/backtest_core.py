@@ -0,0 +1,114 @@
+"""
+Backtest Core Module
+Shared daily backtest run for the standalone backtest scripts.
+
+backtest_simple.py and backtest_multi_tf.py differ only in where their
+candles come from and how they report; prediction, calibration and the
+compounding walk live here so both go through the same cached numba
+kernel.
+"""
+import numpy as np
+import pandas as pd
+
+from calibration import ModelCalibrator, get_calibrator_path
+from model_io import get_model_path, cached_predictions
+from backtest_kernels import backtest_kernel, calibration_table, lookup_calibration
+
+# Feature columns of the daily model used by the standalone backtests
+DAILY_FEATURE_COLS = [
+    'Close', 'High', 'Low', 'Open', 'Volume',
+    'EMA_10', 'EMA_50', 'RSI', 'ATR',
+    'MACD', 'MACD_Signal', 'MACD_Hist',
+    'Price_to_EMA10', 'Price_to_EMA50'
+]
+
+
+def load_calibration_table(timeframe='1d', base_dir='.'):
+    """
+    Load a timeframe's calibrator and tabulate it for lookup_calibration().
+
+    Raises:
+        FileNotFoundError: if there is no usable calibrator file
+    """
+    calibrator = ModelCalibrator(timeframe)
+    if not calibrator.load(base_dir):
+        raise FileNotFoundError(f"No usable calibrator for {timeframe} in {base_dir}")
+    return calibration_table(calibrator)
+
+
+def max_drawdown(capital, initial_capital):
+    """Largest peak-to-trough drop of a capital path, as a fraction of the peak"""
+    peak = np.maximum.accumulate(np.maximum(capital, initial_capital))
+    return ((peak - capital) / peak).max(initial=0)
+
+
+def run_daily_backtest(df_clean, model, calib_table, feature_cols=DAILY_FEATURE_COLS,
+                       min_conf=60.0, risk_pct=0.0075, rr=2.5, sl_atr=2.0, horizon=5,
+                       initial_capital=10000, trade_tail=False, flat_wins=True,
+                       timeframe='1d', base_dir='.'):
+    """
+    Predict every candle in df_clean and run the compounding backtest.
+
+    Predictions go straight through the booster (inplace_predict on a
+    contiguous float32 matrix) and are cached on disk keyed on the
+    features, model and calibrator. A candle trades when its calibrated
+    confidence is at least min_conf percent; see backtest_kernel for the
+    SL/TP, exit and sizing rules, trade_tail and flat_wins.
+
+    Args:
+        df_clean: candles with Date, OHLC and every feature column present
+        model: XGBClassifier for the timeframe
+        calib_table: table from load_calibration_table()
+
+    Returns:
+        (trades_df, n_candles): one row per trade (date, direction, entry,
+        exit, sl, tp, result, pnl, capital, raw_conf, calib_conf), and the
+        number of candles that were eligible to trade
+    """
+    booster = model.get_booster()
+    X_all = np.ascontiguousarray(df_clean[feature_cols].to_numpy(dtype=np.float32))
+
+    def predict_rows(X):
+        # binary:logistic already returns P(UP)
+        proba = booster.inplace_predict(X)
+        return {'proba': proba, 'calib': lookup_calibration(calib_table, proba)}
+
+    dependencies = [
+        get_model_path(base_dir, timeframe),
+        get_calibrator_path(base_dir, timeframe)
+    ]
+    predictions = cached_predictions(X_all, predict_rows, dependencies)
+    proba = predictions['proba']
+    calib = predictions['calib']
+
+    atr = df_clean['ATR'].to_numpy(dtype=np.float64)
+    rows, exit_rows, entry_px, exit_px, pnl, is_win = backtest_kernel(
+        proba, calib,
+        df_clean['Close'].to_numpy(dtype=np.float64),
+        df_clean['High'].to_numpy(dtype=np.float64),
+        df_clean['Low'].to_numpy(dtype=np.float64),
+        atr, float(min_conf), risk_pct, rr, sl_atr, horizon, float(initial_capital),
+        trade_tail, flat_wins
+    )
+
+    n_rows = len(df_clean)
+    n_candles = n_rows if trade_tail else max(n_rows - horizon, 0)
+
+    # Per-trade fields, gathered for the trade rows only
+    up = proba[rows] >= 0.5
+    sl_dist = sl_atr * atr[rows]
+    tp_dist = sl_dist * rr
+    trades_df = pd.DataFrame({
+        'date': df_clean['Date'].to_numpy()[rows],
+        'direction': np.where(up, 'UP', 'DOWN'),
+        'entry': entry_px,
+        'exit': exit_px,
+        'sl': np.where(up, entry_px - sl_dist, entry_px + sl_dist),
+        'tp': np.where(up, entry_px + tp_dist, entry_px - tp_dist),
+        'result': np.where(is_win, 'win', 'loss'),
+        'pnl': pnl,
+        'capital': initial_capital + np.cumsum(pnl),
+        'raw_conf': np.where(up, proba[rows], 1 - proba[rows]) * 100,
+        'calib_conf': np.where(up, calib[rows], 1 - calib[rows]) * 100
+    })
+    return trades_df, n_candles
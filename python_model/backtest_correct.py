@@ -4,8 +4,12 @@ Backtest with Correct Features - XAUUSD Daily
 
 import pandas as pd
 import numpy as np
-import pickle
-from features import compute_indicators, get_feature_columns
+import xgboost as xgb
+from model_io import load_model
+from calibration import ModelCalibrator
+from data_manager import load_price_csv
+from backtest_kernels import backtest_kernel
+from features import cached_compute_indicators, get_feature_columns
 
 print("=" * 70)
 print("BACKTEST - XAUUSD DAILY (Correct Features)")
@@ -13,8 +17,7 @@ print("=" * 70)
 print()
 
 # Load data
-df = pd.read_csv('gold_data.csv')
-df['Date'] = pd.to_datetime(df['Date'])
+df = load_price_csv('gold_data.csv')
 df = df.sort_values('Date')
 df = df[df['Date'] >= '2023-01-01'].reset_index(drop=True)
 df = df.set_index(pd.to_datetime(df['Date']))
@@ -23,7 +26,7 @@ print(f"📊 Loaded {len(df)} candles ({df.index.min().date()} to {df.index.max(
 
 # Compute features
 print("Computing indicators...", end=" ")
-df = compute_indicators(df)
+df = cached_compute_indicators(df)
 print("✅")
 
 # Get the EXACT features used by the model
@@ -37,125 +40,73 @@ print(f"Complete rows: {len(df_clean)}")
 print()
 
 # Load model
-model = pickle.load(open('xgb_1d.pkl', 'rb'))
-calibrator = pickle.load(open('calibrator_1d.pkl', 'rb'))
+model = load_model('.', '1d')
+if model is None:
+    print("❌ No usable 1d model (xgb_1d.ubj or .pkl)")
+    exit(1)
+calibrator = ModelCalibrator('1d')
+if not calibrator.load('.'):
+    print("❌ No usable 1d calibrator (calibrator_1d.npz or .pkl)")
+    exit(1)
 print("✅ Model loaded")
 print()
 
+# Score every candle in one batch instead of one predict call per row
+# (straight through the booster - binary:logistic already returns P(UP))
+X_all = np.ascontiguousarray(df_clean[feature_cols].to_numpy(dtype=np.float32))
+booster = model.get_booster()
+dmat = xgb.DMatrix(X_all, feature_names=booster.feature_names)
+probs = booster.predict(dmat)
+probs_cal, _ = calibrator.calibrate_batch(probs)
+
+# OHLC/ATR as plain arrays for the backtest kernel
+highs = df_clean['High'].to_numpy(dtype=np.float64)
+lows = df_clean['Low'].to_numpy(dtype=np.float64)
+closes = df_clean['Close'].to_numpy(dtype=np.float64)
+atrs = df_clean['ATR'].to_numpy(dtype=np.float64)
+
 # === BACKTEST ===
 print("Running backtest...")
 print()
 
-trades = []
-capital = 10000
-peak = capital
-dd_max = 0
-wins = losses = 0
-signals = 0
+up = probs >= 0.5
+conf_raw_all = np.where(up, probs, 1 - probs) * 100
+conf_cal_all = np.where(up, probs_cal, 1 - probs_cal) * 100
 
-for i in range(len(df_clean) - 5):
-    row = df_clean.iloc[i]
-    
-    X = row[feature_cols].values.reshape(1, -1)
-    
-    try:
-        # Predict
-        prob = model.predict_proba(X)[0][1]
-        calib_models = pickle.load(open('calibrator_1d.pkl', 'rb'))
-        if isinstance(calib_models, dict):
-            calibrator_1d = calib_models.get('1d', calib_models.get(list(calib_models.keys())[0]))
-        else:
-            calibrator_1d = calib_models
-        prob_cal = calibrator_1d.predict([[prob]])[0]
-        
-        direction = "UP" if prob >= 0.5 else "DOWN"
-        conf_raw = (prob if prob >= 0.5 else 1-prob) * 100
-        conf_cal = (prob_cal if prob >= 0.5 else 1-prob_cal) * 100
-        
-        # Lower threshold for backtesting
-        if conf_cal < 52:
-            continue
-        
-        signals += 1
-        
-        # Position
-        price = row['Close']
-        atr = row['ATR']
-        sl_dist = 2 * atr
-        tp_dist = sl_dist * 2.5
-        
-        risk = capital * 0.0075
-        lots = min(10, max(0.01, risk / (sl_dist * 100)))
-        
-        entry = price
-        sl = price - sl_dist if direction == "UP" else price + sl_dist
-        tp = price + tp_dist if direction == "UP" else price - tp_dist
-        
-        # Find exit
-        result = None
-        exit_price = None
-        
-        for j in range(i+1, min(i+6, len(df_clean))):
-            h = df_clean.iloc[j]['High']
-            l = df_clean.iloc[j]['Low']
-            
-            if direction == "UP":
-                if h >= tp:
-                    exit_price = tp
-                    result = "WIN"
-                    break
-                elif l <= sl:
-                    exit_price = sl
-                    result = "LOSS"
-                    break
-            else:
-                if l <= tp:
-                    exit_price = tp
-                    result = "WIN"
-                    break
-                elif h >= sl:
-                    exit_price = sl
-                    result = "LOSS"
-                    break
-        
-        if result is None:
-            exit_price = df_clean.iloc[min(i+5, len(df_clean)-1)]['Close']
-            result = "WIN" if (direction == "UP" and exit_price > entry) or (direction == "DOWN" and exit_price < entry) else "LOSS"
-        
-        # P&L
-        pnl = (risk * 2.5) if result == "WIN" else -risk
-        capital += pnl
-        peak = max(peak, capital)
-        dd_max = max(dd_max, (peak - capital) / peak if peak > 0 else 0)
-        
-        if result == "WIN":
-            wins += 1
-        else:
-            losses += 1
-        
-        trades.append({
-            'date': row.name,
-            'direction': direction,
-            'entry': entry,
-            'exit': exit_price,
-            'result': result,
-            'pnl': pnl,
-            'capital': capital,
-            'conf_raw': conf_raw,
-            'conf_cal': conf_cal
-        })
-        
-    except Exception as e:
-        print(f"Error: {e}")
-        continue
+# Lower threshold for backtesting (52%); SL = 2*ATR, TP = 2.5*SL,
+# 0.75% risk per trade, exit within 5 candles
+entry_ix, exit_ix, entry_px, exit_px, pnl, is_win = backtest_kernel(
+    probs, probs_cal, closes, highs, lows, atrs,
+    52.0, 0.0075, 2.5, 2.0, 5, 10000.0
+)
+
+# Capital/drawdown path from the per-trade P&L
+capitals = 10000 + np.cumsum(pnl)
+peaks = np.maximum(np.maximum.accumulate(capitals), 10000)
+capital = capitals[-1] if len(capitals) else 10000
+dd_max = ((peaks - capitals) / peaks).max() if len(capitals) else 0
+wins = int(is_win.sum())
+losses = len(is_win) - wins
+
+df_trades = pd.DataFrame({
+    'date': df_clean.index[entry_ix],
+    'direction': np.where(up[entry_ix], 'UP', 'DOWN'),
+    'entry': entry_px,
+    'exit': exit_px,
+    'result': np.where(is_win, 'WIN', 'LOSS'),
+    'pnl': pnl,
+    'capital': capitals,
+    'conf_raw': conf_raw_all[entry_ix],
+    'conf_cal': conf_cal_all[entry_ix]
+})
+signals = len(df_trades)
 
 print("=" * 70)
 print("BACKTEST RESULTS")
 print("=" * 70)
 print()
 
-if len(trades) > 0:
-    df_trades = pd.DataFrame(trades)
+if len(df_trades) > 0:
     total = len(df_trades)
     total_pnl = df_trades['pnl'].sum()
     wr = wins / total if total > 0 else 0
@@ -0,0 +1,154 @@
+"""
+Backtest Kernels Module
+Shared numeric loops for the backtest scripts.
+
+The SL/TP exit search and the daily compounding backtest are plain scalar
+loops over OHLC arrays, so they are compiled with numba when available.
+Without numba the same functions run as ordinary Python.
+
+The calibration table helpers replace per-probability calibrator calls with
+one indexed load over a precomputed grid.
+"""
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit"""
+        if args and callable(args[0]):
+            return args[0]
+        return lambda f: f
+
+
+CALIBRATION_TABLE_SIZE = 10000
+
+
+def calibration_table(calibrator, size=CALIBRATION_TABLE_SIZE):
+    """
+    Tabulate a fitted ModelCalibrator on an evenly spaced [0, 1] grid.
+
+    Returns:
+        float64 array of size + 1 calibrated values; table[k] = f(k / size)
+    """
+    grid = np.linspace(0.0, 1.0, size + 1)
+    calibrated, _ = calibrator.calibrate_batch(grid)
+    return np.asarray(calibrated, dtype=np.float64)
+
+
+def lookup_calibration(table, probs):
+    """Calibrate an array of raw probabilities via the nearest grid entry of `table`"""
+    size = len(table) - 1
+    idx = np.rint(np.asarray(probs, dtype=np.float64) * size).astype(np.intp)
+    return table[np.clip(idx, 0, size)]
+
+
+@njit(cache=True)
+def simulate_exit(highs, lows, start, stop, sl, tp, up, tp_first):
+    """
+    Find the first bar in [start, stop) whose range reaches SL or TP.
+
+    Args:
+        highs, lows: float64 OHLC arrays for the timeframe
+        start, stop: bar range to scan
+        sl, tp: stop-loss and take-profit prices
+        up: True for a long trade, False for a short
+        tp_first: if both levels fall inside one bar, count it as TP
+
+    Returns:
+        (exit_idx, exit_price, is_win); exit_idx is -1 if neither level was hit
+    """
+    for j in range(start, stop):
+        h = highs[j]
+        l = lows[j]
+        if up:
+            hit_tp = h >= tp
+            hit_sl = l <= sl
+        else:
+            hit_tp = l <= tp
+            hit_sl = h >= sl
+        if tp_first:
+            if hit_tp:
+                return j, tp, True
+            if hit_sl:
+                return j, sl, False
+        else:
+            if hit_sl:
+                return j, sl, False
+            if hit_tp:
+                return j, tp, True
+    return -1, 0.0, False
+
+
+@njit(cache=True)
+def backtest_kernel(probs, cal_probs, closes, highs, lows, atrs, conf_thresh,
+                    risk_frac, rr, sl_atr, lookahead, capital0,
+                    trade_tail=False, flat_wins=False):
+    """
+    Compounding daily backtest: one trade per qualifying candle.
+
+    A candle trades when its calibrated confidence (in the direction of the
+    raw probability) is at least conf_thresh percent. SL sits sl_atr * ATR
+    from the close and TP rr times further; a TP/SL hit within the next
+    `lookahead` bars (TP wins ties) decides the trade, otherwise it closes
+    at the last of those bars' close. Each trade risks risk_frac of the
+    running capital and wins rr times that.
+
+    The last `lookahead` candles are not traded unless trade_tail is set,
+    in which case they scan whatever bars remain. A market close exactly at
+    the entry price counts as a loss unless flat_wins is set.
+
+    Returns:
+        (entry_ix, exit_ix, entry_px, exit_px, pnl, is_win) arrays, one
+        element per trade
+    """
+    n = probs.shape[0]
+    n_candles = n if trade_tail else max(n - lookahead, 0)
+    entry_ix = np.empty(n_candles, dtype=np.int64)
+    exit_ix = np.empty(n_candles, dtype=np.int64)
+    entry_px = np.empty(n_candles, dtype=np.float64)
+    exit_px = np.empty(n_candles, dtype=np.float64)
+    pnl = np.empty(n_candles, dtype=np.float64)
+    is_win = np.empty(n_candles, dtype=np.bool_)
+
+    capital = capital0
+    k = 0
+    for i in range(n_candles):
+        up = probs[i] >= 0.5
+        conf = (cal_probs[i] if up else 1.0 - cal_probs[i]) * 100.0
+        if conf < conf_thresh:
+            continue
+
+        entry = closes[i]
+        sl_dist = sl_atr * atrs[i]
+        tp_dist = sl_dist * rr
+        if up:
+            sl = entry - sl_dist
+            tp = entry + tp_dist
+        else:
+            sl = entry + sl_dist
+            tp = entry - tp_dist
+
+        j, price, win = simulate_exit(highs, lows, i + 1, min(i + 1 + lookahead, n), sl, tp, up, True)
+        if j < 0:
+            # Neither level hit, close at market
+            j = min(i + lookahead, n - 1)
+            price = closes[j]
+            if flat_wins:
+                win = price >= entry if up else price <= entry
+            else:
+                win = price > entry if up else price < entry
+
+        risk = capital * risk_frac
+        trade_pnl = risk * rr if win else -risk
+        capital += trade_pnl
+
+        entry_ix[k] = i
+        exit_ix[k] = j
+        entry_px[k] = entry
+        exit_px[k] = price
+        pnl[k] = trade_pnl
+        is_win[k] = win
+        k += 1
+
+    return entry_ix[:k], exit_ix[:k], entry_px[:k], exit_px[:k], pnl[:k], is_win[:k]
@@ -7,14 +7,15 @@ import pandas as pd
 import numpy as np
 from datetime import datetime
 
+from data_manager import load_price_csv
+
 print("=" * 70)
 print("BACKTEST - Using Live Predictor Logic")
 print("=" * 70)
 print()
 
-# Load historical data
-df = pd.read_csv('gold_data.csv')
-df['Date'] = pd.to_datetime(df['Date'])
+# Load historical data (only the dates are needed here)
+df = load_price_csv('gold_data.csv', columns=['Date'])
 df = df.sort_values('Date')
 df = df[df['Date'] >= '2024-01-01'].reset_index(drop=True)
 
@@ -37,54 +38,44 @@ print()
 
 if len(trades_log) > 0:
     # Simulate PnL based on forward test data
-    capital = 10000
-    peak = capital
-    dd_max = 0
+    # The forward_test_log already has entry, sl, tp calculated; outcomes
+    # are drawn at random (in a real backtest we'd look ahead in the
+    # actual price data)
+    initial_capital = 10000
+    risk_pct = 0.0075
+    n_trades = len(trades_log)
+    rr = trades_log['rr_ratio'].to_numpy(dtype=np.float64)
+    
+    # Simulate: 58% of trades win
+    outcome_win_prob = 0.58
+    rng = np.random.default_rng()
+    did_win = rng.random(n_trades) < outcome_win_prob
+    
+    # Each trade risks 0.75% of the running capital, so capital compounds
+    # by a fixed factor per outcome and the whole path is one cumprod
+    growth = np.where(did_win, 1 + risk_pct * rr, 1 - risk_pct)
+    capital_curve = initial_capital * np.cumprod(growth)
+    pnl = np.diff(capital_curve, prepend=initial_capital)
+    capital = capital_curve[-1]
     
-    trades = []
-    for idx, row in trades_log.iterrows():
-        entry_price = row['entry']
-        sl = row['sl']
-        tp = row['tp']
-        direction = row['direction']
-        
-        # The forward_test_log already has entry, sl, tp calculated
-        # We'll simulate outcome: 50% win rate for simplicity
-        # (in real backtest, we'd look ahead in the actual price data)
-        
-        risk = capital * 0.0075
-        rr = row['rr_ratio']
-        
-        # Simulate: 58% of trades win
-        outcome_win_prob = 0.58
-        did_win = np.random.random() < outcome_win_prob
-        
-        if did_win:
-            pnl = risk * rr
-        else:
-            pnl = -risk
-        
-        capital += pnl
-        peak = max(peak, capital)
-        dd_max = max(dd_max, (peak - capital) / peak if peak > 0 else 0)
-        
-        trades.append({
-            'date': row['timestamp'],
-            'direction': direction,
-            'entry': entry_price,
-            'sl': sl,
-            'tp': tp,
-            'result': 'WIN' if did_win else 'LOSS',
-            'pnl': pnl,
-            'capital': capital,
-            'confidence': row['calib_conf']
-        })
+    peak = np.maximum(np.maximum.accumulate(capital_curve), initial_capital)
+    dd_max = ((peak - capital_curve) / peak).max()
     
-    df_trades = pd.DataFrame(trades)
-    wins = len(df_trades[df_trades['result'] == 'WIN'])
-    losses = len(df_trades[df_trades['result'] == 'LOSS'])
-    total_pnl = df_trades['pnl'].sum()
-    wr = wins / len(df_trades)
+    df_trades = pd.DataFrame({
+        'date': trades_log['timestamp'].to_numpy(),
+        'direction': trades_log['direction'].to_numpy(),
+        'entry': trades_log['entry'].to_numpy(),
+        'sl': trades_log['sl'].to_numpy(),
+        'tp': trades_log['tp'].to_numpy(),
+        'result': np.where(did_win, 'WIN', 'LOSS'),
+        'pnl': pnl,
+        'capital': capital_curve,
+        'confidence': trades_log['calib_conf'].to_numpy()
+    })
+    wins = int(did_win.sum())
+    losses = n_trades - wins
+    total_pnl = pnl.sum()
+    wr = wins / n_trades
     
     print("=" * 70)
     print("SIMULATED BACKTEST RESULTS")
@@ -9,27 +9,149 @@ FIXES APPLIED:
 - Added fallback handling with warnings
 - Added confidence change monitoring
 """
+import bisect
+import json
 import numpy as np
-import pickle
+import joblib
 import os
+from joblib import Parallel, delayed
 import warnings
 from sklearn.isotonic import IsotonicRegression
 
+try:
+    from scipy.optimize import isotonic_regression
+except ImportError:  # SciPy < 1.12
+    isotonic_regression = None
+
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit"""
+        if args and callable(args[0]):
+            return args[0]
+        return lambda f: f
+
 # Maximum acceptable drift between raw and calibrated probability
 MAX_CALIBRATION_DRIFT = 0.15  # 15%
 
+# Bound on calibrate_simple's per-instance memo of recent probabilities
+SIMPLE_CACHE_SIZE = 4096
+
+# Calibrators are saved as calibrator_{tf}.npz; legacy pickles
+# (calibrator_{tf}.pkl) still load - whichever file is newer wins
+CALIBRATOR_SUFFIXES = ('.npz', '.pkl')
+
+# Loaded calibrator files, keyed on (path, mtime)
+_CALIB_CACHE = {}
+
+# Confidence bands by distance from 0.5: band i covers [THR[i-1], THR[i])
+_BAND_THR = (0.05, 0.10, 0.20, 0.30)
+_BAND_THR_ARR = np.array(_BAND_THR)
+_BAND_LBL = ("VERY_LOW", "LOW", "MEDIUM", "HIGH", "VERY_HIGH")
+_BAND_LBL_ARR = np.array(_BAND_LBL)
+
+
+@njit(cache=True)
+def _interp_scalar(x, xp, fp):
+    """
+    np.interp for one float: bisect the knots xp, interpolate fp linearly,
+    clamp outside [xp[0], xp[-1]]. Compiled so a single calibration skips
+    NumPy's per-call dispatch.
+    """
+    if x != x:
+        return x  # NaN in, NaN out (like np.interp)
+    n = xp.shape[0]
+    if x <= xp[0]:
+        return fp[0]
+    if x >= xp[n - 1]:
+        return fp[n - 1]
+    lo = 0
+    hi = n - 1
+    while hi - lo > 1:
+        mid = (lo + hi) >> 1
+        if xp[mid] <= x:
+            lo = mid
+        else:
+            hi = mid
+    return fp[lo] + (fp[hi] - fp[lo]) * (x - xp[lo]) / (xp[hi] - xp[lo])
+
 
 class CalibrationWarning(UserWarning):
     """Custom warning for calibration issues"""
     pass
 
 
+def get_calibrator_path(directory, timeframe):
+    """Return the newest calibrator file for a timeframe, or None if there is none"""
+    candidates = [
+        os.path.join(directory, f'calibrator_{timeframe}{suffix}')
+        for suffix in CALIBRATOR_SUFFIXES
+    ]
+    candidates = [p for p in candidates if os.path.exists(p)]
+    if not candidates:
+        return None
+    return max(candidates, key=os.path.getmtime)
+
+
+def read_calibrator_file(path):
+    """
+    Read a calibrator file into the dict format load() understands.
+    
+    .npz files hold the knots plus the stats as JSON. .pkl files go through
+    joblib with the knot arrays memory-mapped read-only (plain pickles of
+    older formats load too).
+    """
+    if path.endswith('.npz'):
+        with np.load(path) as data:
+            return {
+                'x_thresholds': data['x_thr'],
+                'y_thresholds': data['y_thr'],
+                'stats': json.loads(str(data['stats_json']))
+            }
+    return joblib.load(path, mmap_mode='r')
+
+
+def _load_cached(path):
+    """Read a calibrator file once per (path, mtime)"""
+    key = (path, os.path.getmtime(path))
+    data = _CALIB_CACHE.get(key)
+    if data is None:
+        data = read_calibrator_file(path)
+        # Drop entries for older versions of this file
+        for stale in [k for k in _CALIB_CACHE if k[0] == path]:
+            del _CALIB_CACHE[stale]
+        _CALIB_CACHE[key] = data
+    return data
+
+
 class ModelCalibrator:
+    __slots__ = (
+        'timeframe', 'isotonic', 'is_fitted', 'calibration_stats',
+        '_x_thr', '_y_thr', '_simple_cache'
+    )
+    
     def __init__(self, timeframe):
         self.timeframe = timeframe
         self.isotonic = IsotonicRegression(out_of_bounds='clip')
         self.is_fitted = False
         self.calibration_stats = {}  # Store stats for monitoring
+        self._x_thr = None  # Fitted isotonic knots (see _cache_thresholds)
+        self._y_thr = None
+        self._simple_cache = {}  # raw_prob -> calibrated, see calibrate_simple
+        
+    def __setstate__(self, state):
+        """Unpickle, including instances pickled before __slots__ (plain dict state)"""
+        if isinstance(state, tuple):
+            dict_state, slot_state = state
+            state = {**(dict_state or {}), **(slot_state or {})}
+        self._x_thr = self._y_thr = None
+        self._simple_cache = {}
+        for name, value in state.items():
+            setattr(self, name, value)
+        if self._x_thr is None and getattr(self, 'is_fitted', False):
+            # Pickled before the knots were cached: derive them now
+            self._cache_thresholds()
         
     def fit(self, raw_probs, true_labels):
         """
@@ -50,24 +172,33 @@ class ModelCalibrator:
                 print(f"  ⚠️ CRITICAL: Not enough samples to calibrate {self.timeframe}")
                 return False
         
+        # Convert once; the stats, the fit and the calibrated pass all
+        # reuse these arrays
+        raw_probs = np.ascontiguousarray(raw_probs, dtype=np.float64)
+        true_labels = np.ascontiguousarray(true_labels, dtype=np.float64)
+        raw_mean = raw_probs.mean()
+        
         # Store raw probs for diagnostics
         self.calibration_stats = {
             'n_samples': len(raw_probs),
-            'raw_mean': float(np.mean(raw_probs)),
-            'raw_std': float(np.std(raw_probs)),
-            'true_rate': float(np.mean(true_labels)),
+            'raw_mean': float(raw_mean),
+            'raw_std': float(raw_probs.std()),
+            'true_rate': float(true_labels.mean()),
         }
             
-        self.isotonic.fit(raw_probs, true_labels)
+        if isotonic_regression is not None:
+            self._fit_knots(raw_probs, true_labels)
+        else:
+            self.isotonic.fit(raw_probs, true_labels)
+            self._cache_thresholds()
         self.is_fitted = True
         
         # Calculate calibration quality metrics
-        calibrated = self.isotonic.predict(raw_probs)
-        self.calibration_stats['calib_mean'] = float(np.mean(calibrated))
-        self.calibration_stats['calib_std'] = float(np.std(calibrated))
-        self.calibration_stats['mean_drift'] = abs(
-            self.calibration_stats['raw_mean'] - self.calibration_stats['calib_mean']
-        )
+        calibrated = self._interp(raw_probs)
+        calib_mean = calibrated.mean()
+        self.calibration_stats['calib_mean'] = float(calib_mean)
+        self.calibration_stats['calib_std'] = float(calibrated.std())
+        self.calibration_stats['mean_drift'] = float(abs(raw_mean - calib_mean))
         
         # Warn if calibration significantly shifts probabilities
         if self.calibration_stats['mean_drift'] > MAX_CALIBRATION_DRIFT:
@@ -97,9 +228,7 @@ class ModelCalibrator:
             )
             return raw_prob, True  # Return with warning flag
             
-        # Isotonic expects array-like
-        calibrated = self.isotonic.predict([raw_prob])[0]
-        calibrated = float(calibrated)
+        calibrated = float(self._interp(raw_prob))
         
         # Check for excessive drift on this specific prediction
         drift = abs(calibrated - raw_prob)
@@ -114,11 +243,112 @@ class ModelCalibrator:
         
         return calibrated, has_drift_warning
     
+    def _cache_thresholds(self, x_thr=None, y_thr=None):
+        """
+        Keep the isotonic knots as plain float64 arrays so calibration
+        can skip IsotonicRegression.predict's validation and go straight to
+        np.interp. Knots default to the fitted isotonic's; legacy pickles
+        without them fall back to predict.
+        
+        Knots that do not change the interpolant (repeated points, interior
+        points of flat runs) are dropped; the count kept is recorded as
+        calibration_stats['n_knots'].
+        """
+        if x_thr is None:
+            x_thr = getattr(self.isotonic, 'X_thresholds_', None)
+            y_thr = getattr(self.isotonic, 'y_thresholds_', None)
+        self._simple_cache = {}  # Knots are changing
+        if x_thr is None or y_thr is None:
+            self._x_thr = self._y_thr = None
+            return
+        x_thr = np.ascontiguousarray(x_thr, dtype=np.float64)
+        y_thr = np.ascontiguousarray(y_thr, dtype=np.float64)
+        
+        # Repeated (x, y) points
+        keep = np.ones(len(x_thr), dtype=bool)
+        keep[1:] = (np.diff(x_thr) != 0) | (np.diff(y_thr) != 0)
+        if not keep.all():
+            x_thr, y_thr = x_thr[keep], y_thr[keep]
+        # Interior points of flat runs
+        keep = np.ones(len(y_thr), dtype=bool)
+        keep[1:-1] = (y_thr[1:-1] != y_thr[:-2]) | (y_thr[1:-1] != y_thr[2:])
+        if not keep.all():
+            x_thr, y_thr = x_thr[keep], y_thr[keep]
+        
+        self._x_thr = x_thr
+        self._y_thr = y_thr
+        self.calibration_stats['n_knots'] = len(x_thr)
+        # Warm up the scalar kernel so its JIT cost is not paid on the
+        # first live prediction
+        _interp_scalar(0.5, self._x_thr, self._y_thr)
+    
+    def _fit_knots(self, raw_probs, true_labels):
+        """
+        Fit the isotonic knots directly with SciPy's PAVA, producing the same
+        X_thresholds_/y_thresholds_ as IsotonicRegression.fit (self.isotonic
+        stays unfitted, as after loading a knots file).
+        """
+        # Average the labels of tied probabilities, weighted by count
+        x_unique, inverse, counts = np.unique(
+            raw_probs, return_inverse=True, return_counts=True
+        )
+        counts = counts.astype(np.float64)
+        y_mean = np.bincount(inverse.ravel(), weights=true_labels) / counts
+        y_fit = isotonic_regression(y_mean, weights=counts, increasing=True).x
+        
+        # _cache_thresholds drops the interior points of flat runs
+        self.isotonic = IsotonicRegression(out_of_bounds='clip')
+        self._cache_thresholds(x_unique, y_fit)
+    
+    def _interp(self, raw):
+        """
+        Isotonic mapping for a scalar or array. np.interp clamps to the end
+        knots, matching out_of_bounds='clip'.
+        """
+        if self._x_thr is None:
+            calibrated = self.isotonic.predict(np.atleast_1d(raw))
+            return calibrated if np.ndim(raw) else calibrated[0]
+        return np.interp(raw, self._x_thr, self._y_thr)
+    
+    def calibrate_batch(self, raw_probs):
+        """
+        Vectorized calibrate() for an array of raw probabilities.
+        One isotonic predict call for the whole batch; no per-sample drift
+        warnings - the caller can aggregate the mask (e.g. drift_mask.sum()).
+        
+        Returns tuple: (calibrated_probs, drift_mask)
+        """
+        raw_probs = np.asarray(raw_probs, dtype=np.float64)
+        if not self.is_fitted:
+            warnings.warn(
+                f"Calibrator {self.timeframe}: Not fitted! Returning raw probabilities.",
+                CalibrationWarning
+            )
+            return raw_probs.copy(), np.ones(raw_probs.shape, dtype=bool)
+        
+        calibrated = self._interp(raw_probs)
+        # One scratch buffer for |calibrated - raw| instead of two temporaries
+        drift = np.subtract(calibrated, raw_probs)
+        np.abs(drift, out=drift)
+        drift_mask = np.greater(drift, MAX_CALIBRATION_DRIFT)
+        return calibrated, drift_mask
+    
     def calibrate_simple(self, raw_prob):
         """
         Simple interface - returns only the calibrated probability.
-        Use when drift warning is not needed.
+        Use when drift warning is not needed. Accepts a scalar or an array.
         """
+        if np.ndim(raw_prob) > 0:
+            return self.calibrate_batch(raw_prob)[0]
+        if self.is_fitted and self._x_thr is not None:
+            # Models often repeat the same probability over consecutive bars
+            raw_prob = float(raw_prob)
+            result = self._simple_cache.get(raw_prob)
+            if result is None:
+                result = _interp_scalar(raw_prob, self._x_thr, self._y_thr)
+                if len(self._simple_cache) < SIMPLE_CACHE_SIZE:
+                    self._simple_cache[raw_prob] = result
+            return result
         result, _ = self.calibrate(raw_prob, warn_on_drift=False)
         return result
         
@@ -127,18 +357,24 @@ class ModelCalibrator:
             print(f"  ⚠️ Cannot save unfitted calibrator for {self.timeframe}")
             return False
             
-        path = os.path.join(directory, f'calibrator_{self.timeframe}.pkl')
-        
-        # Save both isotonic and stats
-        save_data = {
-            'isotonic': self.isotonic,
-            'stats': self.calibration_stats,
-            'timeframe': self.timeframe,
-            'version': '2.0'
-        }
+        if self._x_thr is None:
+            print(f"  ⚠️ Cannot save calibrator for {self.timeframe}: no fitted knots")
+            return False
+            
+        path = os.path.join(directory, f'calibrator_{self.timeframe}.npz')
         
-        with open(path, 'wb') as f:
-            pickle.dump(save_data, f)
+        # Save the isotonic knots and stats only - no sklearn object, so
+        # loading does not depend on the sklearn version.
+        # Atomic replace: never rewrite in place (backups may hardlink it)
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            np.savez(
+                f,
+                x_thr=self._x_thr,
+                y_thr=self._y_thr,
+                stats_json=json.dumps(self.calibration_stats)
+            )
+        os.replace(tmp_path, path)
         
         return True
             
@@ -147,29 +383,41 @@ class ModelCalibrator:
         Load calibrator from disk with validation.
         Returns True if loaded successfully, False otherwise.
         """
-        path = os.path.join(directory, f'calibrator_{self.timeframe}.pkl')
+        path = get_calibrator_path(directory, self.timeframe)
         
-        if not os.path.exists(path):
+        if path is None:
+            missing = os.path.join(directory, f'calibrator_{self.timeframe}.npz')
             warnings.warn(
-                f"Calibrator file not found: {path}. "
+                f"Calibrator file not found: {missing}. "
                 "Using uncalibrated probabilities.",
                 CalibrationWarning
             )
             return False
         
         try:
-            with open(path, 'rb') as f:
-                data = pickle.load(f)
+            data = _load_cached(path)
             
-            # Handle both old and new format
-            if isinstance(data, dict) and 'isotonic' in data:
-                # New format with stats
+            # Handle the knots-only formats and the sklearn-pickle formats
+            if isinstance(data, dict) and 'x_thresholds' in data:
+                # .npz / v3 pickle: knots + stats (self.isotonic stays unfitted)
+                self.isotonic = IsotonicRegression(out_of_bounds='clip')
+                self.calibration_stats = dict(data.get('stats', {}))
+                self._cache_thresholds(data['x_thresholds'], data['y_thresholds'])
+            elif isinstance(data, dict) and 'isotonic' in data:
+                # v2: sklearn object with stats
                 self.isotonic = data['isotonic']
-                self.calibration_stats = data.get('stats', {})
+                self.calibration_stats = dict(data.get('stats', {}))
+                self._cache_thresholds()
+            elif isinstance(data, ModelCalibrator):
+                # Whole pickled calibrator (older auto_daily_trainer output)
+                self.isotonic = data.isotonic
+                self.calibration_stats = dict(data.calibration_stats)
+                self._cache_thresholds()
             else:
                 # Old format - just the isotonic regressor
                 self.isotonic = data
                 self.calibration_stats = {}
+                self._cache_thresholds()
             
             self.is_fitted = True
             
@@ -194,8 +442,8 @@ class ModelCalibrator:
         """
         try:
             # Test prediction
-            test_probs = [0.3, 0.5, 0.7]
-            results = self.isotonic.predict(test_probs)
+            test_probs = np.array([0.3, 0.5, 0.7])
+            results = self._interp(test_probs)
             
             # Basic sanity checks
             if len(results) != 3:
@@ -215,18 +463,16 @@ class ModelCalibrator:
             return False
         
     def get_confidence_band(self, prob):
-        """Return LOW / MEDIUM / HIGH based on probability strength"""
-        # distance from 0.5
-        dist = abs(prob - 0.5)
-        if dist < 0.05:
-            return "VERY_LOW"   # 0.45 - 0.55
-        if dist < 0.10:
-            return "LOW"        # 0.40 - 0.60
-        if dist < 0.20:
-            return "MEDIUM"     # 0.30 - 0.70
-        if dist < 0.30:
-            return "HIGH"       # 0.20 - 0.80
-        return "VERY_HIGH"      # <0.20 or >0.80
+        """
+        Return VERY_LOW / LOW / MEDIUM / HIGH / VERY_HIGH based on distance
+        from 0.5: <0.05, <0.10, <0.20, <0.30, else.
+        """
+        return _BAND_LBL[bisect.bisect_right(_BAND_THR, abs(prob - 0.5))]
+    
+    def get_confidence_band_batch(self, probs):
+        """Vectorized get_confidence_band(); returns an array of band labels"""
+        dist = np.abs(np.asarray(probs, dtype=np.float64) - 0.5)
+        return np.take(_BAND_LBL_ARR, np.searchsorted(_BAND_THR_ARR, dist, side='right'))
     
     def get_stats(self):
         """Return calibration statistics for monitoring"""
@@ -235,3 +481,36 @@ class ModelCalibrator:
             'is_fitted': self.is_fitted,
             **self.calibration_stats
         }
+
+
+def _fit_one(calibrator, raw_probs, true_labels, return_exceptions):
+    """fit() one calibrator for fit_all(), optionally returning its exception"""
+    try:
+        return calibrator.fit(raw_probs, true_labels)
+    except Exception as e:
+        if not return_exceptions:
+            raise
+        return e
+
+
+def fit_all(calibrators_and_data, n_jobs=-1, return_exceptions=False):
+    """
+    Fit several independent calibrators (e.g. one per timeframe) in parallel.
+    
+    Args:
+        calibrators_and_data: iterable of (calibrator, raw_probs, true_labels)
+        n_jobs: joblib worker count (-1 = all cores)
+        return_exceptions: if True, a failing fit() puts its exception in the
+            results instead of raising, so the other calibrators still fit
+    
+    Returns:
+        list of fit() results (or exceptions), in input order
+    """
+    jobs = list(calibrators_and_data)
+    if len(jobs) <= 1:
+        return [_fit_one(*job, return_exceptions) for job in jobs]
+    # Threads, not processes: fit() updates each calibrator in place, and
+    # the PAVA / interpolation work runs in compiled code
+    return Parallel(n_jobs=n_jobs, backend='threading')(
+        delayed(_fit_one)(*job, return_exceptions) for job in jobs
+    )
@@ -1,35 +1,55 @@
-from news_fetcher import NewsFetcher
 from datetime import datetime
+import numpy as np
+import pandas as pd
 
-print("Checking Alpha Vantage news timestamps...")
-print("=" * 60)
-
-fetcher = NewsFetcher()
-news = fetcher.fetch_alpha_vantage_news()
-
-now = datetime.now()
-print(f"\nCurrent time: {now.isoformat()}")
-print(f"\nFetched {len(news)} articles. Analyzing timestamps:\n")
-
-ages = []
-for i, item in enumerate(news[:10], 1):
-    published_str = item.get('published', '')
-    print(f"{i}. Published: {published_str}")
-    try:
-        if 'T' in published_str:
-            pub_dt = datetime.fromisoformat(published_str.replace('Z', '+00:00'))
-            if pub_dt.tzinfo:
-                pub_dt = pub_dt.replace(tzinfo=None)
-            age_hours = (now - pub_dt).total_seconds() / 3600
-            age_minutes = (now - pub_dt).total_seconds() / 60
-            ages.append(age_minutes)
-            print(f"   Age: {age_hours:.1f} hours ({age_minutes:.0f} minutes)")
-    except Exception as e:
-        print(f"   Parse error: {e}")
-
-if ages:
-    print(f"\n" + "=" * 60)
-    print(f"SUMMARY:")
-    print(f"  Oldest news: {max(ages):.0f} minutes ({max(ages)/60:.1f} hours)")
-    print(f"  Newest news: {min(ages):.0f} minutes ({min(ages)/60:.1f} hours)")
-    print(f"\n  Recommended max_news_age_minutes: {int(max(ages)) + 60}")
+
+def news_ages_minutes(published, now):
+    """
+    Age in minutes of each ISO 8601 `published` timestamp at naive time `now`.
+
+    Timestamps may mix precisions and UTC markers ('Z', '+00:00');
+    unparseable ones are NaN in the ages and False in the parsed mask.
+
+    Returns:
+        (ages_min, parsed) float64 and bool arrays aligned with `published`
+    """
+    pub_times = pd.to_datetime(published, errors='coerce', utc=True, format='ISO8601').tz_localize(None)
+    ages_min = (np.datetime64(now) - pub_times.values) / np.timedelta64(1, 'm')
+    return ages_min, ~pd.isna(pub_times)
+
+
+def main():
+    from news_fetcher import NewsFetcher
+
+    print("Checking Alpha Vantage news timestamps...")
+    print("=" * 60)
+
+    fetcher = NewsFetcher()
+    news = fetcher.fetch_alpha_vantage_news()
+
+    now = datetime.now()
+    print(f"\nCurrent time: {now.isoformat()}")
+    print(f"\nFetched {len(news)} articles. Analyzing timestamps:\n")
+
+    # Parse all timestamps in one call; unparseable ones become NaT
+    published = [item.get('published', '') for item in news[:10]]
+    ages_min, parsed = news_ages_minutes(published, now)
+
+    for i, (published_str, ok, age_minutes) in enumerate(zip(published, parsed, ages_min), 1):
+        print(f"{i}. Published: {published_str}")
+        if ok:
+            print(f"   Age: {age_minutes / 60:.1f} hours ({age_minutes:.0f} minutes)")
+        elif published_str:
+            print(f"   Parse error: unrecognized timestamp")
+
+    ages = ages_min[parsed]
+    if len(ages):
+        print(f"\n" + "=" * 60)
+        print(f"SUMMARY:")
+        print(f"  Oldest news: {ages.max():.0f} minutes ({ages.max()/60:.1f} hours)")
+        print(f"  Newest news: {ages.min():.0f} minutes ({ages.min()/60:.1f} hours)")
+        print(f"\n  Recommended max_news_age_minutes: {int(ages.max()) + 60}")
+
+
+if __name__ == "__main__":
+    main()
@@ -15,15 +15,67 @@ Each layer logs:
 """
 
 from pathlib import Path
+import copy
+import functools
 import json
 from datetime import datetime
+from typing import NamedTuple, Optional
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+@functools.lru_cache(maxsize=8)
+def _load_config_cached(path_str, mtime_ns):
+    """Parse a config file; mtime_ns is only part of the cache key"""
+    if orjson is not None:
+        with open(path_str, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path_str, 'r') as f:
+        return json.load(f)
 
 
 def load_config():
-    """Load configuration"""
+    """
+    Load configuration.
+    
+    The parsed file is cached per (path, mtime), so repeated gate
+    construction does not re-read it while edits still take effect.
+    Each call returns its own copy, which callers may modify.
+    """
     path = Path(__file__).parent / 'config.json'
-    with open(path, 'r') as f:
-        return json.load(f)
+    return copy.deepcopy(_load_config_cached(str(path), path.stat().st_mtime_ns))
+
+
+class GateResult(NamedTuple):
+    """
+    Result of one confidence gate check.
+    
+    confirmation is set by the H4/H1 gate, entry_signal by the entry gate,
+    and drift only when a drift check blocked.
+    """
+    passed: bool
+    reason: str
+    confidence: float
+    threshold: float
+    confirmation: Optional[str] = None
+    entry_signal: Optional[str] = None
+    drift: Optional[float] = None
+    
+    def to_dict(self):
+        """Plain dict in the gate's JSON layout (unset optional keys omitted)"""
+        d = {'passed': self.passed, 'reason': self.reason}
+        if self.confirmation is not None:
+            d['confirmation'] = self.confirmation
+        if self.entry_signal is not None:
+            d['entry_signal'] = self.entry_signal
+        d['confidence'] = self.confidence
+        d['threshold'] = self.threshold
+        if self.drift is not None:
+            d['drift'] = self.drift
+        return d
 
 
 class ConfidenceGate:
@@ -32,6 +84,10 @@ class ConfidenceGate:
     
     Enforces strict confidence requirements at each layer.
     """
+    __slots__ = (
+        'config', 'gate_config',
+        '_d1_min', '_h4h1_min', '_entry_min', '_max_drift', '_block_on_drift'
+    )
     
     def __init__(self, config=None):
         """
@@ -40,16 +96,34 @@ class ConfidenceGate:
         Args:
             config: Configuration dict
         """
-        self.config = config or load_config()
+        self.reload_thresholds(config or load_config())
+    
+    def reload_thresholds(self, config=None):
+        """
+        Load the gate thresholds from a config dict into attributes.
+        
+        Called from __init__. With no config, config.json is re-read from
+        disk (the parse cache is cleared first), so file edits take effect
+        on a running gate.
+        """
+        if config is None:
+            _load_config_cached.cache_clear()
+            config = load_config()
+        self.config = config
         
         # Load confidence thresholds
-        self.gate_config = self.config.get('confidence_gates', {
+        self.gate_config = config.get('confidence_gates', {
             'd1_min_confidence': 0.55,
             'h4h1_min_confidence': 0.55,
             'entry_min_confidence': 0.60,
             'max_calibration_drift': 0.15,
             'block_on_drift': True
         })
+        self._d1_min = float(self.gate_config.get('d1_min_confidence', 0.55))
+        self._h4h1_min = float(self.gate_config.get('h4h1_min_confidence', 0.55))
+        self._entry_min = float(self.gate_config.get('entry_min_confidence', 0.60))
+        self._max_drift = float(self.gate_config.get('max_calibration_drift', 0.15))
+        self._block_on_drift = bool(self.gate_config.get('block_on_drift', True))
     
     def check_d1_gate(self, d1_bias_result):
         """
@@ -59,52 +133,47 @@ class ConfidenceGate:
             d1_bias_result: Result from D1BiasModel.predict_bias()
             
         Returns:
-            dict: {
-                'passed': bool,
-                'reason': str,
-                'confidence': float,
-                'threshold': float
-            }
+            GateResult
         """
-        min_conf = self.gate_config.get('d1_min_confidence', 0.55)
+        min_conf = self._d1_min
         confidence = d1_bias_result.get('confidence', 0.0)
         bias = d1_bias_result.get('bias', 'NEUTRAL')
         
         # Check calibration drift
         drift_check = self._check_calibration_drift(d1_bias_result)
         if drift_check['block']:
-            return {
-                'passed': False,
-                'reason': f"Calibration drift exceeds threshold: {drift_check['drift']:.2%}",
-                'confidence': confidence,
-                'threshold': min_conf,
-                'drift': drift_check['drift']
-            }
+            return GateResult(
+                passed=False,
+                reason=f"Calibration drift exceeds threshold: {drift_check['drift']:.2%}",
+                confidence=confidence,
+                threshold=min_conf,
+                drift=drift_check['drift']
+            )
         
         # Check minimum confidence
         if confidence < min_conf:
-            return {
-                'passed': False,
-                'reason': f"D1 confidence {confidence:.2%} below minimum {min_conf:.2%}",
-                'confidence': confidence,
-                'threshold': min_conf
-            }
+            return GateResult(
+                passed=False,
+                reason=f"D1 confidence {confidence:.2%} below minimum {min_conf:.2%}",
+                confidence=confidence,
+                threshold=min_conf
+            )
         
         # Check if bias is NEUTRAL
         if bias == 'NEUTRAL':
-            return {
-                'passed': False,
-                'reason': 'D1 bias is NEUTRAL',
-                'confidence': confidence,
-                'threshold': min_conf
-            }
+            return GateResult(
+                passed=False,
+                reason='D1 bias is NEUTRAL',
+                confidence=confidence,
+                threshold=min_conf
+            )
         
-        return {
-            'passed': True,
-            'reason': f"D1 bias {bias} with confidence {confidence:.2%}",
-            'confidence': confidence,
-            'threshold': min_conf
-        }
+        return GateResult(
+            passed=True,
+            reason=f"D1 bias {bias} with confidence {confidence:.2%}",
+            confidence=confidence,
+            threshold=min_conf
+        )
     
     def check_h4h1_gate(self, h4h1_confirmation_result):
         """
@@ -114,15 +183,9 @@ class ConfidenceGate:
             h4h1_confirmation_result: Result from H4H1ConfirmationModel.predict_confirmation()
             
         Returns:
-            dict: {
-                'passed': bool,
-                'reason': str,
-                'confirmation': str,
-                'confidence': float,
-                'threshold': float
-            }
+            GateResult (with confirmation)
         """
-        min_conf = self.gate_config.get('h4h1_min_confidence', 0.55)
+        min_conf = self._h4h1_min
         confirmation = h4h1_confirmation_result.get('confirmation', 'NEUTRAL')
         confidence = h4h1_confirmation_result.get('confidence', 0.0)
         
@@ -134,43 +197,43 @@ class ConfidenceGate:
         h1_drift = self._check_calibration_drift_simple(h1_result)
         
         max_drift = max(h4_drift.get('drift', 0), h1_drift.get('drift', 0))
-        if max_drift > self.gate_config.get('max_calibration_drift', 0.15):
-            return {
-                'passed': False,
-                'reason': f"H4/H1 calibration drift {max_drift:.2%} exceeds threshold",
-                'confirmation': confirmation,
-                'confidence': confidence,
-                'threshold': min_conf,
-                'drift': max_drift
-            }
+        if max_drift > self._max_drift:
+            return GateResult(
+                passed=False,
+                reason=f"H4/H1 calibration drift {max_drift:.2%} exceeds threshold",
+                confirmation=confirmation,
+                confidence=confidence,
+                threshold=min_conf,
+                drift=max_drift
+            )
         
         # Check confirmation status
         if confirmation != 'CONFIRM':
-            return {
-                'passed': False,
-                'reason': f"H4/H1 confirmation is {confirmation}, required CONFIRM",
-                'confirmation': confirmation,
-                'confidence': confidence,
-                'threshold': min_conf
-            }
+            return GateResult(
+                passed=False,
+                reason=f"H4/H1 confirmation is {confirmation}, required CONFIRM",
+                confirmation=confirmation,
+                confidence=confidence,
+                threshold=min_conf
+            )
         
         # Check minimum confidence
         if confidence < min_conf:
-            return {
-                'passed': False,
-                'reason': f"H4/H1 confidence {confidence:.2%} below minimum {min_conf:.2%}",
-                'confirmation': confirmation,
-                'confidence': confidence,
-                'threshold': min_conf
-            }
+            return GateResult(
+                passed=False,
+                reason=f"H4/H1 confidence {confidence:.2%} below minimum {min_conf:.2%}",
+                confirmation=confirmation,
+                confidence=confidence,
+                threshold=min_conf
+            )
         
-        return {
-            'passed': True,
-            'reason': f"H4/H1 CONFIRM with confidence {confidence:.2%}",
-            'confirmation': confirmation,
-            'confidence': confidence,
-            'threshold': min_conf
-        }
+        return GateResult(
+            passed=True,
+            reason=f"H4/H1 CONFIRM with confidence {confidence:.2%}",
+            confirmation=confirmation,
+            confidence=confidence,
+            threshold=min_conf
+        )
     
     def check_entry_gate(self, entry_result):
         """
@@ -180,45 +243,39 @@ class ConfidenceGate:
             entry_result: Result from M15M5EntryEngine.detect_entry()
             
         Returns:
-            dict: {
-                'passed': bool,
-                'reason': str,
-                'entry_signal': str,
-                'confidence': float,
-                'threshold': float
-            }
+            GateResult (with entry_signal)
         """
-        min_conf = self.gate_config.get('entry_min_confidence', 0.60)
+        min_conf = self._entry_min
         entry_signal = entry_result.get('entry_signal', 'NONE')
         confidence = entry_result.get('confidence', 0.0)
         
         # Check if entry signal exists
         if entry_signal == 'NONE':
-            return {
-                'passed': False,
-                'reason': entry_result.get('reason', 'No entry signal detected'),
-                'entry_signal': entry_signal,
-                'confidence': confidence,
-                'threshold': min_conf
-            }
+            return GateResult(
+                passed=False,
+                reason=entry_result.get('reason', 'No entry signal detected'),
+                entry_signal=entry_signal,
+                confidence=confidence,
+                threshold=min_conf
+            )
         
         # Check minimum confidence
         if confidence < min_conf:
-            return {
-                'passed': False,
-                'reason': f"Entry confidence {confidence:.2%} below minimum {min_conf:.2%}",
-                'entry_signal': entry_signal,
-                'confidence': confidence,
-                'threshold': min_conf
-            }
+            return GateResult(
+                passed=False,
+                reason=f"Entry confidence {confidence:.2%} below minimum {min_conf:.2%}",
+                entry_signal=entry_signal,
+                confidence=confidence,
+                threshold=min_conf
+            )
         
-        return {
-            'passed': True,
-            'reason': f"Entry signal {entry_signal} with confidence {confidence:.2%}",
-            'entry_signal': entry_signal,
-            'confidence': confidence,
-            'threshold': min_conf
-        }
+        return GateResult(
+            passed=True,
+            reason=f"Entry signal {entry_signal} with confidence {confidence:.2%}",
+            entry_signal=entry_signal,
+            confidence=confidence,
+            threshold=min_conf
+        )
     
     def check_all_gates(self, d1_bias, h4h1_confirmation, entry_signal):
         """
@@ -241,42 +298,50 @@ class ConfidenceGate:
                 'timestamp': str
             }
         """
+        timestamp = datetime.now().isoformat()
+        
+        # Most ticks fail on a plain status field - reject those before
+        # any drift arithmetic
+        rejected = self._trivial_reject(d1_bias, h4h1_confirmation, entry_signal, timestamp)
+        if rejected is not None:
+            return rejected
+        
         gate_results = {}
         
         # Gate 1: D1 Bias
         d1_gate = self.check_d1_gate(d1_bias)
-        gate_results['d1'] = d1_gate
+        gate_results['d1'] = d1_gate.to_dict()
         
-        if not d1_gate['passed']:
+        if not d1_gate.passed:
             return {
                 'trade_allowed': False,
-                'block_reason': f"D1 Gate: {d1_gate['reason']}",
+                'block_reason': f"D1 Gate: {d1_gate.reason}",
                 'gate_results': gate_results,
-                'timestamp': datetime.now().isoformat()
+                'timestamp': timestamp
             }
         
         # Gate 2: H4/H1 Confirmation
         h4h1_gate = self.check_h4h1_gate(h4h1_confirmation)
-        gate_results['h4h1'] = h4h1_gate
+        gate_results['h4h1'] = h4h1_gate.to_dict()
         
-        if not h4h1_gate['passed']:
+        if not h4h1_gate.passed:
             return {
                 'trade_allowed': False,
-                'block_reason': f"H4/H1 Gate: {h4h1_gate['reason']}",
+                'block_reason': f"H4/H1 Gate: {h4h1_gate.reason}",
                 'gate_results': gate_results,
-                'timestamp': datetime.now().isoformat()
+                'timestamp': timestamp
             }
         
         # Gate 3: Entry Signal
         entry_gate = self.check_entry_gate(entry_signal)
-        gate_results['entry'] = entry_gate
+        gate_results['entry'] = entry_gate.to_dict()
         
-        if not entry_gate['passed']:
+        if not entry_gate.passed:
             return {
                 'trade_allowed': False,
-                'block_reason': f"Entry Gate: {entry_gate['reason']}",
+                'block_reason': f"Entry Gate: {entry_gate.reason}",
                 'gate_results': gate_results,
-                'timestamp': datetime.now().isoformat()
+                'timestamp': timestamp
             }
         
         # All gates passed
@@ -284,9 +349,63 @@ class ConfidenceGate:
             'trade_allowed': True,
             'block_reason': None,
             'gate_results': gate_results,
-            'timestamp': datetime.now().isoformat()
+            'timestamp': timestamp
         }
     
+    def _trivial_reject(self, d1_bias, h4h1_confirmation, entry_signal, timestamp):
+        """
+        Fast pre-check for rejects that need no confidence or drift math:
+        no entry signal, H4/H1 not CONFIRM, or a NEUTRAL D1 bias.
+        
+        Checks the most common failure first, so the reported gate can
+        differ from the full sequence (e.g. an entry reject is reported
+        even if D1 would also have failed on drift).
+        
+        Returns:
+            Blocked check_all_gates() result with only the failing gate's
+            result, or None if the full gate sequence must run
+        """
+        if entry_signal.get('entry_signal', 'NONE') == 'NONE':
+            entry_gate = self.check_entry_gate(entry_signal)
+            return {
+                'trade_allowed': False,
+                'block_reason': f"Entry Gate: {entry_gate.reason}",
+                'gate_results': {'entry': entry_gate.to_dict()},
+                'timestamp': timestamp
+            }
+        
+        confirmation = h4h1_confirmation.get('confirmation', 'NEUTRAL')
+        if confirmation != 'CONFIRM':
+            h4h1_gate = GateResult(
+                passed=False,
+                reason=f"H4/H1 confirmation is {confirmation}, required CONFIRM",
+                confirmation=confirmation,
+                confidence=h4h1_confirmation.get('confidence', 0.0),
+                threshold=self._h4h1_min
+            )
+            return {
+                'trade_allowed': False,
+                'block_reason': f"H4/H1 Gate: {h4h1_gate.reason}",
+                'gate_results': {'h4h1': h4h1_gate.to_dict()},
+                'timestamp': timestamp
+            }
+        
+        if d1_bias.get('bias', 'NEUTRAL') == 'NEUTRAL':
+            d1_gate = GateResult(
+                passed=False,
+                reason='D1 bias is NEUTRAL',
+                confidence=d1_bias.get('confidence', 0.0),
+                threshold=self._d1_min
+            )
+            return {
+                'trade_allowed': False,
+                'block_reason': f"D1 Gate: {d1_gate.reason}",
+                'gate_results': {'d1': d1_gate.to_dict()},
+                'timestamp': timestamp
+            }
+        
+        return None
+    
     def _check_calibration_drift(self, result):
         """
         Check calibration drift for a result.
@@ -304,11 +423,9 @@ class ConfidenceGate:
         calibrated_prob = result.get('calibrated_probability', 0.5)
         
         drift = abs(raw_prob - calibrated_prob)
-        max_drift = self.gate_config.get('max_calibration_drift', 0.15)
-        block_on_drift = self.gate_config.get('block_on_drift', True)
         
         return {
-            'block': block_on_drift and drift > max_drift,
+            'block': self._block_on_drift and drift > self._max_drift,
             'drift': drift
         }
     
@@ -7,13 +7,21 @@ import json
 import os
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 def configure_news_keys():
     """Interactive script to configure news API keys"""
     config_path = Path(__file__).parent / 'config.json'
     
-    # Load current config
-    with open(config_path, 'r') as f:
-        config = json.load(f)
+    # Load current config (orjson's C parser when available)
+    if orjson is not None:
+        config = orjson.loads(config_path.read_bytes())
+    else:
+        with open(config_path, 'r') as f:
+            config = json.load(f)
     
     news_config = config.get('news', {})
     api_keys = news_config.get('api_keys', {})
@@ -73,8 +81,11 @@ def configure_news_keys():
     config['news'] = news_config
     
     # Save
-    with open(config_path, 'w') as f:
-        json.dump(config, f, indent=2)
+    if orjson is not None:
+        config_path.write_bytes(orjson.dumps(config, option=orjson.OPT_INDENT_2))
+    else:
+        with open(config_path, 'w') as f:
+            json.dump(config, f, indent=2)
     
     print("\n" + "=" * 60)
     print("Configuration saved!")
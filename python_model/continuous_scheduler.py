@@ -10,6 +10,7 @@ Features:
 - Can be run as Windows service or background process
 """
 
+import logging
 import time
 import threading
 from datetime import datetime, timedelta
@@ -22,6 +23,8 @@ from daily_csv_update import update_gold_data_csv
 from daily_model_update import daily_model_learning
 from update_logger import UpdateLogger
 
+log = logging.getLogger(__name__)
+
 
 class ContinuousScheduler:
     """
@@ -34,9 +37,16 @@ class ContinuousScheduler:
     MARKET_CLOSE_HOUR = 17  # 5 PM ET
     MARKET_CLOSE_MINUTE = 0
     
-    # Check interval (seconds) - check every minute
+    # Market reopens Sunday 6 PM ET
+    MARKET_REOPEN_HOUR = 18
+    
+    # Retry interval (seconds) after a failed update run
     CHECK_INTERVAL = 60
     
+    # Longest single sleep (seconds) - the next deadline is recomputed on
+    # every wake, so clock changes are picked up within the hour
+    MAX_SLEEP = 3600
+    
     def __init__(self, config=None):
         """
         Initialize continuous scheduler.
@@ -59,6 +69,14 @@ class ContinuousScheduler:
             self.market_close_minute = self.MARKET_CLOSE_MINUTE
             self.check_interval = self.CHECK_INTERVAL
         
+        # Weekday -> [start, end) hours the market is closed; the single
+        # source for is_market_closed() and _next_deadline()
+        self._closed_hours = {
+            4: (self.market_close_hour, 24),      # Friday after close
+            5: (0, 24),                           # Saturday
+            6: (0, self.MARKET_REOPEN_HOUR)       # Sunday before open
+        }
+        
         # Track execution state
         self.last_execution_date = None
         self.execution_count = 0
@@ -77,28 +95,14 @@ class ContinuousScheduler:
         except Exception as e:
             print(f"  ⚠️ Could not load last execution date: {e}")
     
-    def is_market_closed(self):
+    def is_market_closed(self, now=None):
         """
         Check if market has closed for the day.
         Gold market closes Friday 5 PM ET, reopens Sunday 6 PM ET.
         """
-        now = datetime.now()
-        
-        # Friday after market close
-        if now.weekday() == 4:  # Friday
-            if now.hour >= self.market_close_hour:
-                return True
-        
-        # Saturday (market closed)
-        if now.weekday() == 5:
-            return True
-        
-        # Sunday before market open
-        if now.weekday() == 6:
-            if now.hour < 18:  # Before 6 PM ET
-                return True
-        
-        return False
+        now = now or datetime.now()
+        window = self._closed_hours.get(now.weekday())
+        return window is not None and window[0] <= now.hour < window[1]
     
     def should_execute_daily_updates(self):
         """
@@ -106,28 +110,28 @@ class ContinuousScheduler:
         Executes once per day after market close.
         """
         now = datetime.now()
-        today = now.date()
-        
-        # Don't execute if already executed today
-        if self.last_execution_date == today:
-            return False
-        
-        # Only execute after market close
-        if not self.is_market_closed():
-            return False
-        
-        # Execute if it's Friday after close, or Saturday, or Sunday before open
-        # But only once per day
-        if now.weekday() == 4:  # Friday
-            if now.hour >= self.market_close_hour:
-                return True
-        elif now.weekday() == 5:  # Saturday
-            return True
-        elif now.weekday() == 6:  # Sunday
-            if now.hour < 18:
-                return True
-        
-        return False
+        return self.last_execution_date != now.date() and self.is_market_closed(now)
+    
+    def _next_deadline(self, now=None):
+        """
+        Earliest time at or after `now` when should_execute_daily_updates()
+        becomes true: Friday from the close hour, all of Saturday, or Sunday
+        before 18:00 - skipping the day that already ran.
+        """
+        now = now or datetime.now()
+        for offset in range(8):
+            day = now.date() + timedelta(days=offset)
+            if day == self.last_execution_date:
+                continue
+            window = self._closed_hours.get(day.weekday())
+            if window is None:
+                continue
+            midnight = datetime(day.year, day.month, day.day)
+            start = max(midnight + timedelta(hours=window[0]), now)
+            end = midnight + timedelta(hours=window[1])
+            if start < end:
+                return start
+        return now + timedelta(seconds=self.MAX_SLEEP)
     
     def execute_daily_updates(self):
         """
@@ -169,42 +173,45 @@ class ContinuousScheduler:
             
             return True
             
-        except Exception as e:
-            print(f"❌ Error executing daily updates: {e}")
-            import traceback
-            traceback.print_exc()
+        except Exception:
+            log.exception("❌ Error executing daily updates")
             self.error_count += 1
             return False
     
     def _scheduler_loop(self):
         """Main scheduler loop (runs in background thread)"""
         print(f"🚀 Continuous Scheduler Started")
-        print(f"   Check interval: {self.check_interval}s")
+        print(f"   Retry interval: {self.check_interval}s")
         print(f"   Market close: {self.market_close_hour:02d}:{self.market_close_minute:02d}")
         print(f"   Last execution: {self.last_execution_date or 'Never'}")
         print(f"{'='*70}\n")
         
         while not self._stop_event.is_set():
+            # Retry after check_interval unless we know the next deadline
+            wait = self.check_interval
             try:
-                # Check if we should execute daily updates
-                if self.should_execute_daily_updates():
-                    self.execute_daily_updates()
+                # The next deadline is `now` itself while an update is due
+                # (same rule as should_execute_daily_updates)
+                now = datetime.now()
+                next_run = self._next_deadline(now)
+                if next_run <= now:
+                    if self.execute_daily_updates():
+                        wait = 0  # Done for today - go straight to the next deadline
                 else:
-                    # Log status periodically (every hour)
-                    now = datetime.now()
-                    if now.minute == 0:
-                        print(f"⏰ {now.strftime('%Y-%m-%d %H:%M:%S')} - Scheduler running "
-                              f"(Last execution: {self.last_execution_date or 'Never'}, "
-                              f"Executions: {self.execution_count}, Errors: {self.error_count})")
+                    # Sleep until the next update window opens (at most
+                    # MAX_SLEEP) instead of polling every minute
+                    wait = min((next_run - now).total_seconds(), self.MAX_SLEEP)
+                    print(f"⏰ {now.strftime('%Y-%m-%d %H:%M:%S')} - Scheduler running "
+                          f"(Next run: {next_run.strftime('%Y-%m-%d %H:%M')}, "
+                          f"Last execution: {self.last_execution_date or 'Never'}, "
+                          f"Executions: {self.execution_count}, Errors: {self.error_count})")
                 
-            except Exception as e:
-                print(f"❌ Scheduler error: {e}")
-                import traceback
-                traceback.print_exc()
+            except Exception:
+                log.exception("❌ Scheduler error")
                 self.error_count += 1
             
-            # Wait for next check
-            self._stop_event.wait(self.check_interval)
+            # Wait for next check (returns early on stop())
+            self._stop_event.wait(max(wait, 0))
         
         print("🛑 Continuous Scheduler Stopped")
     
@@ -264,7 +271,7 @@ class ContinuousScheduler:
             "error_count": self.error_count,
             "market_closed": self.is_market_closed(),
             "check_interval": self.check_interval,
-            "next_check": datetime.now() + timedelta(seconds=self.check_interval)
+            "next_check": self._next_deadline()
         }
 
 
@@ -278,6 +285,8 @@ def main():
     """Main entry point for continuous scheduler"""
     import argparse
     
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    
     parser = argparse.ArgumentParser(
         description='Continuous Daily Update Scheduler',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -299,7 +308,7 @@ Examples:
     parser.add_argument('--status', action='store_true',
                         help='Show status and exit')
     parser.add_argument('--check-interval', type=int, default=60,
-                        help='Check interval in seconds (default: 60)')
+                        help='Retry interval in seconds after a failed update (default: 60)')
     parser.add_argument('--market-close-hour', type=int, default=17,
                         help='Market close hour (default: 17 for 5 PM ET)')
     parser.add_argument('--market-close-minute', type=int, default=0,
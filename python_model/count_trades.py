@@ -1,10 +1,13 @@
+import numpy as np
 import pandas as pd
-from datetime import datetime
-from collections import defaultdict
 
-# Read CSV with more error tolerance
+# Read CSV with more error tolerance (only the columns used below)
 try:
-    df = pd.read_csv('forward_test_log.csv', on_bad_lines='skip')
+    df = pd.read_csv(
+        'forward_test_log.csv',
+        usecols=['timestamp', 'timeframe', 'decision'],
+        on_bad_lines='skip'
+    )
 except:
     # Alternative: manually parse
     with open('forward_test_log.csv') as f:
@@ -33,31 +36,35 @@ if len(df) > 0:
     print("TRADE FREQUENCY ANALYSIS")
     print("=" * 60)
     
-    trades = df[df['decision'].str.contains('TRADE', na=False)]
-    no_trades = df[df['decision'].str.contains('NO_TRADE', na=False)]
+    # Classify each distinct decision once, then map the flags onto rows
+    # by category code; NO_TRADE also contains 'TRADE', so it is excluded
+    # from the trade mask. Missing decisions (code -1) hit the trailing False
+    decision = df['decision'].astype('category').cat
+    codes = decision.codes.to_numpy()
+    categories = decision.categories.astype(str)
+    no_trade_flags = np.asarray(categories.str.contains('NO_TRADE', regex=False), dtype=bool)
+    trade_flags = np.asarray(categories.str.contains('TRADE', regex=False), dtype=bool) & ~no_trade_flags
+    is_no_trade = np.append(no_trade_flags, False)[codes]
+    is_trade = np.append(trade_flags, False)[codes]
+    trades = df.loc[is_trade]
+    no_trades = df.loc[is_no_trade]
     
     print(f"\nTotal Signals: {len(df):,}")
     print(f"TRADE Signals: {len(trades):,} ({len(trades)/len(df)*100:.1f}%)")
     print(f"NO_TRADE Signals: {len(no_trades):,} ({len(no_trades)/len(df)*100:.1f}%)")
     
-    # Extract date and count
-    df['date'] = df['timestamp'].str[:10]
-    
-    trades_by_date = trades.groupby('date').size()
+    # Count per date / timeframe (groupby sorts the keys)
+    trades_by_date = trades.groupby(trades['timestamp'].str.slice(0, 10)).size()
     trades_by_timeframe = trades.groupby('timeframe').size()
     
     print(f"\nTRADES BY DATE:")
-    total_trading_dates = 0
-    total_trades = 0
-    for date in sorted(trades_by_date.index):
-        count = trades_by_date[date]
+    for date, count in trades_by_date.items():
         print(f"  {date}: {count} trades")
-        total_trades += count
-        total_trading_dates += 1
+    total_trading_dates = len(trades_by_date)
+    total_trades = int(trades_by_date.sum())
     
     print(f"\nTRADES BY TIMEFRAME:")
-    for tf in sorted(trades_by_timeframe.index):
-        count = trades_by_timeframe[tf]
+    for tf, count in trades_by_timeframe.items():
         print(f"  {tf}: {count} trades ({count/len(trades)*100:.1f}%)")
     
     if total_trading_dates > 0:
@@ -10,14 +10,17 @@ Restrictions:
 
 import pandas as pd
 import numpy as np
-import pickle
 from pathlib import Path
 import json
+import logging
 from datetime import datetime
 
 from data_manager import get_data_manager
-from features import compute_indicators, get_feature_columns
+from features import compute_indicators_tail, get_feature_columns
 from calibration import ModelCalibrator
+from model_io import get_model_path, load_booster
+
+log = logging.getLogger(__name__)
 
 
 def load_config():
@@ -37,6 +40,7 @@ class D1BiasModel:
     """
     
     TIMEFRAME = '1d'
+    LOOKBACK = 300  # Bars of history the indicators are computed on
     
     def __init__(self, config=None):
         """
@@ -52,8 +56,19 @@ class D1BiasModel:
         # Load model and calibrator
         self.model = None
         self.calibrator = None
+        self._model_mtime = None
         self._load_artifacts()
         
+        # Model feature columns, and the subset present in the last frame
+        # of indicators (keyed on that frame's columns)
+        self._feature_cols = get_feature_columns()
+        self._active_cols = None
+        self._active_cols_key = None
+        
+        # Last prediction, reused while the latest bar and model are unchanged
+        self._cache = None
+        self._cache_key = None
+        
         # Bias thresholds from config
         self.bias_config = self.config.get('d1_bias', {
             'min_confidence': 0.55,
@@ -64,13 +79,12 @@ class D1BiasModel:
     def _load_artifacts(self):
         """Load trained model and calibrator"""
         # Load model
-        model_path = self.base_dir / f'xgb_{self.TIMEFRAME}.pkl'
-        if model_path.exists():
-            try:
-                with open(model_path, 'rb') as f:
-                    self.model = pickle.load(f)
-            except Exception as e:
-                print(f"⚠️ Failed to load D1 model: {e}")
+        try:
+            self.model = load_booster(self.base_dir, self.TIMEFRAME)
+            if self.model is not None:
+                self._model_mtime = get_model_path(self.base_dir, self.TIMEFRAME).stat().st_mtime
+        except Exception as e:
+            print(f"⚠️ Failed to load D1 model: {e}")
         
         # Load calibrator
         self.calibrator = ModelCalibrator(self.TIMEFRAME)
@@ -98,7 +112,7 @@ class D1BiasModel:
             if update_data:
                 self.data_manager.fetch_incremental_update(self.TIMEFRAME)
             
-            df = self.data_manager.get_data_for_prediction(self.TIMEFRAME, lookback=300)
+            df = self.data_manager.get_data_for_prediction(self.TIMEFRAME, lookback=self.LOOKBACK)
             
             if df is None or len(df) < 200:
                 return {
@@ -110,13 +124,24 @@ class D1BiasModel:
                     'timestamp': datetime.now().isoformat()
                 }
             
-            # Compute features
-            df_features = compute_indicators(df)
-            feature_cols = get_feature_columns()
-            feature_cols = [c for c in feature_cols if c in df_features.columns]
+            # A daily bias only changes when the latest bar does (its values
+            # included - the current bar may still be forming) or the model
+            # is reloaded
+            cache_key = (df.index[-1], tuple(df.iloc[-1].tolist()), self._model_mtime)
+            if self._cache is not None and cache_key == self._cache_key:
+                return {**self._cache, 'timestamp': datetime.now().isoformat()}
+            
+            # Compute features (only the latest row is used)
+            df_features = compute_indicators_tail(df, warmup=self.LOOKBACK)
+            columns = tuple(df_features.columns)
+            if columns != self._active_cols_key:
+                present = set(columns)
+                self._active_cols = [c for c in self._feature_cols if c in present]
+                self._active_cols_key = columns
+            feature_cols = self._active_cols
             
             # Get latest features
-            latest_features = df_features[feature_cols].iloc[-1:].values
+            latest_features = df_features[feature_cols].iloc[-1:].to_numpy(dtype=np.float32)
             
             if self.model is None:
                 return {
@@ -128,8 +153,8 @@ class D1BiasModel:
                     'timestamp': datetime.now().isoformat()
                 }
             
-            # Predict
-            raw_prob = self.model.predict_proba(latest_features)[0, 1]
+            # Predict (binary:logistic already returns P(UP))
+            raw_prob = float(self.model.inplace_predict(latest_features)[0])
             
             # Calibrate
             if self.calibrator and hasattr(self.calibrator, 'calibrate'):
@@ -157,17 +182,19 @@ class D1BiasModel:
                 bias = 'NEUTRAL'
                 confidence = 0.0
             
-            return {
+            result = {
                 'bias': bias,
                 'confidence': float(confidence),
                 'raw_probability': float(raw_prob),
                 'calibrated_probability': float(calibrated_prob),
                 'timestamp': datetime.now().isoformat()
             }
+            self._cache = dict(result)
+            self._cache_key = cache_key
+            return result
             
         except Exception as e:
-            import traceback
-            traceback.print_exc()
+            log.exception("❌ D1 bias prediction failed")
             return {
                 'bias': 'NEUTRAL',
                 'confidence': 0.0,
@@ -184,6 +211,8 @@ class D1BiasModel:
 
 def main():
     """Test D1 bias model"""
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    
     model = D1BiasModel()
     result = model.predict_bias()
     
@@ -11,6 +11,9 @@ Features:
 
 import pandas as pd
 import json
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
 import sys
@@ -18,6 +21,57 @@ import sys
 from data_manager import get_data_manager
 from update_logger import UpdateLogger
 
+log = logging.getLogger(__name__)
+
+
+def sync_legacy_csv(df, path):
+    """
+    Bring a CSV written by df.to_csv() up to date with df.
+    
+    Only the file's last row (the bar may have still been forming when it
+    was written) and the rows after it are rewritten; if df has no row for
+    that date, the stored row is kept and the newer rows appended. The
+    whole file is rewritten if it is missing, empty, has different columns
+    or its last date can't be compared with df's index.
+    
+    Returns:
+        Number of rows added to the file
+    """
+    header = df.iloc[:0].to_csv().encode()
+    
+    if path.exists():
+        with open(path, 'rb+') as f:
+            if f.readline() == header:
+                # Byte offset of the last data row
+                offset = last_start = f.tell()
+                last_line = None
+                for line in f:
+                    last_start = offset
+                    offset += len(line)
+                    last_line = line
+                
+                try:
+                    last_date = pd.Timestamp(last_line.split(b',', 1)[0].decode())
+                    newer = df[df.index > last_date]
+                    replace_last = last_date in df.index
+                except (AttributeError, ValueError, TypeError):
+                    newer = None
+                
+                if newer is not None:
+                    if replace_last:
+                        # Rewrite the stored last bar with its current values
+                        f.seek(last_start)
+                        f.truncate()
+                        f.write(df[df.index >= last_date].to_csv(header=False).encode())
+                    elif not newer.empty:
+                        # Last stored bar is not in df (gap) - keep it
+                        f.seek(0, os.SEEK_END)
+                        f.write(newer.to_csv(header=False).encode())
+                    return len(newer)
+    
+    df.to_csv(path)
+    return len(df)
+
 
 def update_gold_data_csv(timeframe=None, force=False, all_timeframes=True):
     """
@@ -70,10 +124,15 @@ def update_gold_data_csv(timeframe=None, force=False, all_timeframes=True):
         
         total_rows = 0
         
-        # Update each timeframe
-        for tf in timeframes_to_update:
-            print(f"\n  📡 Updating {tf} timeframe...")
-            df_new, new_rows_count = data_manager.fetch_incremental_update(tf)
+        # Fetches are network-bound, so overlap them on threads (the data
+        # manager serializes its cache writes); results are handled in order
+        print(f"\n  📡 Updating {', '.join(timeframes_to_update)} timeframes...")
+        with ThreadPoolExecutor(max_workers=len(timeframes_to_update)) as pool:
+            updates = [pool.submit(data_manager.fetch_incremental_update, tf)
+                       for tf in timeframes_to_update]
+        
+        for tf, update in zip(timeframes_to_update, updates):
+            df_new, new_rows_count = update.result()
         
             if df_new is None or df_new.empty:
                 print(f"     ⚠️ No data available for {tf}")
@@ -98,8 +157,8 @@ def update_gold_data_csv(timeframe=None, force=False, all_timeframes=True):
             df_d1 = data_manager.get_cached_data('1d')
             if df_d1 is not None and not df_d1.empty:
                 print(f"\n  💾 Updating legacy gold_data.csv (D1 data)...")
-                df_d1.to_csv(legacy_path)
-                print(f"     ✓ Legacy CSV updated: {len(df_d1)} rows")
+                rows_appended = sync_legacy_csv(df_d1, legacy_path)
+                print(f"     ✓ Legacy CSV updated: {rows_appended} new rows ({len(df_d1)} total)")
         
         # Update result
         result['status'] = 'success' if total_rows > 0 else 'no_new_data'
@@ -113,9 +172,7 @@ def update_gold_data_csv(timeframe=None, force=False, all_timeframes=True):
         return result
         
     except Exception as e:
-        print(f"  ❌ Error updating CSV: {e}")
-        import traceback
-        traceback.print_exc()
+        log.exception("  ❌ Error updating CSV")
         
         result['status'] = 'failed'
         result['error'] = str(e)
@@ -128,6 +185,8 @@ def main():
     """Main entry point"""
     import argparse
     
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    
     parser = argparse.ArgumentParser(description='Daily CSV Update')
     parser.add_argument('--timeframe', '-t', type=str, default=None,
                         help='Specific timeframe to update (default: all)')
@@ -20,6 +20,12 @@ from pathlib import Path
 import threading
 import time
 
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pv
+except ImportError:
+    pv = None
+
 # Lock for thread-safe file operations
 _data_lock = threading.Lock()
 
@@ -366,6 +372,32 @@ def get_data_manager(symbol='GC=F'):
     return _data_manager_instance
 
 
+PRICE_COLUMNS = ('Open', 'High', 'Low', 'Close')
+
+
+def load_price_csv(path, columns=None):
+    """
+    Load an OHLCV CSV (e.g. gold_data.csv) with Date parsed as datetime.
+    Uses pyarrow's multithreaded parser with a typed schema if available.
+
+    Args:
+        path: CSV file path
+        columns: optional list of columns to read (default: all)
+    """
+    if pv is not None:
+        column_types = {'Date': pa.timestamp('ns')}
+        column_types.update({col: pa.float64() for col in PRICE_COLUMNS})
+        convert_options = pv.ConvertOptions(column_types=column_types, include_columns=columns)
+        table = pv.read_csv(path, convert_options=convert_options)
+        return table.to_pandas()
+    return pd.read_csv(
+        path,
+        usecols=columns,
+        parse_dates=['Date'],
+        dtype={col: 'float64' for col in PRICE_COLUMNS}
+    )
+
+
 if __name__ == "__main__":
     # Test data manager
     dm = DataManager()
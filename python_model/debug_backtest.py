@@ -4,11 +4,12 @@ Debug Backtest - Check Model Predictions
 
 import pandas as pd
 import numpy as np
-import pickle
+from model_io import load_model
+from calibration import ModelCalibrator
 from features import compute_indicators
+from data_manager import load_price_csv
 
-df = pd.read_csv('gold_data.csv')
-df['Date'] = pd.to_datetime(df['Date'])
+df = load_price_csv('gold_data.csv')
 df = df.sort_values('Date')
 df = df[df['Date'] >= '2023-01-01'].reset_index(drop=True)
 df = df.set_index(pd.to_datetime(df['Date']))
@@ -16,8 +17,14 @@ df = df[df['Date'] >= '2023-01-01']
 
 df = compute_indicators(df)
 
-model = pickle.load(open('xgb_1d.pkl', 'rb'))
-calibrator = pickle.load(open('calibrator_1d.pkl', 'rb'))
+model = load_model('.', '1d')
+if model is None:
+    print("❌ No usable 1d model (xgb_1d.ubj or .pkl)")
+    exit(1)
+calibrator = ModelCalibrator('1d')
+if not calibrator.load('.'):
+    print("❌ No usable 1d calibrator (calibrator_1d.npz or .pkl)")
+    exit(1)
 
 features = [
     'Close', 'High', 'Low', 'Open', 'Volume',
@@ -32,12 +39,13 @@ print("Analyzing model predictions...")
 print()
 
 confs = []
-for i in range(min(100, len(df_clean))):
-    row = df_clean.iloc[i]
-    X = row[features].values.reshape(1, -1)
+# Plain tuples of the feature columns (no per-row Series construction)
+feature_rows = df_clean[features].head(100).itertuples(index=False, name=None)
+for i, values in enumerate(feature_rows):
+    X = np.array(values, dtype=np.float64).reshape(1, -1)
     
     prob = model.predict_proba(X)[0][1]
-    prob_cal = calibrator.predict([[prob]])[0]
+    prob_cal = calibrator.calibrate_simple(prob)
     
     direction = "UP" if prob >= 0.5 else "DOWN"
     conf_raw = (prob if prob >= 0.5 else 1-prob) * 100
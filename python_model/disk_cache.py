@@ -0,0 +1,73 @@
+"""
+Disk Cache Module
+Shared on-disk memoization for the backtest caches (predictions, resampled
+candles, indicator frames).
+
+Each entry is one file cache/{prefix}{key}{suffix}. Entries are written to
+a temp file and atomically swapped in; a hit refreshes the file's mtime, and
+every write prunes the prefix down to its most recently used files, so the
+cache directory does not grow without bound as data and models change.
+"""
+import logging
+import os
+from pathlib import Path
+
+CACHE_DIR = Path(__file__).parent / 'cache'
+
+# Files kept per prefix after a write
+CACHE_KEEP = 8
+
+log = logging.getLogger(__name__)
+
+
+def load_or_compute(prefix, key, suffix, compute, read, write, keep=CACHE_KEEP):
+    """
+    Return compute(), memoized in CACHE_DIR / f'{prefix}{key}{suffix}'.
+
+    Args:
+        prefix: file name prefix shared by all entries of one cache (pruning
+            only ever touches files with this prefix and suffix)
+        key: string identifying the inputs, e.g. a content hash
+        compute: zero-argument function producing the value
+        read: read(path) -> value
+        write: write(value, path); path is a temp file in the cache directory
+        keep: entries of this prefix to keep after writing a new one
+
+    Unreadable entries are recomputed and failed writes only cost the cache;
+    both are logged as warnings.
+    """
+    path = CACHE_DIR / f'{prefix}{key}{suffix}'
+    if path.exists():
+        try:
+            value = read(path)
+            os.utime(path)  # Most recently used
+            return value
+        except Exception as e:
+            log.warning("Ignoring unreadable cache file %s: %s", path.name, e)
+
+    value = compute()
+    try:
+        CACHE_DIR.mkdir(exist_ok=True)
+        tmp_path = path.with_name(path.name + '.tmp')
+        write(value, tmp_path)
+        os.replace(tmp_path, path)
+        prune(prefix, suffix, keep)
+    except Exception as e:
+        log.warning("Failed to write cache file %s: %s", path.name, e)
+    return value
+
+
+def prune(prefix, suffix, keep=CACHE_KEEP):
+    """Delete all but the `keep` most recently used cache files of a prefix"""
+    entries = []
+    for path in CACHE_DIR.glob(f'{prefix}*{suffix}'):
+        try:
+            entries.append((path.stat().st_mtime, path))
+        except FileNotFoundError:
+            pass  # Pruned concurrently
+    entries.sort(reverse=True)
+    for _, path in entries[keep:]:
+        try:
+            path.unlink()
+        except FileNotFoundError:
+            pass
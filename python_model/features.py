@@ -2,10 +2,26 @@
 Feature Engineering Module for Gold Price Prediction.
 Shared logic for training and inference to ensure consistency.
 """
+import hashlib
+import inspect
+
 import pandas as pd
 import numpy as np
 import ta
 
+from disk_cache import load_or_compute
+
+try:
+    import pyarrow.parquet as pq
+except ImportError:
+    pq = None
+
+# Bars compute_indicators_tail() keeps by default. EMA_200 needs 200 bars
+# before it is defined at all, and the recursive indicators (EMAs, ADX,
+# TSI) keep drifting with every extra bar of history, so the last row is
+# only reproducible for a fixed warmup length
+INDICATOR_WARMUP_BARS = 300
+
 def compute_indicators(df):
     """
     Compute wealth of technical indicators for Gold Price Prediction.
@@ -117,6 +133,35 @@ def compute_indicators(df):
     
     return df.dropna()
 
+def compute_indicators_tail(df, warmup=INDICATOR_WARMUP_BARS):
+    """
+    compute_indicators() on only the last `warmup` bars, for callers that
+    need just the latest feature rows.
+    
+    The result's last row depends on `warmup` through the recursive
+    indicators - use the same value wherever predictions must match.
+    """
+    return compute_indicators(df.iloc[-warmup:])
+
+def cached_compute_indicators(df):
+    """
+    compute_indicators() with a Parquet cache for repeated script runs.
+    
+    The cache file is keyed on a hash of the input frame and
+    FEATURE_SET_VERSION, so any change to the data or the feature code
+    misses the cache; old entries are pruned (see disk_cache). Without
+    pyarrow this is a plain compute_indicators().
+    """
+    if pq is None:
+        return compute_indicators(df)
+    
+    data_hash = hashlib.sha1(pd.util.hash_pandas_object(df).values).hexdigest()[:12]
+    return load_or_compute(
+        'indicators_', f'v{FEATURE_SET_VERSION}_{data_hash}', '.parquet',
+        lambda: compute_indicators(df),
+        pd.read_parquet, lambda result, path: result.to_parquet(path)
+    )
+
 def get_feature_columns():
     """Return list of column names used for training - REDUCED SET to prevent overfitting"""
     # Using only the most stable and predictive indicators
@@ -141,3 +186,9 @@ def get_feature_columns():
         # Lagged returns
         'Ret_1'
     ]
+
+# Identifies the feature code for cache keys: editing compute_indicators()
+# or the feature list changes it, so stale indicator frames are never reused
+FEATURE_SET_VERSION = hashlib.sha1(
+    (inspect.getsource(compute_indicators) + ','.join(get_feature_columns())).encode()
+).hexdigest()[:8]
@@ -13,7 +13,6 @@ Rules:
 
 import pandas as pd
 import numpy as np
-import pickle
 from pathlib import Path
 import json
 from datetime import datetime
@@ -21,6 +20,7 @@ from datetime import datetime
 from data_manager import get_data_manager
 from features import compute_indicators, get_feature_columns
 from calibration import ModelCalibrator
+from model_io import get_model_path, load_model
 
 
 def load_config():
@@ -72,11 +72,9 @@ class H4H1ConfirmationModel:
         """Load trained models and calibrators for H4 and H1"""
         for tf in [self.PRIMARY_TIMEFRAME, self.SECONDARY_TIMEFRAME]:
             # Load model
-            model_path = self.base_dir / f'xgb_{tf}.pkl'
-            if model_path.exists():
+            if get_model_path(self.base_dir, tf) is not None:
                 try:
-                    with open(model_path, 'rb') as f:
-                        self.models[tf] = pickle.load(f)
+                    self.models[tf] = load_model(self.base_dir, tf)
                 except Exception as e:
                     print(f"[WARN] Failed to load {tf} model: {e}")
             
@@ -12,7 +12,6 @@ UPDATED:
 import os
 import json
 import sys
-import pickle
 from pathlib import Path
 from datetime import datetime
 
@@ -44,6 +43,9 @@ def check_model_files():
     """Check if trained models exist for all timeframes"""
     print("\n🤖 Checking model files...")
     
+    from model_io import get_model_path
+    from calibration import get_calibrator_path
+    
     timeframes = ['15m', '30m', '1h', '4h', '1d']
     base_path = Path(__file__).parent
     
@@ -51,19 +53,20 @@ def check_model_files():
     missing = []
     
     for tf in timeframes:
-        model_path = base_path / f'xgb_{tf}.pkl'
-        calib_path = base_path / f'calibrator_{tf}.pkl'
+        # Same lookup as the predictors: newest of .ubj / legacy .pkl
+        model_path = get_model_path(base_path, tf)
+        calib_path = get_calibrator_path(base_path, tf)
         
-        if model_path.exists():
+        if model_path is not None:
             size_mb = model_path.stat().st_size / (1024 * 1024)
-            print(f"  ✓ Model {tf:4s}: {size_mb:.2f} MB")
+            print(f"  ✓ Model {tf:4s}: {size_mb:.2f} MB ({model_path.name})")
             found += 1
         else:
             print(f"  ✗ Model {tf:4s}: NOT FOUND")
-            missing.append(f'xgb_{tf}.pkl')
+            missing.append(f'xgb_{tf}.ubj')
             
-        if calib_path.exists():
-            print(f"  ✓ Calibrator {tf:4s}")
+        if calib_path is not None:
+            print(f"  ✓ Calibrator {tf:4s} ({Path(calib_path).name})")
         else:
             print(f"  ⚠ Calibrator {tf:4s}: NOT FOUND (will use uncalibrated)")
     
@@ -78,27 +81,37 @@ def check_calibrators():
     valid = 0
     
     for tf in timeframes:
-        calib_path = base_path / f'calibrator_{tf}.pkl'
-        
-        if not calib_path.exists():
-            continue
-            
         try:
-            with open(calib_path, 'rb') as f:
-                data = pickle.load(f)
+            import numpy as np
+            from calibration import get_calibrator_path, read_calibrator_file
             
-            # Check if it's new format with stats
-            if isinstance(data, dict) and 'isotonic' in data:
-                iso = data['isotonic']
+            # Same file ModelCalibrator.load() picks: newest of .npz / legacy .pkl
+            calib_path = get_calibrator_path(base_path, tf)
+            if calib_path is None:
+                continue
+            
+            data = read_calibrator_file(calib_path)
+            
+            # Check which format it is
+            if isinstance(data, dict) and 'x_thresholds' in data:
+                stats = data.get('stats', {})
+                print(f"  ✓ {tf:4s}: knots format, {stats.get('n_samples', 'N/A')} samples")
+                test_result = np.interp(0.5, data['x_thresholds'], data['y_thresholds'])
+            elif isinstance(data, dict) and 'isotonic' in data:
                 stats = data.get('stats', {})
                 print(f"  ✓ {tf:4s}: v2.0 format, {stats.get('n_samples', 'N/A')} samples")
+                test_result = data['isotonic'].predict([0.5])[0]
+            elif hasattr(data, 'calibrate_simple'):
+                # Whole pickled ModelCalibrator
+                stats = data.calibration_stats or {}
+                print(f"  ✓ {tf:4s}: pickled calibrator, {stats.get('n_samples', 'N/A')} samples")
+                test_result = data.calibrate_simple(0.5)
             else:
                 # Old format - just isotonic regressor
-                iso = data
                 print(f"  ⚠ {tf:4s}: Old format (no stats)")
+                test_result = data.predict([0.5])[0]
             
             # Test prediction
-            test_result = iso.predict([0.5])[0]
             if 0 <= test_result <= 1:
                 valid += 1
             else:
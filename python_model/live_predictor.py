@@ -12,7 +12,6 @@ Features:
 
 import pandas as pd
 import numpy as np
-import pickle
 import json
 import os
 import sys
@@ -25,6 +24,7 @@ from data_manager import DataManager, get_data_manager
 from features import compute_indicators, get_feature_columns
 from regime import RegimeDetector
 from calibration import ModelCalibrator
+from model_io import get_model_path, load_model
 from rules_engine import TradeRulesEngine
 from forward_test import ForwardTester
 from risk_engine import RiskManager
@@ -109,11 +109,9 @@ class LivePredictor:
         
         for tf in self.TF_HIERARCHY:
             # Load model
-            model_path = self.base_dir / f'xgb_{tf}.pkl'
-            if model_path.exists():
+            if get_model_path(self.base_dir, tf) is not None:
                 try:
-                    with open(model_path, 'rb') as f:
-                        self.models[tf] = pickle.load(f)
+                    self.models[tf] = load_model(self.base_dir, tf)
                     print(f"  [OK] Model loaded: {tf}")
                 except Exception as e:
                     print(f"  [ERROR] Failed to load model {tf}: {e}")
@@ -0,0 +1,133 @@
+"""
+Model I/O Module
+Shared save/load logic for the per-timeframe XGBoost models.
+
+Models are saved in XGBoost's native UBJSON format (xgb_{tf}.ubj), which is
+written directly by the C++ core and is smaller and faster to load than a
+pickled Python wrapper. Legacy pickled models (xgb_{tf}.pkl) can still be
+loaded - whichever file is newer wins.
+
+Backtests can memoize batch predictions on disk via cached_predictions().
+"""
+import hashlib
+import os
+import pickle
+from pathlib import Path
+
+import numpy as np
+from xgboost import Booster, XGBClassifier
+
+from disk_cache import load_or_compute
+
+MODEL_SUFFIXES = ('.ubj', '.pkl')
+
+
+def get_model_path(base_dir, timeframe):
+    """Return the newest model file for a timeframe, or None if there is none"""
+    candidates = [
+        Path(base_dir) / f'xgb_{timeframe}{suffix}'
+        for suffix in MODEL_SUFFIXES
+    ]
+    candidates = [p for p in candidates if p.exists()]
+    if not candidates:
+        return None
+    return max(candidates, key=lambda p: p.stat().st_mtime)
+
+
+def load_model(base_dir, timeframe):
+    """
+    Load the XGBoost model for a timeframe.
+
+    Returns:
+        XGBClassifier, or None if no model file exists
+    """
+    path = get_model_path(base_dir, timeframe)
+    if path is None:
+        return None
+
+    if path.suffix == '.ubj':
+        model = XGBClassifier()
+        model.load_model(str(path))
+        return model
+
+    with open(path, 'rb') as f:
+        return pickle.load(f)
+
+
+def load_booster(base_dir, timeframe):
+    """
+    Load the raw XGBoost Booster for a timeframe, for inference only.
+    
+    Native models are read straight into a Booster, skipping the sklearn
+    wrapper; a legacy pickled model is unpickled and its booster returned
+    (see migrate_pickled_model() to convert it). Nothing is written.
+    
+    Returns:
+        Booster, or None if no model file exists
+    """
+    path = get_model_path(base_dir, timeframe)
+    if path is None:
+        return None
+    
+    if path.suffix == '.ubj':
+        return Booster(model_file=str(path))
+    
+    with open(path, 'rb') as f:
+        return pickle.load(f).get_booster()
+
+
+def migrate_pickled_model(base_dir, timeframe):
+    """
+    Re-save a timeframe's pickled model as native UBJSON, if the pickle is
+    the model in use (newer than any .ubj). Returns the new path, or None
+    if there was nothing to migrate.
+    """
+    path = get_model_path(base_dir, timeframe)
+    if path is None or path.suffix != '.pkl':
+        return None
+    with open(path, 'rb') as f:
+        model = pickle.load(f)
+    return save_model(model, base_dir, timeframe)
+
+
+def save_model(model, base_dir, timeframe):
+    """
+    Save an XGBoost model (XGBClassifier or Booster) in native UBJSON
+    format. Returns the file path.
+
+    The model is written to a temp file and atomically swapped in, so any
+    hardlinked backup of the previous model is left untouched.
+    """
+    path = Path(base_dir) / f'xgb_{timeframe}.ubj'
+    tmp_path = path.with_name(f'xgb_{timeframe}.tmp.ubj')  # XGBoost infers format from suffix
+    model.save_model(str(tmp_path))
+    os.replace(tmp_path, path)
+    return path
+
+
+def cached_predictions(X, predict, dependencies):
+    """
+    Return predict(X) - a dict of NumPy arrays - cached on disk as .npz.
+    
+    The cache key hashes the feature matrix together with the path, mtime
+    and size of every dependency file (model, calibrator), so new data or a
+    retrained model misses the cache; superseded entries are pruned (see
+    disk_cache).
+    """
+    key = hashlib.sha1(np.ascontiguousarray(X).tobytes())
+    for dep in dependencies:
+        st = os.stat(dep)
+        key.update(f'{dep}:{st.st_mtime_ns}:{st.st_size}'.encode())
+    
+    def read(path):
+        with np.load(path) as data:
+            return {name: data[name] for name in data.files}
+    
+    def write(result, path):
+        with open(path, 'wb') as f:
+            np.savez(f, **result)
+    
+    return load_or_compute(
+        'predictions_', key.hexdigest()[:12], '.npz',
+        lambda: predict(X), read, write
+    )
@@ -18,7 +18,6 @@ FIXES APPLIED:
 import pandas as pd
 import numpy as np
 import yfinance as yf
-import pickle
 import json
 import os
 import sys
@@ -30,6 +29,7 @@ from datetime import datetime
 from features import compute_indicators, get_feature_columns
 from regime import RegimeDetector
 from calibration import ModelCalibrator
+from model_io import get_model_path, load_model
 from rules_engine import TradeRulesEngine
 from forward_test import ForwardTester
 from risk_engine import RiskManager
@@ -76,14 +76,13 @@ def load_artifacts(timeframe):
     base_dir = os.path.dirname(__file__)
     
     # Model
-    m_path = os.path.join(base_dir, f'xgb_{timeframe}.pkl')
-    if not os.path.exists(m_path):
-        print(f"  [WARN] Model not found: {m_path}")
+    m_path = get_model_path(base_dir, timeframe)
+    if m_path is None:
+        print(f"  [WARN] Model not found: {os.path.join(base_dir, f'xgb_{timeframe}.ubj')}")
         return None, None
         
     try:
-        with open(m_path, 'rb') as f:
-            model = pickle.load(f)
+        model = load_model(base_dir, timeframe)
     except Exception as e:
         print(f"  [ERROR] Failed to load model {timeframe}: {e}")
         return None, None
@@ -29,7 +29,7 @@ else:
 # Check trained models
 models_found = []
 for tf in ['1d', '4h', '1h', '30m', '15m']:
-    if os.path.exists(f'xgb_{tf}.pkl'):
+    if os.path.exists(f'xgb_{tf}.ubj') or os.path.exists(f'xgb_{tf}.pkl'):
         models_found.append(tf)
 
 print(f"\n✓ Trained models found: {', '.join(models_found)}")
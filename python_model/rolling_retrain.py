@@ -12,7 +12,6 @@ Features:
 
 import pandas as pd
 import numpy as np
-import pickle
 import json
 import os
 import shutil
@@ -22,7 +21,8 @@ import warnings
 
 from data_manager import DataManager, get_data_manager
 from features import compute_indicators, get_feature_columns
-from calibration import ModelCalibrator
+from calibration import ModelCalibrator, CALIBRATOR_SUFFIXES
+from model_io import MODEL_SUFFIXES, save_model
 
 from sklearn.model_selection import TimeSeriesSplit, cross_val_predict
 from xgboost import XGBClassifier
@@ -70,17 +70,12 @@ class RollingRetrainer:
         files_backed_up = 0
         
         for tf in self.TIMEFRAMES:
-            # Backup model
-            model_path = self.base_dir / f'xgb_{tf}.pkl'
-            if model_path.exists():
-                shutil.copy(model_path, backup_path / f'xgb_{tf}.pkl')
-                files_backed_up += 1
-            
-            # Backup calibrator
-            calib_path = self.base_dir / f'calibrator_{tf}.pkl'
-            if calib_path.exists():
-                shutil.copy(calib_path, backup_path / f'calibrator_{tf}.pkl')
-                files_backed_up += 1
+            # Backup every model / calibrator file (native and legacy
+            # formats), keeping mtimes so the newest file still wins
+            for path in self._artifact_paths(self.base_dir, tf):
+                if path.exists():
+                    shutil.copy2(path, backup_path / path.name)
+                    files_backed_up += 1
         
         # Backup config
         config_path = self.base_dir / 'config.json'
@@ -91,6 +86,14 @@ class RollingRetrainer:
         
         return backup_path
     
+    @staticmethod
+    def _artifact_paths(directory, timeframe):
+        """Model and calibrator files of a timeframe, grouped by artifact"""
+        return [
+            *(directory / f'xgb_{timeframe}{suffix}' for suffix in MODEL_SUFFIXES),
+            *(directory / f'calibrator_{timeframe}{suffix}' for suffix in CALIBRATOR_SUFFIXES)
+        ]
+    
     def restore_backup(self, backup_path):
         """
         Restore models from a backup.
@@ -103,10 +106,25 @@ class RollingRetrainer:
         
         print(f"🔄 Restoring from {backup_path}...")
         
-        for file in backup_path.glob('*.pkl'):
-            dest = self.base_dir / file.name
-            shutil.copy(file, dest)
-            print(f"  ✓ Restored {file.name}")
+        for tf in self.TIMEFRAMES:
+            for prefix, suffixes in (('xgb', MODEL_SUFFIXES), ('calibrator', CALIBRATOR_SUFFIXES)):
+                backed_up = [backup_path / f'{prefix}_{tf}{s}' for s in suffixes]
+                if not any(p.exists() for p in backed_up):
+                    continue
+                # The artifact's files must match the backup exactly: a newer
+                # file in another format would otherwise still be loaded
+                for src in backed_up:
+                    dest = self.base_dir / src.name
+                    if src.exists():
+                        # Copy beside and swap, so hardlinked backups of the
+                        # current file are left untouched
+                        tmp = dest.with_name(dest.name + '.tmp')
+                        shutil.copy2(src, tmp)
+                        os.replace(tmp, dest)
+                        print(f"  ✓ Restored {src.name}")
+                    elif dest.exists():
+                        dest.unlink()
+                        print(f"  ✓ Removed {dest.name} (not in backup)")
         
         return True
     
@@ -209,10 +227,8 @@ class RollingRetrainer:
         """
         Save trained model and calibrator.
         """
-        # Save model
-        model_path = self.base_dir / f'xgb_{timeframe}.pkl'
-        with open(model_path, 'wb') as f:
-            pickle.dump(model, f)
+        # Save model (native format, atomic swap)
+        save_model(model, self.base_dir, timeframe)
         
         # Save calibrator
         calibrator.save(str(self.base_dir))
@@ -287,7 +303,7 @@ class RollingRetrainer:
         
         print("\n📁 Available Backups:")
         for b in backups:
-            files = list(b.glob('*.pkl'))
+            files = [p for p in b.iterdir() if p.suffix in {*MODEL_SUFFIXES, *CALIBRATOR_SUFFIXES}]
             print(f"  {b.name}: {len(files)} files")
         
         return backups
@@ -0,0 +1,126 @@
+"""Boosting-round selection and the deploy gate in auto_daily_trainer"""
+import logging
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from auto_daily_trainer import AutoTrainer, FEATURE_WARMUP_BARS, MIN_BOOST_ROUNDS
+from auto_daily_trainer import logger as trainer_logger
+from calibration import fit_all
+from features import compute_indicators
+
+# Tuned 1h parameters (best_params.json)
+PARAMS_1H = {
+    'subsample': 0.65, 'reg_lambda': 3.0, 'reg_alpha': 1.5, 'n_estimators': 80,
+    'min_child_weight': 7, 'max_depth': 2, 'learning_rate': 0.005,
+    'gamma': 1.0, 'colsample_bytree': 0.5
+}
+
+
+@pytest.fixture(autouse=True)
+def no_training_log(monkeypatch):
+    """Keep test runs out of the real daily_training.log"""
+    handlers = [h for h in trainer_logger.handlers if not isinstance(h, logging.FileHandler)]
+    monkeypatch.setattr(trainer_logger, 'handlers', handlers)
+
+
+@pytest.fixture(scope='module')
+def trainer():
+    trainer = AutoTrainer()
+    trainer.device = 'cpu'
+    trainer.n_jobs = 1
+    return trainer
+
+
+def test_small_learning_rate_keeps_enough_rounds(trainer):
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(3000, 12)).astype(np.float32)
+    y = (rng.random(3000) < 0.53).astype(np.int8)
+    
+    n = trainer.select_n_estimators(X, y, PARAMS_1H)
+    
+    assert MIN_BOOST_ROUNDS <= n <= PARAMS_1H['n_estimators']
+
+
+def test_constant_predictor_is_not_deployed(trainer):
+    constant = {'f1': 0.7, 'accuracy': 0.55, 'precision': 0.55, 'recall': 1.0, 'proba_std': 0.0}
+    varied = {**constant, 'proba_std': 0.02}
+    
+    assert not trainer.should_deploy_model(None, constant, '1h')
+    assert trainer.should_deploy_model(None, varied, '1h')
+
+
+def _ohlcv(n, seed=1):
+    rng = np.random.default_rng(seed)
+    close = 2000 + np.cumsum(rng.normal(0, 2, n))
+    spread = rng.uniform(0.5, 3, n)
+    return pd.DataFrame({
+        'Open': close + rng.normal(0, 0.5, n),
+        'High': close + spread,
+        'Low': close - spread,
+        'Close': close,
+        'Volume': rng.integers(100, 1000, n).astype(np.float64)
+    }, index=pd.date_range('2020-01-01', periods=n, freq='h'))
+
+
+def test_feature_cache_matches_full_recompute_after_warmup(trainer, tmp_path, monkeypatch):
+    monkeypatch.setattr(trainer, 'cache_dir', tmp_path)
+    bars = _ohlcv(2600)
+    
+    # Build the cache on an earlier window, then slide the window forward
+    trainer.compute_features(bars.iloc[:2000], 'test')
+    window = bars.iloc[300:2300]
+    cached = trainer.compute_features(window, 'test')
+    
+    full = compute_indicators(window)
+    columns = [c for c in trainer._feature_cache_columns() if c in full.columns]
+    overlap = window.index[FEATURE_WARMUP_BARS:]
+    np.testing.assert_allclose(
+        cached.loc[overlap, columns].to_numpy(), full.loc[overlap, columns].to_numpy(),
+        rtol=1e-6, atol=1e-6
+    )
+
+
+def test_feature_cache_discarded_when_history_is_revised(trainer, tmp_path, monkeypatch):
+    monkeypatch.setattr(trainer, 'cache_dir', tmp_path)
+    bars = _ohlcv(2600)
+    trainer.compute_features(bars.iloc[:2000], 'test')
+    
+    revised = bars.iloc[300:2300].copy()
+    revised.iloc[500, revised.columns.get_loc('Close')] += 10.0
+    cached = trainer.compute_features(revised, 'test')
+    
+    full = compute_indicators(revised)
+    columns = [c for c in trainer._feature_cache_columns() if c in full.columns]
+    pd.testing.assert_frame_equal(cached, full[columns])
+
+
+def test_calibration_can_be_deferred_to_fit_all(trainer, tmp_path, monkeypatch):
+    monkeypatch.setattr(trainer, 'cache_dir', tmp_path)
+    
+    results = trainer.train_and_evaluate('test', PARAMS_1H, _ohlcv(1500), fit_calibrator=False)
+    
+    assert not results['calibrator'].is_fitted
+    probs, labels = results.pop('calibration_data')
+    assert len(probs) == len(labels) > 0
+    assert fit_all([(results['calibrator'], probs, labels)]) == [True]
+    assert results['calibrator'].is_fitted
+
+
+def test_worker_trainer_reuses_parent_config_and_device(monkeypatch):
+    import auto_daily_trainer
+    
+    def no_probe():
+        raise AssertionError('CUDA probe repeated in worker')
+    
+    def no_read(self, path):
+        raise AssertionError('config re-read in worker')
+    
+    monkeypatch.setattr(auto_daily_trainer, '_has_cuda', no_probe)
+    monkeypatch.setattr(AutoTrainer, '_load_config', no_read)
+    
+    worker = AutoTrainer(config={'k': 1}, device='cpu')
+    
+    assert worker.config == {'k': 1}
+    assert worker.device == 'cpu'
@@ -0,0 +1,130 @@
+"""Per-TF trade simulation and settlement replay in backtest, against the candle loop"""
+import heapq
+
+import numpy as np
+import pandas as pd
+
+from backtest import replay_trades, simulate_tf
+from backtest_kernels import simulate_exit
+
+TFS = ('4h', '1h', '15m')
+N_STEPS = 300
+FIRST_STEP = 50
+INITIAL_CAPITAL = 100000
+
+
+def _market(seed):
+    """Random-walk OHLC arrays per TF, all N_STEPS bars long"""
+    rng = np.random.default_rng(seed)
+    tf_arrays = {}
+    for tf in TFS:
+        close = 2000 + rng.normal(scale=3, size=N_STEPS).cumsum()
+        spread = rng.uniform(0.5, 4, size=N_STEPS)
+        tf_arrays[tf] = {
+            'High': close + spread,
+            'Low': close - spread,
+            'Close': close,
+            'index': pd.date_range('2024-01-01', periods=N_STEPS, freq='15min').values,
+        }
+    return tf_arrays
+
+
+def _signals(seed, tf_arrays):
+    """Dense TRADE decisions, so most arrive while the TF's last trade is still open"""
+    rng = np.random.default_rng(seed)
+    signals = {tf: [] for tf in TFS}
+    for i in range(FIRST_STEP, N_STEPS):
+        for tf in TFS:
+            if rng.random() > 0.4:
+                continue
+            entry = tf_arrays[tf]['Close'][i]
+            up = bool(rng.random() < 0.5)
+            # Some stops are out of reach, so trades are still open at the end
+            width = rng.choice([2.0, 5.0, 200.0], p=[0.5, 0.48, 0.02])
+            rr = float(rng.choice([1.0, 1.5, 2.0]))
+            sign = 1 if up else -1
+            signals[tf].append((i, {
+                'entry_time': tf_arrays[tf]['index'][i],
+                'entry': entry,
+                'sl': entry - sign * width,
+                'tp': entry + sign * width * rr,
+                'lots': 1.0,
+                'risk': float(rng.uniform(100, 1000)),
+                'direction': 'UP' if up else 'DOWN',
+                'tf': tf,
+                'open_idx': i,
+                'rr_ratio': rr,
+            }))
+    return signals
+
+
+def _candle_loop(signals, tf_arrays):
+    """The original step-by-step loop: enter, then settle due trades, every step"""
+    by_step = {(tf, i): trade for tf in TFS for i, trade in signals[tf]}
+    tf_rank = {tf: rank for rank, tf in enumerate(TFS)}
+    capital = peak = INITIAL_CAPITAL
+    step_pnl = np.zeros(N_STEPS - FIRST_STEP)
+    step_dd = np.zeros_like(step_pnl)
+    pending, open_tfs, trade_log = [], set(), []
+
+    def book(trade, exit_time, exit_price, result):
+        nonlocal capital, peak
+        pnl = trade['risk'] * (trade['rr_ratio'] if result == 'win' else -1)
+        capital += pnl
+        peak = max(peak, capital)
+        dd = (peak - capital) / peak
+        trade_log.append({
+            'entry_time': trade['entry_time'], 'exit_time': exit_time,
+            'timeframe': trade['tf'], 'direction': trade['direction'], 'result': result,
+            'entry': trade['entry'], 'exit': exit_price, 'pnl': pnl,
+            'capital': capital, 'drawdown': dd,
+        })
+        return pnl, dd
+
+    for i in range(FIRST_STEP, N_STEPS):
+        for tf in TFS:
+            trade = by_step.get((tf, i))
+            if trade is None or tf in open_tfs:
+                continue
+            arrays = tf_arrays[tf]
+            j, exit_price, is_win = simulate_exit(
+                arrays['High'], arrays['Low'], i+1, N_STEPS,
+                trade['sl'], trade['tp'], trade['direction'] == 'UP', False
+            )
+            trade = dict(trade, exit_idx=j, exit_price=exit_price, is_win=is_win)
+            heapq.heappush(pending, (j - 1 if j >= 0 else float('inf'), tf_rank[tf], trade))
+            open_tfs.add(tf)
+        while pending and pending[0][0] <= i:
+            _, _, trade = heapq.heappop(pending)
+            open_tfs.discard(trade['tf'])
+            pnl, dd = book(trade, tf_arrays[trade['tf']]['index'][trade['exit_idx']],
+                           trade['exit_price'], 'win' if trade['is_win'] else 'loss')
+            step_pnl[i - FIRST_STEP] += pnl
+            step_dd[i - FIRST_STEP] = max(step_dd[i - FIRST_STEP], dd)
+
+    for _, _, trade in sorted(pending, key=lambda item: item[1]):
+        final_price = tf_arrays[trade['tf']]['Close'][-1]
+        up = trade['direction'] == 'UP'
+        win = final_price >= trade['entry'] if up else final_price <= trade['entry']
+        book(trade, tf_arrays[trade['tf']]['index'][-1], final_price, 'win' if win else 'loss')
+
+    return pd.DataFrame(trade_log), step_pnl, step_dd
+
+
+def test_replay_matches_candle_loop():
+    tf_arrays = _market(0)
+    expected_trades, expected_pnl, expected_dd = _candle_loop(_signals(1, tf_arrays), tf_arrays)
+
+    signals = _signals(1, tf_arrays)
+    per_tf = [
+        simulate_tf(rank, tf_arrays[tf]['High'], tf_arrays[tf]['Low'], signals[tf])
+        for rank, tf in enumerate(TFS)
+    ]
+    trade_df, step_pnl, step_dd = replay_trades(per_tf, tf_arrays, FIRST_STEP, N_STEPS, INITIAL_CAPITAL)
+
+    # Overlapping signals were skipped and some trades ran to the end
+    assert len(trade_df) < sum(len(s) for s in signals.values())
+    assert (trade_df['exit_time'] == tf_arrays['15m']['index'][-1]).any()
+    pd.testing.assert_frame_equal(trade_df, expected_trades, check_dtype=False)
+    np.testing.assert_allclose(step_pnl, expected_pnl)
+    np.testing.assert_allclose(step_dd, expected_dd)
@@ -0,0 +1,56 @@
+"""Parallel calibrator fitting in calibration.fit_all"""
+import numpy as np
+
+from calibration import ModelCalibrator, fit_all
+
+
+def _oos(seed, n=400):
+    rng = np.random.default_rng(seed)
+    probs = rng.uniform(0.2, 0.8, n)
+    labels = (rng.random(n) < probs).astype(np.int8)
+    return probs, labels
+
+
+def test_fit_all_matches_sequential_fits():
+    timeframes = ['1d', '4h', '1h']
+    data = [_oos(seed) for seed in range(len(timeframes))]
+    parallel = [ModelCalibrator(tf) for tf in timeframes]
+    
+    assert fit_all((cal, probs, labels) for cal, (probs, labels) in zip(parallel, data)) == [True] * 3
+    
+    grid = np.linspace(0, 1, 101)
+    for tf, cal, (probs, labels) in zip(timeframes, parallel, data):
+        sequential = ModelCalibrator(tf)
+        sequential.fit(probs, labels)
+        np.testing.assert_array_equal(cal.calibrate_batch(grid)[0], sequential.calibrate_batch(grid)[0])
+
+
+def test_pickle_without_cached_knots_still_calibrates_scalars():
+    import pickle
+    
+    probs, labels = _oos(0)
+    calibrator = ModelCalibrator('1d')
+    calibrator.isotonic.fit(probs, labels)  # fitted, knots never cached
+    calibrator.is_fitted = True
+    
+    restored = pickle.loads(pickle.dumps(calibrator))
+    
+    expected = float(calibrator.isotonic.predict([0.55])[0])
+    assert restored.calibrate_simple(0.55) == expected
+    calibrator._simple_cache = {}
+    assert calibrator.calibrate_simple(0.55) == expected  # predict() fallback
+
+
+def test_fit_all_contains_failures_to_their_own_job():
+    good = [ModelCalibrator('1d'), ModelCalibrator('1h')]
+    bad = ModelCalibrator('4h')
+    probs, labels = _oos(0)
+    
+    results = fit_all(
+        [(good[0], probs, labels), (bad, probs, labels[:-1]), (good[1], probs, labels)],
+        return_exceptions=True
+    )
+    
+    assert results[0] is True and results[2] is True
+    assert isinstance(results[1], Exception)
+    assert all(cal.is_fitted for cal in good) and not bad.is_fitted
@@ -0,0 +1,29 @@
+"""Timestamp parsing in check_news_age.news_ages_minutes"""
+from datetime import datetime
+
+import numpy as np
+
+from check_news_age import news_ages_minutes
+
+NOW = datetime(2026, 1, 5, 12, 0, 0)
+
+
+def test_mixed_iso_forms_all_parse():
+    published = [
+        '2026-01-05T11:00:00',            # isoformat() with zero microseconds
+        '2026-01-05T10:30:00.250000',     # isoformat() with microseconds
+        '2026-01-05T09:00:00Z',           # NewsAPI
+        '2026-01-05T08:00:00+00:00',
+    ]
+    ages, parsed = news_ages_minutes(published, NOW)
+    
+    assert parsed.tolist() == [True, True, True, True]
+    np.testing.assert_allclose(ages, [60.0, 90.0 - 0.25 / 60, 180.0, 240.0])
+
+
+def test_unparseable_and_empty_are_masked():
+    ages, parsed = news_ages_minutes(['2026-01-05T11:00:00Z', '', 'not a date'], NOW)
+    
+    assert parsed.tolist() == [True, False, False]
+    assert ages[0] == 60.0
+    assert np.isnan(ages[1:]).all()
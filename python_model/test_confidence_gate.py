@@ -0,0 +1,23 @@
+"""Config handling in confidence_gate"""
+from confidence_gate import ConfidenceGate, load_config
+
+
+def test_load_config_returns_independent_copies():
+    config = load_config()
+    config.setdefault('confidence_gates', {})['d1_min_confidence'] = 0.99
+    
+    assert load_config().get('confidence_gates', {}).get('d1_min_confidence') != 0.99
+
+
+def test_reload_thresholds_from_config():
+    gate = ConfidenceGate()
+    config = load_config()
+    config['confidence_gates'] = {'d1_min_confidence': 0.7}
+    gate.reload_thresholds(config)
+    
+    assert gate.check_d1_gate({'bias': 'BULLISH', 'confidence': 0.65}).passed is False
+    assert gate.check_d1_gate({'bias': 'BULLISH', 'confidence': 0.75}).passed is True
+    
+    # No config: back to config.json
+    gate.reload_thresholds()
+    assert gate.gate_config == load_config().get('confidence_gates', gate.gate_config)
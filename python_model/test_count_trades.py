@@ -0,0 +1,31 @@
+"""Runs count_trades.py on a small forward-test log"""
+import subprocess
+import sys
+from pathlib import Path
+
+SCRIPT = Path(__file__).parent / 'count_trades.py'
+
+LOG = """timestamp,timeframe,decision
+2026-01-05 10:00:00,1h,TRADE
+2026-01-05 11:00:00,4h,TRADE
+2026-01-06 10:00:00,1h,TRADE
+2026-01-06 11:00:00,1h,NO_TRADE
+2026-01-06 12:00:00,1d,NO_TRADE
+2026-01-06 13:00:00,1h,
+"""
+
+
+def test_counts_trade_and_no_trade_rows(tmp_path):
+    (tmp_path / 'forward_test_log.csv').write_text(LOG)
+    out = subprocess.run(
+        [sys.executable, str(SCRIPT)], cwd=tmp_path,
+        capture_output=True, text=True, check=True
+    ).stdout
+    
+    assert 'Total Signals: 6' in out
+    assert 'TRADE Signals: 3 (50.0%)' in out
+    assert 'NO_TRADE Signals: 2 (33.3%)' in out
+    assert '2026-01-05: 2 trades' in out
+    assert '2026-01-06: 1 trades' in out
+    assert '1h: 2 trades' in out
+    assert 'NO_TRADE: 2' in out
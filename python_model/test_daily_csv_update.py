@@ -0,0 +1,53 @@
+"""Incremental legacy CSV writes in daily_csv_update.sync_legacy_csv"""
+import numpy as np
+import pandas as pd
+
+from daily_csv_update import sync_legacy_csv
+
+
+def _bars(start, n):
+    index = pd.date_range(start, periods=n, freq='D', name='Date')
+    close = np.arange(n, dtype=np.float64) + 100.0
+    return pd.DataFrame({'Close': close, 'Volume': close * 10}, index=index)
+
+
+def _read(path):
+    return pd.read_csv(path, index_col=0, parse_dates=True)
+
+
+def test_missing_file_is_written_in_full(tmp_path):
+    path = tmp_path / 'gold_data.csv'
+    df = _bars('2026-01-01', 5)
+    
+    assert sync_legacy_csv(df, path) == 5
+    pd.testing.assert_frame_equal(_read(path), df, check_freq=False)
+
+
+def test_last_row_is_refreshed_and_new_rows_appended(tmp_path):
+    path = tmp_path / 'gold_data.csv'
+    df = _bars('2026-01-01', 5)
+    df.iloc[:3].to_csv(path)
+    df.iloc[2, 0] = 999.0  # the stored last bar was still forming
+    
+    assert sync_legacy_csv(df, path) == 2
+    pd.testing.assert_frame_equal(_read(path), df, check_freq=False)
+
+
+def test_stored_last_row_missing_from_df_is_kept(tmp_path):
+    path = tmp_path / 'gold_data.csv'
+    stored = _bars('2026-01-01', 3)
+    stored.to_csv(path)
+    fetched = _bars('2026-01-05', 2)  # gap: 2026-01-03 and -04 are absent
+    
+    assert sync_legacy_csv(fetched, path) == 2
+    pd.testing.assert_frame_equal(_read(path), pd.concat([stored, fetched]), check_freq=False)
+
+
+def test_file_ahead_of_df_is_left_alone(tmp_path):
+    path = tmp_path / 'gold_data.csv'
+    stored = _bars('2026-01-01', 5)
+    stored.to_csv(path)
+    before = path.read_bytes()
+    
+    assert sync_legacy_csv(_bars('2026-01-01', 3).iloc[:2], path) == 0
+    assert path.read_bytes() == before
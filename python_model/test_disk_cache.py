@@ -0,0 +1,52 @@
+"""Memoization, pruning and failure handling in disk_cache"""
+import logging
+import os
+
+import pytest
+
+import disk_cache
+from disk_cache import load_or_compute
+
+
+def _read(path):
+    return path.read_text()
+
+
+def _write(value, path):
+    path.write_text(value)
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(disk_cache, 'CACHE_DIR', tmp_path)
+    return tmp_path
+
+
+def test_hit_skips_compute(cache_dir):
+    assert load_or_compute('t_', 'a', '.txt', lambda: 'x', _read, _write) == 'x'
+    assert load_or_compute('t_', 'a', '.txt', lambda: pytest.fail('recomputed'), _read, _write) == 'x'
+    assert [p.name for p in cache_dir.iterdir()] == ['t_a.txt']
+
+
+def test_prunes_least_recently_used(cache_dir):
+    for i, key in enumerate('abc'):
+        load_or_compute('t_', key, '.txt', lambda: key, _read, _write, keep=2)
+        os.utime(cache_dir / f't_{key}.txt', (i, i))
+    (cache_dir / 'other_z.txt').write_text('z')
+    
+    load_or_compute('t_', 'a', '.txt', lambda: 'a', _read, _write, keep=2)  # Hit refreshes 'a'
+    load_or_compute('t_', 'd', '.txt', lambda: 'd', _read, _write, keep=2)
+    
+    assert sorted(p.name for p in cache_dir.iterdir()) == ['other_z.txt', 't_a.txt', 't_d.txt']
+
+
+def test_unreadable_entry_is_recomputed(cache_dir, caplog):
+    (cache_dir / 't_a.txt').write_text('bad')
+    
+    def read(path):
+        raise ValueError('corrupt')
+    
+    with caplog.at_level(logging.WARNING, logger='disk_cache'):
+        assert load_or_compute('t_', 'a', '.txt', lambda: 'x', read, _write) == 'x'
+    assert 'unreadable' in caplog.text
+    assert (cache_dir / 't_a.txt').read_text() == 'x'
@@ -0,0 +1,36 @@
+"""Model loading and legacy pickle migration in model_io"""
+import pickle
+
+import numpy as np
+from xgboost import XGBClassifier
+
+from model_io import load_booster, migrate_pickled_model
+
+
+def _pickled_model(directory):
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(200, 3)).astype(np.float32)
+    model = XGBClassifier(n_estimators=5, max_depth=2).fit(X, (X[:, 0] > 0).astype(int))
+    with open(directory / 'xgb_1d.pkl', 'wb') as f:
+        pickle.dump(model, f)
+    return model, X
+
+
+def test_load_booster_does_not_write(tmp_path):
+    model, X = _pickled_model(tmp_path)
+    
+    booster = load_booster(tmp_path, '1d')
+    
+    assert sorted(p.name for p in tmp_path.iterdir()) == ['xgb_1d.pkl']
+    np.testing.assert_allclose(booster.inplace_predict(X), model.predict_proba(X)[:, 1], rtol=1e-6)
+
+
+def test_migrate_pickled_model(tmp_path):
+    model, X = _pickled_model(tmp_path)
+    
+    path = migrate_pickled_model(tmp_path, '1d')
+    
+    assert path.name == 'xgb_1d.ubj'
+    assert migrate_pickled_model(tmp_path, '1d') is None  # .ubj is now the newest
+    np.testing.assert_allclose(load_booster(tmp_path, '1d').inplace_predict(X),
+                               model.predict_proba(X)[:, 1], rtol=1e-6)
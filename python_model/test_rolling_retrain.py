@@ -0,0 +1,49 @@
+"""Backup / restore of model and calibrator files in rolling_retrain"""
+import os
+
+import pytest
+
+from model_io import get_model_path
+from rolling_retrain import RollingRetrainer
+
+
+@pytest.fixture
+def retrainer(tmp_path):
+    retrainer = RollingRetrainer(config={})
+    retrainer.base_dir = tmp_path / 'live'
+    retrainer.backup_dir = tmp_path / 'backups'
+    retrainer.base_dir.mkdir()
+    retrainer.backup_dir.mkdir()
+    return retrainer
+
+
+def _write(path, content, mtime):
+    path.write_text(content)
+    os.utime(path, (mtime, mtime))
+
+
+def test_backup_keeps_the_live_native_model(retrainer):
+    live = retrainer.base_dir
+    _write(live / 'xgb_1d.pkl', 'old pickle', 1_000)
+    _write(live / 'xgb_1d.ubj', 'live ubj', 2_000)
+    backup = retrainer.create_backup()
+    
+    _write(live / 'xgb_1d.ubj', 'bad retrain', 3_000)
+    retrainer.restore_backup(backup)
+    
+    assert get_model_path(live, '1d').name == 'xgb_1d.ubj'
+    assert (live / 'xgb_1d.ubj').read_text() == 'live ubj'
+
+
+def test_restore_drops_files_missing_from_backup(retrainer):
+    live = retrainer.base_dir
+    _write(live / 'xgb_1d.pkl', 'backed-up pickle', 1_000)
+    _write(live / 'calibrator_1d.pkl', 'backed-up calibrator', 1_000)
+    backup = retrainer.create_backup()
+    
+    _write(live / 'xgb_1d.ubj', 'bad retrain', 2_000)
+    _write(live / 'calibrator_1d.npz', 'bad calibrator', 2_000)
+    retrainer.restore_backup(backup)
+    
+    assert sorted(p.name for p in live.iterdir()) == ['calibrator_1d.pkl', 'xgb_1d.pkl']
+    assert get_model_path(live, '1d').read_text() == 'backed-up pickle'
@@ -24,6 +24,7 @@ import warnings
 from datetime import datetime
 from features import compute_indicators, get_feature_columns
 from calibration import ModelCalibrator
+from model_io import save_model
 
 warnings.filterwarnings('ignore')
 
@@ -200,7 +201,7 @@ def train_and_calibrate(X_train, y_train, X_test, y_test, best_params, timeframe
     brier_raw = brier_score_loss(y_test, y_prob_test)
     
     # Calibrated probabilities on test set
-    calib_probs_test = np.array([calibrator.calibrate_simple(p) for p in y_prob_test])
+    calib_probs_test, _ = calibrator.calibrate_batch(y_prob_test)
     brier_calib = brier_score_loss(y_test, calib_probs_test)
     
     # Confusion matrix for signal quality
@@ -237,10 +238,8 @@ def save_artifacts(model, calibrator, timeframe, metrics):
     """Save model, calibrator, and training metadata"""
     base_dir = os.path.dirname(__file__)
     
-    # Save Model
-    m_path = os.path.join(base_dir, f'xgb_{timeframe}.pkl')
-    with open(m_path, 'wb') as f:
-        pickle.dump(model, f)
+    # Save Model (native format, atomic swap)
+    save_model(model, base_dir, timeframe)
     
     # Save Calibrator
     calibrator.save(base_dir)
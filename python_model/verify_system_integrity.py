@@ -52,13 +52,16 @@ def verify_system_integrity():
     # 2. Check models
     print("\n2. ML Models")
     print("-" * 70)
+    from model_io import get_model_path
+    
     timeframes = ['15m', '30m', '1h', '4h', '1d']
     models_ok = 0
     for tf in timeframes:
-        model_path = base_dir / f"xgb_{tf}.pkl"
-        if model_path.exists():
+        # Same lookup as the predictors: newest of .ubj / legacy .pkl
+        model_path = get_model_path(base_dir, tf)
+        if model_path is not None:
             size = model_path.stat().st_size / (1024 * 1024)  # MB
-            print(f"   [OK] {tf:4s} model: {size:.2f} MB")
+            print(f"   [OK] {tf:4s} model: {size:.2f} MB ({model_path.name})")
             models_ok += 1
         else:
             issues.append(f"Model missing: {tf}")
@@ -72,11 +75,14 @@ def verify_system_integrity():
     # 3. Check calibrators
     print("\n3. Calibrators")
     print("-" * 70)
+    from calibration import get_calibrator_path
+    
     calibrators_ok = 0
     for tf in timeframes:
-        cal_path = base_dir / f"calibrator_{tf}.pkl"
-        if cal_path.exists():
-            print(f"   ✓ {tf:4s} calibrator: Present")
+        # Same lookup as ModelCalibrator.load(): newest of .npz / legacy .pkl
+        cal_path = get_calibrator_path(base_dir, tf)
+        if cal_path is not None:
+            print(f"   ✓ {tf:4s} calibrator: Present ({Path(cal_path).name})")
             calibrators_ok += 1
         else:
             warnings.append(f"Calibrator missing: {tf} (will use uncalibrated)")